@@ -7,6 +7,13 @@ import os
 # `from app.main import app` resolve correctly on Vercel.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
 
+# Serverless invocations cannot keep connections warm between requests.
+os.environ.setdefault("DB_POOL_MODE", "null")
+# Nor run the background job that keeps insights rollups fresh.
+os.environ.setdefault("INSIGHTS_ROLLUPS_ENABLED", "false")
+# Nor flush buffered session activity, so it is written on token refresh only.
+os.environ.setdefault("SESSION_ACTIVITY_WRITE_BEHIND", "false")
+
 from app.main import app  # noqa: E402, F401
 
 # Vercel's @vercel/python runtime will automatically detect the `app`
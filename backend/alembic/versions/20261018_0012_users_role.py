@@ -0,0 +1,38 @@
+"""persist users.role, backfilled from the email convention
+
+Revision ID: 20261018_0012
+Revises: 20261018_0011
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0012"
+down_revision: Union[str, None] = "20261018_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("role", sa.String(length=20), nullable=False, server_default="faculty"))
+    # Same precedence as app.core.permissions.role_from_email.
+    op.execute(
+        """
+        UPDATE users SET role = CASE
+            WHEN lower(email) LIKE '%admin%' THEN 'admin'
+            WHEN lower(email) LIKE '%dean%' THEN 'dean'
+            WHEN lower(email) LIKE '%hod%' THEN 'hod'
+            WHEN lower(email) LIKE '%coord%' THEN 'coordinator'
+            ELSE 'faculty'
+        END
+        """
+    )
+    op.create_index("ix_users_role", "users", ["role"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_role", table_name="users")
+    op.drop_column("users", "role")
@@ -0,0 +1,23 @@
+"""index sessions.started_at for attendance trend range scans
+
+Revision ID: 20261018_0013
+Revises: 20261018_0012
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_0013"
+down_revision: Union[str, None] = "20261018_0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_sessions_started_at", "sessions", ["started_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_started_at", table_name="sessions")
@@ -0,0 +1,42 @@
+"""insights rollup tables: daily sessions per department and summary snapshot
+
+Revision ID: 20261018_0014
+Revises: 20261018_0013
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0014"
+down_revision: Union[str, None] = "20261018_0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_session_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("department", sa.String(length=100), server_default="", nullable=False),
+        sa.Column("sessions_started", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("active_users", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("day", "department"),
+    )
+    op.create_table(
+        "insights_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("total_users", sa.Integer(), nullable=False),
+        sa.Column("active_users", sa.Integer(), nullable=False),
+        sa.Column("locked_users", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("insights_snapshots")
+    op.drop_table("daily_session_rollups")
@@ -0,0 +1,34 @@
+"""attendance_records: per-student, per-term lecture presence bitmaps
+
+Revision ID: 20261018_0015
+Revises: 20261018_0014
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_0015"
+down_revision: Union[str, None] = "20261018_0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attendance_records",
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("term", sa.String(length=20), nullable=False),
+        sa.Column("presence", postgresql.BIT(varying=True), nullable=False),
+        sa.Column("lectures", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["student_id"], ["students.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("student_id", "term"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("attendance_records")
@@ -0,0 +1,23 @@
+"""index attendance_records.term for per-term scans
+
+Revision ID: 20261018_0016
+Revises: 20261018_0015
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_0016"
+down_revision: Union[str, None] = "20261018_0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_attendance_records_term", "attendance_records", ["term"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attendance_records_term", table_name="attendance_records")
@@ -0,0 +1,23 @@
+"""index students (created_at, id) for keyset pagination
+
+Revision ID: 20261018_0017
+Revises: 20261018_0016
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_0017"
+down_revision: Union[str, None] = "20261018_0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_students_created_at_id", "students", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_students_created_at_id", table_name="students")
@@ -0,0 +1,46 @@
+"""trigram indexes for ILIKE search on students, projects and events
+
+Revision ID: 20261018_0018
+Revises: 20261018_0017
+Create Date: 2026-10-18
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0018"
+down_revision: Union[str, None] = "20261018_0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+TRIGRAM_INDEXES = (
+    ("ix_students_name_trgm", "students", "name"),
+    ("ix_students_roll_no_trgm", "students", "roll_no"),
+    ("ix_projects_title_trgm", "projects", "title"),
+    ("ix_projects_description_trgm", "projects", "description"),
+    ("ix_events_event_name_trgm", "events", "event_name"),
+    ("ix_events_room_number_trgm", "events", "room_number"),
+)
+
+
+def upgrade() -> None:
+    # pg_trgm ships with the contrib package of every mainstream PostgreSQL build and
+    # managed service; without it search still works, it just scans.
+    available = op.get_bind().scalar(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+    if not available:
+        logger.warning("pg_trgm is not available on this server; skipping search indexes")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(name, table, [column], postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def downgrade() -> None:
+    for name, table, _column in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,32 @@
+"""session_revocations: revocations that outlive deleted sessions
+
+Revision ID: 20261018_0019
+Revises: 20261018_0018
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_0019"
+down_revision: Union[str, None] = "20261018_0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "session_revocations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_session_revocations_revoked_at", "session_revocations", ["revoked_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_revocations_revoked_at", table_name="session_revocations")
+    op.drop_table("session_revocations")
@@ -3,7 +3,7 @@ from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from app.core.enums import AppEnvironment
+from app.core.enums import AppEnvironment, DatabasePoolMode
 
 
 def _split_origins(value: str) -> list[str]:
@@ -19,15 +19,67 @@ class Settings(BaseSettings):
     api_v1_prefix: str = Field(default="/api/v1", alias="API_V1_PREFIX")
 
     database_url: str = Field(..., alias="DATABASE_URL")
+    # "queue" for long-running workers, "pgbouncer" behind a transaction-mode pooler,
+    # "null" for serverless runtimes where connections cannot outlive the invocation.
+    db_pool_mode: DatabasePoolMode = Field(default=DatabasePoolMode.QUEUE, alias="DB_POOL_MODE")
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(default=10.0, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_pool_use_lifo: bool = Field(default=True, alias="DB_POOL_USE_LIFO")
 
     jwt_access_secret: str = Field(..., alias="JWT_ACCESS_SECRET")
     jwt_refresh_secret: str = Field(..., alias="JWT_REFRESH_SECRET")
     password_pepper: str = Field(..., alias="PASSWORD_PEPPER")
+    # Argon2id cost; calibrate for the host with scripts/calibrate_password_hasher.py.
+    argon2_time_cost: int = Field(default=3, alias="ARGON2_TIME_COST")
+    argon2_memory_cost_kib: int = Field(default=65536, alias="ARGON2_MEMORY_COST_KIB")
+    argon2_parallelism: int = Field(default=4, alias="ARGON2_PARALLELISM")
+    password_hash_workers: int = Field(default=2, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(default=32, alias="PASSWORD_HASH_MAX_QUEUE")
     access_token_ttl_minutes: int = Field(default=15, alias="ACCESS_TOKEN_TTL_MINUTES")
     refresh_token_ttl_days: int = Field(default=7, alias="REFRESH_TOKEN_TTL_DAYS")
     jwt_issuer: str = Field(default="attendance-backend", alias="JWT_ISSUER")
     auth_lock_minutes: int = Field(default=15, alias="AUTH_LOCK_MINUTES")
     auth_max_failed_attempts: int = Field(default=5, alias="AUTH_MAX_FAILED_ATTEMPTS")
+    # Per-process cache of resolved auth contexts; a TTL of 0 disables it.
+    auth_cache_ttl_seconds: float = Field(default=30.0, alias="AUTH_CACHE_TTL_SECONDS")
+    auth_cache_max_entries: int = Field(default=10_000, alias="AUTH_CACHE_MAX_ENTRIES")
+    # Stateless mode trusts the signed access-token claims and only checks an in-memory
+    # revocation denylist, re-synced from sessions.revoked_at every few seconds.
+    auth_stateless: bool = Field(default=False, alias="AUTH_STATELESS")
+    auth_denylist_sync_seconds: float = Field(default=10.0, alias="AUTH_DENYLIST_SYNC_SECONDS")
+    # Session last-seen/ip/user-agent writes are buffered and flushed in one UPDATE
+    # every interval, or as soon as this many sessions are pending. With write-behind
+    # off (serverless, where no flusher runs) activity is written on refresh only.
+    session_activity_write_behind: bool = Field(default=True, alias="SESSION_ACTIVITY_WRITE_BEHIND")
+    session_activity_flush_seconds: float = Field(default=5.0, alias="SESSION_ACTIVITY_FLUSH_SECONDS")
+    session_activity_max_pending: int = Field(default=1000, alias="SESSION_ACTIVITY_MAX_PENDING")
+
+    # Expiry sweeper: deletes dead auth rows in small batches (scripts/sweep_expired.py runs it once).
+    sweeper_enabled: bool = Field(default=False, alias="SWEEPER_ENABLED")
+    sweeper_interval_seconds: int = Field(default=3600, alias="SWEEPER_INTERVAL_SECONDS")
+    sweeper_batch_size: int = Field(default=1000, alias="SWEEPER_BATCH_SIZE")
+    sweeper_batch_pause_seconds: float = Field(default=0.05, alias="SWEEPER_BATCH_PAUSE_SECONDS")
+    # Revoked tokens are kept this long so reuse of a rotated token is still detected.
+    refresh_token_retention_days: int = Field(default=7, alias="REFRESH_TOKEN_RETENTION_DAYS")
+    # Sessions double as login history for the insights endpoints, hence the long default.
+    session_retention_days: int = Field(default=365, alias="SESSION_RETENTION_DAYS")
+    password_reset_retention_days: int = Field(default=1, alias="PASSWORD_RESET_RETENTION_DAYS")
+
+    # Insights rollups: per-day/department session counts and a summary snapshot,
+    # refreshed off the request path; when disabled the endpoints query live tables.
+    insights_rollups_enabled: bool = Field(default=True, alias="INSIGHTS_ROLLUPS_ENABLED")
+    insights_rollup_interval_seconds: float = Field(default=60.0, alias="INSIGHTS_ROLLUP_INTERVAL_SECONDS")
+    # Per-process response cache for the insights endpoints. Entries past their TTL are
+    # still served for INSIGHTS_CACHE_STALE_SECONDS while a background refresh runs.
+    insights_cache_enabled: bool = Field(default=True, alias="INSIGHTS_CACHE_ENABLED")
+    insights_cache_stale_seconds: float = Field(default=300.0, alias="INSIGHTS_CACHE_STALE_SECONDS")
+    insights_cache_max_entries: int = Field(default=512, alias="INSIGHTS_CACHE_MAX_ENTRIES")
+    insights_cache_max_entry_bytes: int = Field(default=256 * 1024, alias="INSIGHTS_CACHE_MAX_ENTRY_BYTES")
+    # Students below this percentage in their latest term count as low attendance.
+    attendance_low_threshold_percent: float = Field(default=75.0, alias="ATTENDANCE_LOW_THRESHOLD_PERCENT")
 
     cookie_secure: bool = Field(default=False, alias="COOKIE_SECURE")
     cookie_samesite: str = Field(default="lax", alias="COOKIE_SAMESITE")
@@ -6,3 +6,41 @@ class AppEnvironment(str, Enum):
     STAGING = "staging"
     PRODUCTION = "production"
     TEST = "test"
+
+
+class DatabasePoolMode(str, Enum):
+    QUEUE = "queue"
+    PGBOUNCER = "pgbouncer"
+    NULL = "null"
+
+
+class UserRole(str, Enum):
+    ADMIN = "admin"
+    DEAN = "dean"
+    HOD = "hod"
+    COORDINATOR = "coordinator"
+    FACULTY = "faculty"
+
+
+class TrendGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class DashboardWidget(str, Enum):
+    SUMMARY = "summary"
+    TOP_PERFORMERS = "topPerformers"
+    WEEKLY_TREND = "weeklyTrend"
+    DISTRIBUTION = "distribution"
+
+
+class PaginationTotal(str, Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    XLSX = "xlsx"
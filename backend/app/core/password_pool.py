@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import get_settings
+from app.core.security import hash_password, verify_password
+from app.utils.exceptions import AppException
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """Bounded executor for Argon2 work.
+
+    Hashing is deliberately CPU- and memory-heavy; running it on Starlette's
+    shared threadpool lets a login spike starve every other sync task. This
+    pool has its own workers (argon2-cffi releases the GIL while hashing) and
+    admits at most ``workers + max_queue`` outstanding jobs, rejecting the rest
+    immediately with a 503 instead of letting them queue unboundedly.
+    """
+
+    def __init__(self, *, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.max_run_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._outstanding >= self.capacity:
+                self.rejected += 1
+                raise AppException("Authentication is busy, please retry shortly", status_code=503)
+            self._outstanding += 1
+            self.submitted += 1
+
+        enqueued_at = time.perf_counter()
+
+        def _timed() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self.total_wait_seconds += started - enqueued_at
+            try:
+                return func(*args)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self.completed += 1
+                    self.total_run_seconds += elapsed
+                    self.max_run_seconds = max(self.max_run_seconds, elapsed)
+
+        try:
+            future = self._executor.submit(_timed)
+        except BaseException:
+            self._release()
+            raise
+        # Free the slot when the job is done, not when the caller stops waiting: a
+        # cancelled request (client gone mid-login) leaves its hash running on a worker.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._outstanding -= 1
+
+    async def hash_password(self, raw_password: str) -> str:
+        return await self.run(hash_password, raw_password)
+
+    async def verify_password(self, raw_password: str, password_hash: str) -> bool:
+        return await self.run(verify_password, raw_password, password_hash)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            completed = self.completed or 1
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._outstanding - self._running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds / completed * 1000, 3),
+                "avg_hash_ms": round(self.total_run_seconds / completed * 1000, 3),
+                "max_hash_ms": round(self.max_run_seconds * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
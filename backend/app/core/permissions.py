@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from enum import IntFlag
+from typing import Union
+
+from app.core.enums import UserRole
+
+
+class Permission(IntFlag):
+    """Permission bits carried on the auth context and in the ``perm`` token claim."""
+
+    ADMIN = 1 << 0
+    DEAN = 1 << 1
+    HOD = 1 << 2
+    COORDINATOR = 1 << 3
+    FACULTY = 1 << 4
+
+
+ROLE_PERMISSIONS: dict[str, int] = {
+    UserRole.ADMIN.value: int(Permission.ADMIN),
+    UserRole.DEAN.value: int(Permission.DEAN),
+    UserRole.HOD.value: int(Permission.HOD),
+    UserRole.COORDINATOR.value: int(Permission.COORDINATOR),
+    UserRole.FACULTY.value: int(Permission.FACULTY),
+}
+
+
+def permissions_for_role(role: Union[UserRole, str]) -> int:
+    return ROLE_PERMISSIONS.get(role.value if isinstance(role, UserRole) else role, 0)
+
+
+def permission_mask(roles: Iterable[Union[UserRole, str]]) -> int:
+    mask = 0
+    for role in roles:
+        mask |= permissions_for_role(role)
+    return mask
+
+
+def role_from_email(email: str) -> UserRole:
+    """Initial role for a new account, matching the email convention the frontend uses.
+
+    Only consulted when a user is created; afterwards ``users.role`` is authoritative.
+    """
+    email = email.lower()
+    if "admin" in email:
+        return UserRole.ADMIN
+    if "dean" in email:
+        return UserRole.DEAN
+    if "hod" in email:
+        return UserRole.HOD
+    if "coord" in email:
+        return UserRole.COORDINATOR
+    return UserRole.FACULTY
@@ -2,7 +2,7 @@ import hashlib
 import hmac
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Optional
 
 from argon2 import PasswordHasher
 from argon2.exceptions import Argon2Error, VerifyMismatchError
@@ -11,7 +11,11 @@ from jose import JWTError, jwt
 from app.core.config import get_settings
 
 settings = get_settings()
-password_hasher = PasswordHasher()
+password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost_kib,
+    parallelism=settings.argon2_parallelism,
+)
 
 
 def now_utc() -> datetime:
@@ -33,10 +37,16 @@ def verify_password(raw_password: str, password_hash: str) -> bool:
         return False
 
 
-def create_access_token(*, user_id: str, session_id: str) -> str:
+def password_needs_rehash(password_hash: str) -> bool:
+    """True when ``password_hash`` was produced with different Argon2 parameters."""
+    return password_hasher.check_needs_rehash(password_hash)
+
+
+def create_access_token(*, user_id: str, session_id: str, claims: Optional[dict[str, Any]] = None) -> str:
     issued_at = now_utc()
     expires_at = issued_at + timedelta(minutes=settings.access_token_ttl_minutes)
     payload = {
+        **(claims or {}),
         "sub": user_id,
         "sid": session_id,
         "iat": int(issued_at.timestamp()),
@@ -0,0 +1,73 @@
+import csv
+import io
+from collections.abc import Callable, Generator, Iterator
+from contextlib import closing
+from typing import BinaryIO, TypeVar
+
+T = TypeVar("T")
+
+
+def csv_rows(stream: BinaryIO, encoding: str) -> Generator[list[str], None, None]:
+    """Rows of an uploaded CSV, decoded lazily so the file is never read whole."""
+    text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+    try:
+        yield from csv.reader(text)
+    finally:
+        # Detach so closing the wrapper does not close the upload's spooled file.
+        text.detach()
+
+
+def xlsx_rows(stream: BinaryIO) -> Generator[list[str], None, None]:
+    """Rows of the active sheet of an uploaded workbook, via openpyxl's streaming reader.
+
+    Raises ``ImportError`` when openpyxl is not installed.
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.active
+        if worksheet is None:
+            raise ValueError("Empty workbook")
+        for row in worksheet.iter_rows(values_only=True):
+            yield ["" if cell is None else str(cell) for cell in row]
+    finally:
+        workbook.close()
+
+
+def parse_tabular_upload(stream: BinaryIO, parse: Callable[[Iterator[list[str]]], T], *, xlsx: bool) -> T:
+    """Feed an uploaded CSV or XLSX to ``parse`` one row at a time.
+
+    CSV is read as UTF-8 (with or without BOM) and re-read as Latin-1 if that
+    fails, which covers spreadsheets exported on Windows.
+    """
+    # closing() finishes the reader as soon as ``parse`` returns or raises, while the
+    # upload is still open, rather than whenever the generator is collected.
+    if xlsx:
+        with closing(xlsx_rows(stream)) as rows:
+            return parse(rows)
+    try:
+        with closing(csv_rows(stream, "utf-8-sig")) as rows:
+            return parse(rows)
+    except UnicodeDecodeError:
+        stream.seek(0)
+        with closing(csv_rows(stream, "latin-1")) as rows:
+            return parse(rows)
+
+
+def iter_tabular_upload(
+    stream: BinaryIO,
+    parse: Callable[[Iterator[list[str]]], Iterator[T]],
+    *,
+    xlsx: bool,
+    encoding: str = "utf-8-sig",
+) -> Generator[T, None, None]:
+    """Items that ``parse`` yields from an uploaded CSV or XLSX, reading the upload only as they are consumed.
+
+    There is no Latin-1 retry here, since the caller may already have used
+    earlier items: a CSV that is not valid ``encoding`` raises
+    ``UnicodeDecodeError`` part way through, and the caller starts over.
+    """
+    rows = xlsx_rows(stream) if xlsx else csv_rows(stream, encoding)
+    with closing(rows):
+        yield from parse(rows)
@@ -0,0 +1,31 @@
+from typing import Any, Optional, TypeVar, Union
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+
+def parse_uuid(value: Any) -> Optional[UUID]:
+    """Coerce a path/token identifier to a native UUID, or None when it is malformed.
+
+    Always compare UUID primary and foreign keys against native UUIDs: wrapping
+    the column in ``cast(..., String)`` hides it from its index and turns a key
+    probe into a sequential scan.
+    """
+    if isinstance(value, UUID):
+        return value
+    if value is None:
+        return None
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+async def get_by_uuid(db: AsyncSession, model: type[ModelT], value: Union[UUID, str, None]) -> Optional[ModelT]:
+    """Primary-key lookup for UUID-keyed models; malformed ids simply find nothing."""
+    identifier = parse_uuid(value)
+    if identifier is None:
+        return None
+    return await db.get(model, identifier)
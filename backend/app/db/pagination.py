@@ -0,0 +1,33 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Opaque keyset cursor for the row at (``created_at``, ``row_id``)."""
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> Optional[tuple[datetime, UUID]]:
+    """The (created_at, id) position a cursor points at, or None when it is malformed."""
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        return None
+
+
+async def estimated_count(db: AsyncSession, query: Select) -> int:
+    """Planner's row estimate for ``query``: one EXPLAIN, no scan, accurate to the last ANALYZE."""
+    conn = await db.connection()
+    compiled = query.compile(dialect=conn.dialect)
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)).scalar_one()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import Settings
+from app.core.enums import DatabasePoolMode
+
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts, used to size the pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            avg_wait = self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_checkout_ms": round(avg_wait * 1000, 3),
+                "max_checkout_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+# Separate counters per engine kind, so script traffic on the sync engine does not
+# blur the request-path numbers; class-level, so they survive engine.dispose().
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+class _TimedConnectMixin:
+    """Records how long callers wait for a connection in the pool class's ``metrics``."""
+
+    metrics: PoolMetrics
+
+    def connect(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedConnectMixin, QueuePool):
+    metrics = sync_pool_metrics
+
+
+class TimedAsyncQueuePool(_TimedConnectMixin, AsyncAdaptedQueuePool):
+    metrics = async_pool_metrics
+
+
+def build_engine_kwargs(settings: Settings, *, use_asyncio: bool = False) -> dict[str, Any]:
+    """Translate DB_POOL_MODE and the DB_POOL_* settings into create_engine() arguments."""
+    if settings.db_pool_mode == DatabasePoolMode.NULL:
+        return {"poolclass": NullPool}
+
+    kwargs: dict[str, Any] = {
+        "poolclass": TimedAsyncQueuePool if use_asyncio else TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+
+    if settings.db_pool_mode == DatabasePoolMode.PGBOUNCER:
+        # Transaction-mode pgbouncer hands each transaction to an arbitrary server
+        # connection, so server-side prepared statements cannot be reused safely.
+        # psycopg2 never prepares statements; psycopg 3 does after a few executions.
+        if use_asyncio or make_url(settings.database_url).get_driver_name() == "psycopg":
+            kwargs["connect_args"] = {"prepare_threshold": None}
+
+    return kwargs
+
+
+def pool_status(pool: Pool, settings: Settings) -> dict[str, Any]:
+    """Current occupancy of ``pool`` plus its cumulative checkout metrics."""
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(settings.db_max_overflow, 0)
+        checked_out = pool.checkedout()
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": checked_out,
+                "overflow": max(pool.overflow(), 0),
+                "capacity": capacity,
+                "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+            }
+        )
+    if isinstance(pool, _TimedConnectMixin):
+        stats.update(pool.metrics.snapshot())
+    return stats
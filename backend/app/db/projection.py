@@ -0,0 +1,62 @@
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from sqlalchemy import Select, select
+from sqlalchemy.sql.elements import ColumnElement
+
+# A field is a column, or a column plus a function that turns its value into the JSON one.
+FieldSpec = Union[ColumnElement[Any], tuple[ColumnElement[Any], Callable[[Any], Any]]]
+
+
+def isoformat_or_blank(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+
+class Projection:
+    """The response fields of a list endpoint, each backed by one column.
+
+    List endpoints select only the requested fields with a Core ``select`` and
+    build each response row straight from the result tuple, so no ORM entity
+    is hydrated or tracked in the identity map, and a table view asking for
+    five fields reads five columns.
+    """
+
+    def __init__(self, fields: Mapping[str, FieldSpec]) -> None:
+        self._columns: dict[str, ColumnElement[Any]] = {}
+        self._converters: dict[str, Callable[[Any], Any]] = {}
+        for name, spec in fields.items():
+            if isinstance(spec, tuple):
+                self._columns[name], self._converters[name] = spec
+            else:
+                self._columns[name] = spec
+
+    def parse(self, fields: Optional[str]) -> list[str]:
+        """Names from a comma-separated ``fields`` value, or every field when it is blank.
+
+        Raises ``ValueError`` naming any unknown field.
+        """
+        names = list(dict.fromkeys(name.strip() for name in (fields or "").split(",") if name.strip()))
+        if not names:
+            return list(self._columns)
+        unknown = [name for name in names if name not in self._columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(self._columns)}")
+        return names
+
+    def select(self, names: Sequence[str], *extra: ColumnElement[Any]) -> Select:
+        """``SELECT`` of the named fields, followed by any ``extra`` columns the caller needs itself."""
+        return select(*(self._columns[name] for name in names), *extra)
+
+    def rows(self, rows: Sequence[Sequence[Any]], names: Sequence[str]) -> list[dict[str, Any]]:
+        """Response dicts from the leading ``names`` values of each result row."""
+        converters = [self._converters.get(name) for name in names]
+        if not any(converters):
+            return [dict(zip(names, row)) for row in rows]
+        return [
+            {
+                name: value if convert is None else convert(value)
+                for name, value, convert in zip(names, row, converters)
+            }
+            for row in rows
+        ]
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+LIKE_ESCAPE = "\\"
+
+# Relevance ranks, best first.
+RANK_EXACT, RANK_PREFIX, RANK_WORD_PREFIX, RANK_SUBSTRING = range(4)
+
+
+def escape_like(term: str) -> str:
+    """Make ``%``, ``_`` and the escape character in user input match literally."""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+@dataclass(frozen=True)
+class TextSearch:
+    condition: ColumnElement[bool]
+    rank: ColumnElement[int]
+
+
+def text_search(term: Optional[str], *columns: Any) -> Optional[TextSearch]:
+    """Case-insensitive substring search over ``columns``, or None for a blank term.
+
+    ``condition`` is a plain ``ILIKE '%term%'`` per column, which is what the
+    GIN ``gin_trgm_ops`` indexes from migration 0018 serve (for terms of three
+    or more characters). ``rank`` orders matches exact, then prefix, then
+    word prefix, then anywhere, taking the best column; it needs no extension,
+    so search behaves the same where pg_trgm is missing, only unindexed.
+    """
+    term = (term or "").strip()
+    if not term:
+        return None
+
+    pattern = escape_like(term)
+    condition = or_(*(column.ilike(f"%{pattern}%", escape=LIKE_ESCAPE) for column in columns))
+    rank = func.least(
+        *(
+            case(
+                (func.lower(column) == term.lower(), RANK_EXACT),
+                (column.ilike(f"{pattern}%", escape=LIKE_ESCAPE), RANK_PREFIX),
+                (column.ilike(f"% {pattern}%", escape=LIKE_ESCAPE), RANK_WORD_PREFIX),
+                else_=RANK_SUBSTRING,
+            )
+            for column in columns
+        )
+    )
+    return TextSearch(condition=condition, rank=rank)
@@ -1,21 +1,47 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
+from functools import lru_cache
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.db.pool import build_engine_kwargs
 
 settings = get_settings()
 
-# Use NullPool for serverless environments (Vercel) to avoid connection pooling issues
-engine = create_engine(settings.database_url, poolclass=NullPool)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
+def _async_database_url(database_url: str) -> str:
+    """Point DATABASE_URL at psycopg's async driver, whatever driver it names."""
+    url = make_url(database_url)
+    if url.drivername.partition("+")[2] not in ("psycopg", "psycopg_async"):
+        url = url.set(drivername=f"{url.get_backend_name()}+psycopg")
+    return url.render_as_string(hide_password=False)
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+
+# Pool behaviour is chosen by DB_POOL_MODE; serverless deployments (Vercel) run with
+# NullPool, long-running uvicorn workers keep a warm QueuePool.
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    **build_engine_kwargs(settings, use_asyncio=True),
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+@lru_cache
+def get_sync_engine() -> Engine:
+    """Synchronous engine for scripts and migrations, created on first use.
+
+    Request handlers use the async stack, so the API process never opens it.
+    """
+    return create_engine(settings.database_url, **build_engine_kwargs(settings))
+
+
+def get_sync_session() -> Session:
+    return Session(bind=get_sync_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -6,12 +6,21 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings
 from app.core.logging import configure_logging
+from app.core.password_pool import password_hash_pool
 from app.db.base import Base
-from app.db.session import engine
+from app.db.pool import pool_status
+from app.db.session import async_engine
 from app.middleware.request_id import RequestIdMiddleware
 from app.modules.announcements.router import announcements_router
+from app.modules.attendance.router import attendance_router
+from app.modules.auth.activity import session_activity, start_activity_flusher, stop_activity_flusher
+from app.modules.auth.denylist import start_denylist_sync, stop_denylist_sync
 from app.modules.auth.router import auth_router, protected_router
+from app.modules.auth.sweeper import start_sweeper, stop_sweeper
+from app.modules.dashboard.router import dashboard_router
 from app.modules.events.router import events_router
+from app.modules.insights.cache import insights_cache
+from app.modules.insights.rollups import start_rollup_job, stop_rollup_job
 from app.modules.insights.router import insights_router
 from app.modules.messages.router import messages_router
 from app.modules.placement.router import placement_router
@@ -46,6 +55,8 @@ app.add_middleware(RequestIdMiddleware, header_name=settings.request_id_header)
 app.include_router(auth_router, prefix=settings.api_v1_prefix)
 app.include_router(protected_router, prefix=settings.api_v1_prefix)
 app.include_router(insights_router, prefix=settings.api_v1_prefix)
+app.include_router(dashboard_router, prefix=settings.api_v1_prefix)
+app.include_router(attendance_router, prefix=settings.api_v1_prefix)
 app.include_router(students_router, prefix=settings.api_v1_prefix)
 app.include_router(messages_router, prefix=settings.api_v1_prefix)
 app.include_router(placement_router, prefix=settings.api_v1_prefix)
@@ -72,13 +83,55 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/db", tags=["system"])
+def database_pool_health() -> dict:
+    """Connection pool occupancy and checkout latency, for sizing DB_POOL_SIZE."""
+    return {"pool_mode": settings.db_pool_mode.value, **pool_status(async_engine.pool, settings)}
+
+
+@app.get("/health/password-hashing", tags=["system"])
+def password_hashing_health() -> dict:
+    """Argon2 worker pool occupancy, rejections and per-hash latency."""
+    return password_hash_pool.snapshot()
+
+
+@app.get("/health/insights-cache", tags=["system"])
+def insights_cache_health() -> dict:
+    """Insights response cache: hit rate, stale serves and background refresh latency."""
+    return insights_cache.snapshot()
+
+
+@app.get("/health/session-activity", tags=["system"])
+def session_activity_health() -> dict:
+    """Write-behind buffer for session last-seen updates: backlog and flush counts."""
+    return session_activity.snapshot()
+
+
 @app.on_event("startup")
 async def create_tables() -> None:
     """Ensure all database tables exist on startup.
     Uses create_all with checkfirst=True — safe to run repeatedly, only creates missing tables.
     """
     try:
-        Base.metadata.create_all(bind=engine, checkfirst=True)
+        async with async_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, checkfirst=True)
         logger.info("Database tables verified/created successfully")
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
+
+
+@app.on_event("startup")
+async def start_background_jobs() -> None:
+    start_sweeper()
+    await start_denylist_sync()
+    start_activity_flusher()
+    start_rollup_job()
+
+
+@app.on_event("shutdown")
+async def shutdown_workers() -> None:
+    await stop_sweeper()
+    await stop_denylist_sync()
+    await stop_activity_flusher()
+    await stop_rollup_job()
+    password_hash_pool.shutdown()
@@ -1,4 +1,5 @@
 from app.models.announcement import Announcement
+from app.models.attendance import AttendanceRecord
 from app.models.anonymous_message import AnonymousMessage
 from app.models.event import Event
 from app.models.form import FormDefinition, FormResponse
@@ -6,7 +7,9 @@ from app.models.password_reset import PasswordResetToken
 from app.models.placement_record import PlacementRecord
 from app.models.project import Project
 from app.models.refresh_token import RefreshToken
+from app.models.rollup import DailySessionRollup, InsightsSnapshot
 from app.models.session import Session
+from app.models.session_revocation import SessionRevocation
 from app.models.student import Student
 from app.models.user import User
 
@@ -14,5 +17,6 @@ __all__ = [
     "User", "Session", "RefreshToken", "Student",
     "PasswordResetToken", "AnonymousMessage", "PlacementRecord",
     "Announcement", "Event", "Project", "FormDefinition", "FormResponse",
+    "DailySessionRollup", "InsightsSnapshot", "AttendanceRecord", "SessionRevocation",
 ]
 
@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.dialects.postgresql import BIT, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AttendanceRecord(Base):
+    """A student's lecture-by-lecture presence for one term, packed one bit per lecture.
+
+    Bit ``i`` (0-based, leftmost first) is 1 when the student attended lecture
+    ``i + 1``; the bit string's length is the number of lectures recorded.
+    """
+
+    __tablename__ = "attendance_records"
+
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), primary_key=True
+    )
+    term: Mapped[str] = mapped_column(String(20), primary_key=True, index=True)
+    presence: Mapped[str] = mapped_column(BIT(varying=True), nullable=False)
+    lectures: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,31 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DailySessionRollup(Base):
+    """Sessions started and distinct users per UTC day and department."""
+
+    __tablename__ = "daily_session_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    # Users without a department are rolled up under "".
+    department: Mapped[str] = mapped_column(String(100), primary_key=True, server_default="")
+    sessions_started: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    active_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class InsightsSnapshot(Base):
+    """Single-row snapshot of the headline counts behind the summary endpoints."""
+
+    __tablename__ = "insights_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    total_users: Mapped[int] = mapped_column(Integer, nullable=False)
+    active_users: Mapped[int] = mapped_column(Integer, nullable=False)
+    locked_users: Mapped[int] = mapped_column(Integer, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SessionRevocation(Base):
+    """A session revoked as its row was deleted, kept for the revocation denylist.
+
+    Deleting a user cascades away their sessions, and ``sessions.revoked_at``
+    with them, so other workers' denylists would never hear of it. There is no
+    foreign key: the row must outlive the session it names, for one
+    access-token lifetime, after which the sweeper removes it.
+    """
+
+    __tablename__ = "session_revocations"
+
+    # The revoked session's id.
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Float, Integer, String, func
+from sqlalchemy import DateTime, Float, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,6 +11,11 @@ from app.db.base import Base
 
 class Student(Base):
     __tablename__ = "students"
+    # Backs the newest-first list and its keyset cursor on (created_at, id). The trigram
+    # search indexes on name and roll_no exist only in migration 0018: they need pg_trgm.
+    __table_args__ = (
+        Index("ix_students_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -2,10 +2,12 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import Projection, isoformat_or_blank
 from app.db.session import get_db
 from app.models.announcement import Announcement
 
@@ -39,13 +41,15 @@ class AnnouncementOut(BaseModel):
         from_attributes = True
 
 
-def _to_out(a: Announcement) -> dict:
-    """Convert DB model to frontend-compatible dict."""
-    semester = a.target_semester
+def _target_semester(semester: Optional[str]) -> Union[str, int, None]:
     try:
-        semester = int(semester)
+        return int(semester)
     except (ValueError, TypeError):
-        pass
+        return semester
+
+
+def _to_out(a: Announcement) -> dict:
+    """Convert DB model to frontend-compatible dict."""
     return {
         "id": a.id,
         "title": a.title,
@@ -53,32 +57,53 @@ def _to_out(a: Announcement) -> dict:
         "author": a.author,
         "authorRole": a.author_role,
         "targetCourse": a.target_course,
-        "targetSemester": semester,
+        "targetSemester": _target_semester(a.target_semester),
         "createdAt": a.created_at.isoformat() if a.created_at else "",
         "priority": a.priority,
     }
 
 
+# The fields of _to_out, for sparse ``fields=`` lists.
+ANNOUNCEMENT_FIELDS = Projection(
+    {
+        "id": Announcement.id,
+        "title": Announcement.title,
+        "message": Announcement.message,
+        "author": Announcement.author,
+        "authorRole": Announcement.author_role,
+        "targetCourse": Announcement.target_course,
+        "targetSemester": (Announcement.target_semester, _target_semester),
+        "createdAt": (Announcement.created_at, isoformat_or_blank),
+        "priority": Announcement.priority,
+    }
+)
+
+
 @announcements_router.get("")
-def list_announcements(
+async def list_announcements(
     course: Optional[str] = None,
     semester: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(default=None),
+    db: AsyncSession = Depends(get_db),
 ):
-    query = db.query(Announcement).order_by(Announcement.created_at.desc())
+    try:
+        names = ANNOUNCEMENT_FIELDS.parse(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    query = ANNOUNCEMENT_FIELDS.select(names).order_by(Announcement.created_at.desc())
     if course and course != "all":
-        query = query.filter(
+        query = query.where(
             (Announcement.target_course == course) | (Announcement.target_course == "all")
         )
     if semester and semester != "all":
-        query = query.filter(
+        query = query.where(
             (Announcement.target_semester == semester) | (Announcement.target_semester == "all")
         )
-    return [_to_out(a) for a in query.all()]
+    return ANNOUNCEMENT_FIELDS.rows((await db.execute(query)).all(), names)
 
 
 @announcements_router.post("", status_code=201)
-def create_announcement(body: AnnouncementCreate, db: Session = Depends(get_db)):
+async def create_announcement(body: AnnouncementCreate, db: AsyncSession = Depends(get_db)):
     ann = Announcement(
         title=body.title,
         message=body.message,
@@ -90,18 +115,18 @@ def create_announcement(body: AnnouncementCreate, db: Session = Depends(get_db))
         priority=body.priority,
     )
     db.add(ann)
-    db.commit()
-    db.refresh(ann)
+    await db.commit()
+    await db.refresh(ann)
     logger.info(f"Created announcement: {ann.id}")
     return _to_out(ann)
 
 
 @announcements_router.delete("/{announcement_id}")
-def delete_announcement(announcement_id: str, db: Session = Depends(get_db)):
-    ann = db.query(Announcement).filter(Announcement.id == announcement_id).first()
+async def delete_announcement(announcement_id: str, db: AsyncSession = Depends(get_db)):
+    ann = await db.scalar(select(Announcement).where(Announcement.id == announcement_id))
     if not ann:
         raise HTTPException(status_code=404, detail="Announcement not found")
-    db.delete(ann)
-    db.commit()
+    await db.delete(ann)
+    await db.commit()
     logger.info(f"Deleted announcement: {announcement_id}")
     return {"detail": "Deleted"}
@@ -0,0 +1,39 @@
+"""SQL expressions over attendance_records.presence bitmaps.
+
+Every figure is computed inside PostgreSQL from the packed bit string, so a
+term's register is one short row per student rather than one row per lecture,
+and per-student statistics never leave the database as individual marks.
+Bit ``i`` (leftmost first) is lecture ``i + 1``; the most recent lecture is
+the rightmost bit.
+"""
+
+from sqlalchemy import Numeric, Text, cast, func, select
+
+
+def attendance_percent_expression(presence, lectures):
+    """Share of set bits in ``presence``, as a percentage to one decimal place."""
+    share = cast(func.bit_count(presence), Numeric) * 100 / func.nullif(lectures, 0)
+    return func.coalesce(func.round(share, 1), 0)
+
+
+def recent_window(presence, last: int):
+    """The bits for the ``last`` most recent lectures (all of them when fewer were recorded)."""
+    return func.substring(presence, func.greatest(func.length(presence) - last + 1, 1))
+
+
+def missed_recent_expression(presence, last: int):
+    """Absences among the ``last`` most recent lectures."""
+    window = recent_window(presence, last)
+    return func.length(window) - func.bit_count(window)
+
+
+def current_streak_expression(presence):
+    """Consecutive lectures attended up to and including the most recent one."""
+    marks = cast(presence, Text)
+    return func.length(marks) - func.length(func.rtrim(marks, "1"))
+
+
+def longest_streak_expression(presence):
+    """Longest run of consecutive lectures attended, as a correlated scalar subquery."""
+    runs = func.regexp_split_to_table(cast(presence, Text), "0+").table_valued("run").render_derived(name="runs")
+    return select(func.coalesce(func.max(func.length(runs.c.run)), 0)).scalar_subquery()
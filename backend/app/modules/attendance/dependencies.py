@@ -0,0 +1,16 @@
+import re
+from typing import Optional
+
+from fastapi import HTTPException
+
+TERM_PATTERN = re.compile(r"^\d{4}-(ODD|EVEN)$")
+
+
+def get_term(term: Optional[str] = None) -> Optional[str]:
+    """The ``term`` query/form value in canonical ``2026-ODD`` form; None when it was not given."""
+    if term is None:
+        return None
+    term = term.strip().upper()
+    if not TERM_PATTERN.match(term):
+        raise HTTPException(status_code=400, detail="Term must look like 2026-ODD or 2026-EVEN")
+    return term
@@ -0,0 +1,110 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import BinaryIO, Optional
+
+from app.core.uploads import parse_tabular_upload
+
+ROLL_NO_HEADER = "roll no."
+LECTURE_HEADER = re.compile(r"^lecture\s*(\d+)$", re.IGNORECASE)
+HEADER_SEARCH_ROWS = 20
+
+PRESENT_MARKS = frozenset({"p", "present", "1", "y", "yes", "x", "✓"})
+ABSENT_MARKS = frozenset({"a", "absent", "0", "n", "no"})
+# Per-row marks are kept as one character per lecture column until the sheet-wide
+# set of held lectures is known.
+_PRESENT, _ABSENT, _BLANK = "1", "0", "-"
+
+
+@dataclass
+class ParsedSheet:
+    """Presence per roll number, as bit strings over the lectures actually held."""
+
+    presence: dict[str, str] = field(default_factory=dict)
+    lectures: int = 0
+    duplicates: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def _mark(cell: str) -> Optional[str]:
+    value = cell.strip().lower()
+    if not value:
+        return _BLANK
+    if value in PRESENT_MARKS:
+        return _PRESENT
+    if value in ABSENT_MARKS:
+        return _ABSENT
+    return None
+
+
+def parse_attendance_rows(rows: Iterable[list[str]]) -> ParsedSheet:
+    """Parse a Name / Roll No. / Lecture 1..N register, one pass over ``rows``.
+
+    Lecture columns with no mark in any row are treated as not yet held and
+    dropped; a blank cell in a held lecture counts as absent. Repeated roll
+    numbers keep their first row and are counted as duplicates.
+    """
+    rows = iter(rows)
+    roll_index = None
+    lecture_columns: list[int] = []
+    for line_number, row in enumerate(rows, start=1):
+        headers = [str(cell).strip() for cell in row]
+        if ROLL_NO_HEADER in (header.lower() for header in headers):
+            roll_index = [header.lower() for header in headers].index(ROLL_NO_HEADER)
+            numbered = sorted(
+                (int(match.group(1)), index)
+                for index, header in enumerate(headers)
+                if (match := LECTURE_HEADER.match(header))
+            )
+            lecture_columns = [index for _, index in numbered]
+            break
+        if line_number >= HEADER_SEARCH_ROWS:
+            break
+    if roll_index is None:
+        raise ValueError("Could not find header row with 'Roll No.' column")
+    if not lecture_columns:
+        raise ValueError("No 'Lecture N' columns found")
+
+    sheet = ParsedSheet()
+    marks_by_roll: dict[str, str] = {}
+    held = [False] * len(lecture_columns)
+    for line_number, row in enumerate(rows, start=line_number + 1):
+        cells = [str(cell) if cell is not None else "" for cell in row]
+        if not any(cell.strip() for cell in cells):
+            continue
+        roll_no = cells[roll_index].strip() if roll_index < len(cells) else ""
+        if not roll_no:
+            sheet.errors.append(f"Row {line_number}: missing roll number")
+            continue
+        if roll_no in marks_by_roll:
+            sheet.duplicates += 1
+            continue
+
+        marks = []
+        for position, column in enumerate(lecture_columns):
+            mark = _mark(cells[column]) if column < len(cells) else _BLANK
+            if mark is None:
+                sheet.errors.append(f"Row {line_number}: unrecognised mark {cells[column].strip()!r} for {roll_no}")
+                break
+            if mark != _BLANK:
+                held[position] = True
+            marks.append(mark)
+        else:
+            marks_by_roll[roll_no] = "".join(marks)
+
+    kept = [position for position, was_held in enumerate(held) if was_held]
+    sheet.lectures = len(kept)
+    sheet.presence = {
+        roll_no: "".join(_PRESENT if marks[position] == _PRESENT else _ABSENT for position in kept)
+        for roll_no, marks in marks_by_roll.items()
+    }
+    return sheet
+
+
+def parse_attendance_upload(stream: BinaryIO, *, xlsx: bool) -> ParsedSheet:
+    """Stream-parse an uploaded register without loading the whole file into memory.
+
+    Raises ``ImportError`` for .xlsx when openpyxl is missing and ``ValueError``
+    for malformed sheets.
+    """
+    return parse_tabular_upload(stream, parse_attendance_rows, xlsx=xlsx)
@@ -0,0 +1,124 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.db.ids import parse_uuid
+from app.db.session import get_db
+from app.modules.attendance.dependencies import get_term
+from app.modules.attendance.parser import parse_attendance_upload
+from app.modules.attendance.schemas import AtRiskStudentResponse, AttendanceHistoryResponse, BulkUploadResponse
+from app.modules.attendance.service import AttendanceService, current_term
+from app.modules.auth.dependencies import AuthContext, RequireRole, get_auth_context
+
+attendance_router = APIRouter(prefix="/attendance", tags=["attendance"])
+
+MAX_REPORTED_ERRORS = 100
+
+
+@attendance_router.post("/bulk-upload", response_model=BulkUploadResponse)
+async def bulk_upload_attendance(
+    file: UploadFile = File(...),
+    term: Optional[str] = Form(None),
+    _: AuthContext = Depends(RequireRole(["admin", "dean", "hod"])),
+    db: AsyncSession = Depends(get_db),
+) -> BulkUploadResponse:
+    """Upload a term's attendance register (Name, Roll No., Lecture 1..N) as CSV or Excel.
+
+    Re-uploading a term replaces the stored register for the students in the file.
+    Restricted to Admin, Dean and HOD.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    filename_lower = file.filename.lower()
+    if not (filename_lower.endswith(".csv") or filename_lower.endswith(".xlsx")):
+        raise HTTPException(status_code=400, detail="Only .csv and .xlsx files are supported")
+
+    term = get_term(term) or current_term()
+
+    try:
+        sheet = await run_in_threadpool(parse_attendance_upload, file.file, xlsx=filename_lower.endswith(".xlsx"))
+    except ImportError:
+        raise HTTPException(
+            status_code=400,
+            detail="Excel support requires openpyxl. Please upload a .csv file instead.",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    processed, unmatched = await AttendanceService.ingest(db, sheet=sheet, term=term)
+
+    errors = sheet.errors + [f"Unknown roll number: {roll_no}" for roll_no in unmatched]
+    if len(errors) > MAX_REPORTED_ERRORS:
+        errors = errors[:MAX_REPORTED_ERRORS] + [f"... and {len(errors) - MAX_REPORTED_ERRORS} more"]
+
+    return BulkUploadResponse(
+        processed=processed,
+        duplicates=sheet.duplicates,
+        errors=errors,
+        term=term,
+        lectures=sheet.lectures,
+    )
+
+
+@attendance_router.get("/students/{student_id}/history", response_model=AttendanceHistoryResponse)
+async def student_attendance_history(
+    student_id: str,
+    term: Optional[str] = Depends(get_term),
+    recent: int = Query(5, ge=1, le=100),
+    _: AuthContext = Depends(get_auth_context),
+    db: AsyncSession = Depends(get_db),
+) -> AttendanceHistoryResponse:
+    """Percentage, streaks and absences in the last ``recent`` lectures for one term (latest by default)."""
+    identifier = parse_uuid(student_id)
+    row = None
+    if identifier is not None:
+        row = await AttendanceService.history(db, student_id=identifier, term=term, recent=recent)
+    if row is None:
+        raise HTTPException(status_code=404, detail="No attendance recorded for this student")
+
+    return AttendanceHistoryResponse(
+        studentId=str(identifier),
+        term=row.term,
+        lectures=row.lectures,
+        attended=row.attended,
+        attendancePercent=float(row.percent),
+        currentStreak=row.current_streak,
+        longestStreak=row.longest_streak,
+        recentWindow=min(recent, row.lectures),
+        missedRecent=row.missed_recent,
+        marks=row.marks,
+    )
+
+
+@attendance_router.get("/at-risk", response_model=list[AtRiskStudentResponse])
+async def students_at_risk(
+    term: Optional[str] = Depends(get_term),
+    last: int = Query(5, ge=1, le=100),
+    missed: int = Query(3, ge=1, le=100),
+    department: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    _: AuthContext = Depends(get_auth_context),
+    db: AsyncSession = Depends(get_db),
+) -> list[AtRiskStudentResponse]:
+    """Students who missed at least ``missed`` of their last ``last`` lectures in ``term`` (latest by default)."""
+    if missed > last:
+        raise HTTPException(status_code=400, detail="missed cannot exceed last")
+
+    rows = await AttendanceService.at_risk(
+        db, term=term, last=last, missed=missed, department=department, limit=limit
+    )
+    return [
+        AtRiskStudentResponse(
+            id=str(row.id),
+            name=row.name,
+            rollNo=row.roll_no,
+            course=row.course,
+            term=row.term,
+            attendancePercent=float(row.percent),
+            missedRecent=row.missed_recent,
+        )
+        for row in rows
+    ]
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+
+class BulkUploadResponse(BaseModel):
+    processed: int
+    duplicates: int
+    errors: list[str]
+    term: str
+    lectures: int
+
+
+class AttendanceHistoryResponse(BaseModel):
+    studentId: str
+    term: str
+    lectures: int
+    attended: int
+    attendancePercent: float
+    currentStreak: int
+    longestStreak: int
+    recentWindow: int
+    missedRecent: int
+    marks: str
+
+
+class AtRiskStudentResponse(BaseModel):
+    id: str
+    name: str
+    rollNo: str
+    course: str
+    term: str
+    attendancePercent: float
+    missedRecent: int
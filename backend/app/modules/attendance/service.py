@@ -0,0 +1,160 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID as PyUUID
+
+from sqlalchemy import Text, any_, bindparam, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, BIT, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import String
+
+from app.models.attendance import AttendanceRecord
+from app.models.student import Student
+from app.modules.attendance.bitmaps import (
+    attendance_percent_expression,
+    current_streak_expression,
+    longest_streak_expression,
+    missed_recent_expression,
+)
+from app.modules.attendance.parser import ParsedSheet
+
+
+def current_term(today: Optional[date] = None) -> str:
+    """Academic term label: odd semesters run July-December, even ones January-June."""
+    today = today or date.today()
+    return f"{today.year}-{'ODD' if today.month >= 7 else 'EVEN'}"
+
+
+def _latest_term():
+    return select(func.max(AttendanceRecord.term)).scalar_subquery()
+
+
+class AttendanceService:
+    @staticmethod
+    async def ingest(db: AsyncSession, *, sheet: ParsedSheet, term: str) -> tuple[int, list[str]]:
+        """Store ``sheet`` for ``term`` and refresh attendance_percent; returns (stored, unmatched roll numbers).
+
+        Three statements whatever the sheet size: one roll-number lookup, one
+        upsert of every bitmap via ``unnest``, one set-based percentage update.
+        """
+        roll_numbers = list(sheet.presence)
+        students = (
+            await db.execute(
+                select(Student.roll_no, Student.id).where(
+                    Student.roll_no == any_(bindparam("roll_numbers", roll_numbers, type_=ARRAY(String)))
+                )
+            )
+        ).all()
+        student_ids = {roll_no: student_id for roll_no, student_id in students}
+        unmatched = [roll_no for roll_no in roll_numbers if roll_no not in student_ids]
+        if not student_ids:
+            return 0, unmatched
+
+        matched = [roll_no for roll_no in roll_numbers if roll_no in student_ids]
+        incoming = (
+            func.unnest(
+                bindparam("student_ids", [student_ids[roll_no] for roll_no in matched], type_=ARRAY(UUID(as_uuid=True))),
+                bindparam("presence", [sheet.presence[roll_no] for roll_no in matched], type_=ARRAY(BIT(varying=True))),
+            )
+            .table_valued("student_id", "presence")
+            .render_derived(name="incoming")
+        )
+        upsert = insert(AttendanceRecord).from_select(
+            ["student_id", "term", "presence", "lectures"],
+            select(
+                incoming.c.student_id,
+                literal(term, AttendanceRecord.term.type),
+                incoming.c.presence,
+                func.length(incoming.c.presence),
+            ),
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[AttendanceRecord.student_id, AttendanceRecord.term],
+            set_={
+                "presence": upsert.excluded.presence,
+                "lectures": upsert.excluded.lectures,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(upsert)
+
+        await db.execute(
+            update(Student)
+            .where(
+                AttendanceRecord.student_id == Student.id,
+                AttendanceRecord.term == term,
+                Student.id == any_(bindparam("updated_ids", list(student_ids.values()), type_=ARRAY(UUID(as_uuid=True)))),
+            )
+            .values(
+                attendance_percent=attendance_percent_expression(AttendanceRecord.presence, AttendanceRecord.lectures)
+            )
+        )
+        await db.commit()
+        return len(matched), unmatched
+
+    @staticmethod
+    async def history(db: AsyncSession, *, student_id: PyUUID, term: Optional[str], recent: int):
+        """One row of bitmap statistics for a student's ``term`` (their latest term when omitted), or None."""
+        query = (
+            select(
+                AttendanceRecord.term,
+                AttendanceRecord.lectures,
+                cast(AttendanceRecord.presence, Text).label("marks"),
+                func.bit_count(AttendanceRecord.presence).label("attended"),
+                attendance_percent_expression(AttendanceRecord.presence, AttendanceRecord.lectures).label("percent"),
+                current_streak_expression(AttendanceRecord.presence).label("current_streak"),
+                longest_streak_expression(AttendanceRecord.presence).label("longest_streak"),
+                missed_recent_expression(AttendanceRecord.presence, recent).label("missed_recent"),
+            )
+            .where(AttendanceRecord.student_id == student_id)
+            .order_by(AttendanceRecord.term.desc())
+            .limit(1)
+        )
+        if term:
+            query = query.where(AttendanceRecord.term == term)
+        return (await db.execute(query)).first()
+
+    @staticmethod
+    async def at_risk(
+        db: AsyncSession,
+        *,
+        term: Optional[str],
+        last: int,
+        missed: int,
+        department: Optional[str] = None,
+        limit: int = 100,
+    ):
+        """Students who missed at least ``missed`` of their ``last`` lectures, worst first, in one scan of the term."""
+        missed_recent = missed_recent_expression(AttendanceRecord.presence, last)
+        query = (
+            select(
+                Student.id,
+                Student.name,
+                Student.roll_no,
+                Student.course,
+                AttendanceRecord.term,
+                attendance_percent_expression(AttendanceRecord.presence, AttendanceRecord.lectures).label("percent"),
+                missed_recent.label("missed_recent"),
+            )
+            .join(Student, Student.id == AttendanceRecord.student_id)
+            .where(AttendanceRecord.term == (term or _latest_term()), missed_recent >= missed)
+            .order_by(missed_recent.desc(), AttendanceRecord.lectures.desc(), Student.roll_no)
+            .limit(limit)
+        )
+        if department:
+            query = query.where(Student.department == department)
+        return (await db.execute(query)).all()
+
+    @staticmethod
+    async def term_summary(db: AsyncSession, *, threshold: float, term: Optional[str] = None):
+        """(students, average percent, students below ``threshold``) for ``term`` (the latest when omitted)."""
+        percent = attendance_percent_expression(AttendanceRecord.presence, AttendanceRecord.lectures)
+        row = (
+            await db.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.round(func.avg(percent), 1), 0),
+                    func.count().filter(percent < threshold),
+                ).where(AttendanceRecord.term == (term or _latest_term()))
+            )
+        ).one()
+        return int(row[0]), float(row[1]), int(row[2])
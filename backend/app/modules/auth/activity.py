@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, String, Text, Update, column, func, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.security import now_utc
+from app.db.session import AsyncSessionLocal
+from app.models.session import Session as UserSession
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_flush_task: Optional[asyncio.Task] = None
+
+ActivityEntry = tuple[datetime, Optional[str], Optional[str]]
+
+
+def _activity_update(entries: dict[UUID, ActivityEntry]) -> Update:
+    """One UPDATE applying ``entries`` (seen_at, ip, user_agent per session) to live sessions."""
+    activity = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("seen_at", DateTime(timezone=True)),
+        column("ip", String(45)),
+        column("user_agent", Text),
+        name="activity",
+    ).data([(session_id, *entry) for session_id, entry in entries.items()])
+    return (
+        update(UserSession)
+        .where(UserSession.id == activity.c.id, UserSession.revoked_at.is_(None))
+        .values(
+            last_seen_at=func.greatest(UserSession.last_seen_at, activity.c.seen_at),
+            ip=func.coalesce(activity.c.ip, UserSession.ip),
+            user_agent=func.coalesce(activity.c.user_agent, UserSession.user_agent),
+        )
+    )
+
+
+class SessionActivityBuffer:
+    """Write-behind buffer for ``sessions.last_seen_at``, ``ip`` and ``user_agent``.
+
+    Requests only record activity in memory; repeated hits on one session
+    coalesce into a single pending entry, and pending entries are written in
+    one ``UPDATE ... FROM (VALUES ...)`` per flush. ``last_seen_at`` only ever
+    moves forward, so flushes from several workers can land in any order.
+    """
+
+    def __init__(self, *, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._pending: dict[UUID, ActivityEntry] = {}
+        self._flush_lock = asyncio.Lock()
+        self._overflow_flush: Optional[asyncio.Task] = None
+        self.recorded = 0
+        self.flushes = 0
+        self.flushed_sessions = 0
+        self.failed_flushes = 0
+
+    def record(
+        self,
+        session_id: UUID,
+        *,
+        seen_at: Optional[datetime] = None,
+        ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        previous = self._pending.get(session_id)
+        if previous is not None:
+            ip = ip or previous[1]
+            user_agent = user_agent or previous[2]
+        self._pending[session_id] = (seen_at or now_utc(), ip, user_agent)
+        self.recorded += 1
+
+        if len(self._pending) >= self.max_pending and (self._overflow_flush is None or self._overflow_flush.done()):
+            self._overflow_flush = asyncio.get_running_loop().create_task(self._flush_logged())
+
+    async def flush(self) -> int:
+        """Write every pending entry in one statement; returns the number of sessions written."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+
+            statement = _activity_update(batch)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(statement)
+                    await db.commit()
+            except Exception:
+                self.failed_flushes += 1
+                # Keep anything recorded since the swap; it is newer than the failed batch.
+                for session_id, entry in batch.items():
+                    self._pending.setdefault(session_id, entry)
+                raise
+
+            self.flushes += 1
+            self.flushed_sessions += len(batch)
+            return len(batch)
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Session activity flush failed")
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flushed_sessions": self.flushed_sessions,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+session_activity = SessionActivityBuffer(max_pending=settings.session_activity_max_pending)
+
+
+def record_request_activity(session_id: UUID, *, ip: Optional[str] = None, user_agent: Optional[str] = None) -> None:
+    """Note activity on an authenticated request in the write-behind buffer.
+
+    With write-behind off nothing is recorded, so a request costs no write at
+    all and ``last_seen_at`` advances on refresh only, as before buffering.
+    """
+    if settings.session_activity_write_behind:
+        session_activity.record(session_id, ip=ip, user_agent=user_agent)
+
+
+async def record_refresh_activity(
+    db: AsyncSession,
+    session_id: UUID,
+    *,
+    seen_at: datetime,
+    ip: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> None:
+    """Record activity at token refresh: buffered, or with write-behind off an UPDATE in ``db``'s transaction."""
+    if settings.session_activity_write_behind:
+        session_activity.record(session_id, seen_at=seen_at, ip=ip, user_agent=user_agent)
+    else:
+        await db.execute(_activity_update({session_id: (seen_at, ip, user_agent)}))
+
+
+async def _flush_forever() -> None:
+    while True:
+        await asyncio.sleep(settings.session_activity_flush_seconds)
+        await session_activity._flush_logged()
+
+
+def start_activity_flusher() -> None:
+    global _flush_task
+    if _flush_task is None and settings.session_activity_write_behind:
+        _flush_task = asyncio.create_task(_flush_forever())
+
+
+async def stop_activity_flusher() -> None:
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    await session_activity._flush_logged()
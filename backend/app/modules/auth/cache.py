@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Union
+from uuid import UUID
+
+from app.core.config import get_settings
+
+if TYPE_CHECKING:
+    from app.modules.auth.dependencies import AuthContext
+
+settings = get_settings()
+
+
+class AuthContextCache:
+    """Bounded LRU of resolved auth contexts keyed by session id.
+
+    Entries expire after ``ttl_seconds``, so a revocation performed by another
+    process is honoured within one TTL; revocations in this process invalidate
+    the affected entries immediately.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, "AuthContext"]] = OrderedDict()
+        self._sessions_by_user: dict[str, set[str]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, session_id: Union[UUID, str]) -> Optional["AuthContext"]:
+        if not self.enabled:
+            return None
+        key = str(session_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, auth = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return auth
+
+    def set(self, auth: "AuthContext") -> None:
+        if not self.enabled:
+            return
+        key = str(auth.session.id)
+        user_key = str(auth.user.id)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, auth)
+            self._sessions_by_user.setdefault(user_key, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_session(self, session_id: Union[UUID, str]) -> None:
+        with self._lock:
+            self._drop(str(session_id))
+
+    def invalidate_user(self, user_id: Union[UUID, str]) -> None:
+        with self._lock:
+            for key in list(self._sessions_by_user.get(str(user_id), ())):
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sessions_by_user.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_key = str(entry[1].user.id)
+        sessions = self._sessions_by_user.get(user_key)
+        if sessions is not None:
+            sessions.discard(key)
+            if not sessions:
+                del self._sessions_by_user[user_key]
+
+
+auth_context_cache = AuthContextCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries,
+)
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Optional, Union
+from uuid import UUID
+
+from sqlalchemy import select, union_all
+
+from app.core.config import get_settings
+from app.core.security import now_utc
+from app.db.session import AsyncSessionLocal
+from app.models.session import Session as UserSession
+from app.models.session_revocation import SessionRevocation
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_sync_task: Optional[asyncio.Task] = None
+
+
+class RevocationDenylist:
+    """Session ids revoked while access tokens issued for them may still be valid.
+
+    Stateless verification trusts the signed claims, so the only thing it must
+    look up is whether the session was revoked. An entry is needed for one
+    access-token lifetime after revocation; after that every token for the
+    session has expired on its own and the entry is pruned.
+    """
+
+    def __init__(self, *, retention: timedelta) -> None:
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._revoked: dict[str, datetime] = {}
+        self._synced_until: Optional[datetime] = None
+
+    def add(self, session_ids: Iterable[Union[UUID, str]], *, revoked_at: Optional[datetime] = None) -> None:
+        forget_at = (revoked_at or now_utc()) + self.retention
+        with self._lock:
+            for session_id in session_ids:
+                self._revoked[str(session_id)] = forget_at
+
+    def contains(self, session_id: Union[UUID, str]) -> bool:
+        with self._lock:
+            forget_at = self._revoked.get(str(session_id))
+            if forget_at is None:
+                return False
+            if forget_at <= now_utc():
+                del self._revoked[str(session_id)]
+                return False
+            return True
+
+    def prune(self) -> None:
+        now = now_utc()
+        with self._lock:
+            for key in [key for key, forget_at in self._revoked.items() if forget_at <= now]:
+                del self._revoked[key]
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    async def sync(self) -> int:
+        """Pull revocations recorded by any process since the last sync (all recent ones at startup).
+
+        Sessions deleted along with their user are only in ``session_revocations``.
+        """
+        now = now_utc()
+        since = self._synced_until or now - self.retention
+        revocations = union_all(
+            select(UserSession.id, UserSession.revoked_at).where(UserSession.revoked_at >= since),
+            select(SessionRevocation.id, SessionRevocation.revoked_at).where(SessionRevocation.revoked_at >= since),
+        )
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(revocations)).all()
+        for session_id, revoked_at in rows:
+            self.add([session_id], revoked_at=revoked_at)
+        # Overlap by a second so a revocation committed mid-query is picked up next time.
+        self._synced_until = now - timedelta(seconds=1)
+        self.prune()
+        return len(rows)
+
+
+revocation_denylist = RevocationDenylist(retention=timedelta(minutes=settings.access_token_ttl_minutes))
+
+
+async def _sync_forever() -> None:
+    while True:
+        await asyncio.sleep(settings.auth_denylist_sync_seconds)
+        try:
+            await revocation_denylist.sync()
+        except Exception:
+            logger.exception("Revocation denylist sync failed")
+
+
+async def start_denylist_sync() -> None:
+    global _sync_task
+    if not settings.auth_stateless or _sync_task is not None:
+        return
+    loaded = await revocation_denylist.sync()
+    logger.info("Revocation denylist rebuilt", extra={"revoked_sessions": loaded})
+    _sync_task = asyncio.create_task(_sync_forever())
+
+
+async def stop_denylist_sync() -> None:
+    global _sync_task
+    if _sync_task is None:
+        return
+    _sync_task.cancel()
+    try:
+        await _sync_task
+    except asyncio.CancelledError:
+        pass
+    _sync_task = None
@@ -1,29 +1,54 @@
 from typing import Optional
-from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
-from sqlalchemy import String, cast, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.permissions import permission_mask, permissions_for_role
 from app.core.security import decode_access_token
+from app.db.ids import get_by_uuid, parse_uuid
 from app.db.session import get_db
 from app.models.session import Session as UserSession
 from app.models.user import User
+from app.modules.auth.activity import record_request_activity
+from app.modules.auth.cache import auth_context_cache
+from app.modules.auth.denylist import revocation_denylist
 
+settings = get_settings()
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
 class AuthContext:
-    def __init__(self, *, user: User, session: UserSession) -> None:
+    def __init__(self, *, user: User, session: UserSession, permissions: int) -> None:
         self.user = user
         self.session = session
+        self.permissions = permissions
 
-def get_auth_context(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-) -> AuthContext:
+
+def _stateless_auth_context(payload: dict, *, user_id, session_id) -> AuthContext:
+    """Build the auth context from signed claims alone; only the revocation denylist is consulted."""
+    if revocation_denylist.contains(session_id):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session is not active")
+    if payload["status"] != "ACTIVE":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not active")
+
+    user = User(
+        id=user_id,
+        email=payload.get("email"),
+        department=payload.get("dept"),
+        status=payload["status"],
+        role=payload.get("role"),
+    )
+    return AuthContext(
+        user=user,
+        session=UserSession(id=session_id, user_id=user_id),
+        permissions=payload.get("perm", 0),
+    )
+
+
+async def _resolve_auth_context(credentials: Optional[HTTPAuthorizationCredentials], db: AsyncSession) -> AuthContext:
     if not credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing bearer token")
 
@@ -33,45 +58,71 @@ def get_auth_context(
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token") from None
 
-    user_id = payload.get("sub")
-    session_id = payload.get("sid")
+    user_id = parse_uuid(payload.get("sub"))
+    session_id = parse_uuid(payload.get("sid"))
     if not user_id or not session_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    user_session = db.scalar(select(UserSession).where(cast(UserSession.id, String) == str(UUID(session_id))))
+    # Tokens minted before claims were added fall through to the database path.
+    if settings.auth_stateless and "perm" in payload:
+        return _stateless_auth_context(payload, user_id=user_id, session_id=session_id)
+
+    cached = auth_context_cache.get(session_id)
+    if cached is not None and cached.user.id == user_id:
+        return cached
+
+    user_session = await get_by_uuid(db, UserSession, session_id)
     if not user_session or user_session.revoked_at is not None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session is not active")
 
-    user = db.scalar(select(User).where(cast(User.id, String) == str(UUID(user_id))))
+    user = await get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     if user.status != "ACTIVE":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not active")
 
-    return AuthContext(user=user, session=user_session)
+    auth = AuthContext(user=user, session=user_session, permissions=permissions_for_role(user.role))
+    auth_context_cache.set(auth)
+    return auth
+
+
+async def get_auth_context(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> AuthContext:
+    auth = await _resolve_auth_context(credentials, db)
+    record_request_activity(
+        auth.session.id,
+        ip=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
+    return auth
+
+
+async def get_auth_context_untracked(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> AuthContext:
+    """Authenticate like ``get_auth_context`` without recording activity on the session.
+
+    For endpoints that promise not to tie a request to its poster: a last-seen
+    time and IP on the session would do exactly that.
+    """
+    return await _resolve_auth_context(credentials, db)
 
 
-def get_current_user(auth: AuthContext = Depends(get_auth_context)) -> User:
+async def get_current_user(auth: AuthContext = Depends(get_auth_context)) -> User:
     return auth.user
 
 
 class RequireRole:
     def __init__(self, allowed_roles: list[str]) -> None:
         self.allowed_roles = allowed_roles
+        self.required_permissions = permission_mask(allowed_roles)
 
-    def __call__(self, auth: AuthContext = Depends(get_auth_context)) -> AuthContext:
-        email = auth.user.email.lower()
-        role = "faculty"
-        if "admin" in email:
-            role = "admin"
-        elif "dean" in email:
-            role = "dean"
-        elif "hod" in email:
-            role = "hod"
-        elif "coord" in email:
-            role = "coordinator"
-
-        if role not in self.allowed_roles:
+    async def __call__(self, auth: AuthContext = Depends(get_auth_context)) -> AuthContext:
+        if not auth.permissions & self.required_permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Requires one of: {', '.join(self.allowed_roles)}",
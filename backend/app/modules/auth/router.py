@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.db.session import get_db
@@ -61,17 +61,17 @@ def _clear_auth_cookies(response: Response) -> None:
 
 
 @auth_router.post("/register", response_model=RegisterResponse, status_code=201)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> RegisterResponse:
-    user = AuthService.register_user(db, email=payload.email, password=payload.password, department=payload.department)
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db)) -> RegisterResponse:
+    user = await AuthService.register_user(db, email=payload.email, password=payload.password, department=payload.department)
     return RegisterResponse(id=str(user.id), email=user.email, status=user.status)
 
 
 @auth_router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, request: Request, response: Response, db: Session = Depends(get_db)) -> TokenResponse:
+async def login(payload: LoginRequest, request: Request, response: Response, db: AsyncSession = Depends(get_db)) -> TokenResponse:
     ip = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    access_token, refresh_token, _ = AuthService.login_user(
+    access_token, refresh_token, _ = await AuthService.login_user(
         db,
         email=payload.email,
         password=payload.password,
@@ -84,7 +84,7 @@ def login(payload: LoginRequest, request: Request, response: Response, db: Sessi
 
 
 @auth_router.post("/refresh", response_model=TokenResponse)
-def refresh(request: Request, response: Response, db: Session = Depends(get_db)) -> TokenResponse:
+async def refresh(request: Request, response: Response, db: AsyncSession = Depends(get_db)) -> TokenResponse:
     refresh_token_raw = request.cookies.get(REFRESH_COOKIE_NAME)
     if not refresh_token_raw:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing refresh token")
@@ -92,7 +92,7 @@ def refresh(request: Request, response: Response, db: Session = Depends(get_db))
     ip = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    access_token, new_refresh_token = AuthService.refresh_tokens(
+    access_token, new_refresh_token = await AuthService.refresh_tokens(
         db,
         refresh_token_raw=refresh_token_raw,
         ip=ip,
@@ -104,24 +104,26 @@ def refresh(request: Request, response: Response, db: Session = Depends(get_db))
 
 
 @auth_router.post("/logout")
-def logout(
+async def logout(
     response: Response,
     all_devices: bool = False,
     auth: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    AuthService.logout(db, user_id=auth.user.id, session_id=auth.session.id, all_devices=all_devices)
+    await AuthService.logout(db, user_id=auth.user.id, session_id=auth.session.id, all_devices=all_devices)
     _clear_auth_cookies(response)
     return {"detail": "Logged out"}
 
 
 @auth_router.get("/me", response_model=MeResponse)
-def me(user: User = Depends(get_current_user)) -> MeResponse:
-    return MeResponse(id=str(user.id), email=user.email, status=user.status, department=user.department)
+async def me(user: User = Depends(get_current_user)) -> MeResponse:
+    return MeResponse(
+        id=str(user.id), email=user.email, status=user.status, department=user.department, role=user.role
+    )
 
 
 @protected_router.get("/protected")
-def protected(auth: AuthContext = Depends(get_auth_context)) -> dict[str, str]:
+async def protected(auth: AuthContext = Depends(get_auth_context)) -> dict[str, str]:
     return {"message": "Protected route success", "user_id": str(auth.user.id), "session_id": str(auth.session.id)}
 
 
@@ -129,12 +131,12 @@ from app.modules.auth.schemas import ForgotPasswordRequest, ResetPasswordRequest
 
 
 @auth_router.post("/forgot-password")
-def forgot_password(payload: ForgotPasswordRequest, db: Session = Depends(get_db)) -> dict[str, str]:
-    AuthService.request_password_reset(db, email=payload.email)
+async def forgot_password(payload: ForgotPasswordRequest, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+    await AuthService.request_password_reset(db, email=payload.email)
     return {"detail": "If your email is registered, you will receive a password reset link shortly."}
 
 
 @auth_router.post("/reset-password")
-def reset_password(payload: ResetPasswordRequest, db: Session = Depends(get_db)) -> dict[str, str]:
-    AuthService.reset_password(db, token=payload.token, new_password=payload.new_password)
+async def reset_password(payload: ResetPasswordRequest, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+    await AuthService.reset_password(db, token=payload.token, new_password=payload.new_password)
     return {"detail": "Password has been successfully reset."}
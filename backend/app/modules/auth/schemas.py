@@ -27,6 +27,7 @@ class MeResponse(BaseModel):
     email: EmailStr
     status: str
     department: Optional[str] = None
+    role: Optional[str] = None
 
 
 class RegisterResponse(BaseModel):
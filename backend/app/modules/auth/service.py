@@ -1,26 +1,34 @@
 import secrets
-from datetime import timedelta
-from typing import Optional, Union
-from uuid import UUID
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import NoReturn, Optional, Union
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import String, cast, select, update
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Row, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.password_pool import password_hash_pool
+from app.core.permissions import permissions_for_role, role_from_email
 from app.core.security import (
     create_access_token,
     generate_refresh_token,
-    hash_password,
     hash_refresh_token,
     normalize_email,
     now_utc,
-    verify_password,
+    password_needs_rehash,
 )
+from app.db.ids import get_by_uuid
 from app.models.password_reset import PasswordResetToken
 from app.models.refresh_token import RefreshToken
 from app.models.session import Session as UserSession
+from app.models.session_revocation import SessionRevocation
 from app.models.user import User
+from app.modules.auth.activity import record_refresh_activity
+from app.modules.auth.cache import auth_context_cache
+from app.modules.auth.denylist import revocation_denylist
 from app.utils.email import send_password_reset_email
 
 settings = get_settings()
@@ -28,29 +36,65 @@ settings = get_settings()
 
 class AuthService:
     @staticmethod
-    def _get_user_by_id(db: Session, user_id: Union[UUID, str]) -> Optional[User]:
-        return db.scalar(select(User).where(cast(User.id, String) == str(user_id)))
+    async def _get_user_by_id(db: AsyncSession, user_id: Union[UUID, str]) -> Optional[User]:
+        return await get_by_uuid(db, User, user_id)
 
     @staticmethod
-    def _get_session_by_id(db: Session, session_id: Union[UUID, str]) -> Optional[UserSession]:
-        return db.scalar(select(UserSession).where(cast(UserSession.id, String) == str(session_id)))
+    async def _get_session_by_id(db: AsyncSession, session_id: Union[UUID, str]) -> Optional[UserSession]:
+        return await get_by_uuid(db, UserSession, session_id)
 
     @staticmethod
-    def register_user(db: Session, *, email: str, password: str, department: Optional[str] = None) -> User:
+    def access_claims(user: Union[User, Row]) -> dict[str, object]:
+        """Claims that let stateless verification (AUTH_STATELESS) skip the user lookup.
+
+        ``perm`` is the role's permission bitset, resolved once here rather than per request.
+        """
+        return {
+            "email": user.email,
+            "dept": user.department,
+            "status": user.status,
+            "role": user.role,
+            "perm": permissions_for_role(user.role),
+        }
+
+    @staticmethod
+    def forget_user(user_id: UUID) -> None:
+        """Drop this process's cached contexts for a user whose status or lock state changed."""
+        auth_context_cache.invalidate_user(user_id)
+
+    @staticmethod
+    def forget_sessions(session_ids: Iterable[UUID], *, user_id: Optional[UUID] = None) -> None:
+        """Make revoked sessions unusable in this process straight away."""
+        session_ids = list(session_ids)
+        if settings.auth_stateless:
+            revocation_denylist.add(session_ids)
+        if user_id is not None:
+            auth_context_cache.invalidate_user(user_id)
+        for session_id in session_ids:
+            auth_context_cache.invalidate_session(session_id)
+
+    @staticmethod
+    async def register_user(db: AsyncSession, *, email: str, password: str, department: Optional[str] = None) -> User:
         normalized_email = normalize_email(email)
-        existing = db.scalar(select(User).where(User.email == normalized_email))
+        existing = await db.scalar(select(User).where(User.email == normalized_email))
         if existing:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
-        user = User(email=normalized_email, password_hash=hash_password(password), department=department)
+        password_hash = await password_hash_pool.hash_password(password)
+        user = User(
+            email=normalized_email,
+            password_hash=password_hash,
+            department=department,
+            role=role_from_email(normalized_email).value,
+        )
         db.add(user)
-        db.commit()
+        await db.commit()
         return user
 
     @staticmethod
-    def login_user(db: Session, *, email: str, password: str, ip: Optional[str], user_agent: Optional[str]) -> tuple:
+    async def login_user(db: AsyncSession, *, email: str, password: str, ip: Optional[str], user_agent: Optional[str]) -> tuple:
         normalized_email = normalize_email(email)
-        user = db.scalar(select(User).where(User.email == normalized_email))
+        user = await db.scalar(select(User).where(User.email == normalized_email))
 
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
@@ -58,17 +102,22 @@ class AuthService:
         if user.status != "ACTIVE":
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is not active")
 
-        if not verify_password(password, user.password_hash):
+        if not await password_hash_pool.verify_password(password, user.password_hash):
             user.failed_login_count += 1
-            db.commit()
+            await db.commit()
+            AuthService.forget_user(user.id)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+        lock_state_changed = user.failed_login_count != 0 or user.locked_until is not None
         user.failed_login_count = 0
         user.locked_until = None
+        # Upgrade hashes made under older Argon2 parameters while we hold the plaintext.
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = await password_hash_pool.hash_password(password)
 
         user_session = UserSession(user_id=user.id, ip=ip, user_agent=user_agent)
         db.add(user_session)
-        db.flush()
+        await db.flush()
 
         refresh_token_raw = generate_refresh_token()
         refresh_token_record = RefreshToken(
@@ -79,123 +128,200 @@ class AuthService:
         )
         db.add(refresh_token_record)
 
-        access_token = create_access_token(user_id=str(user.id), session_id=str(user_session.id))
+        access_token = create_access_token(
+            user_id=str(user.id),
+            session_id=str(user_session.id),
+            claims=AuthService.access_claims(user),
+        )
 
-        db.commit()
+        await db.commit()
+        if lock_state_changed:
+            AuthService.forget_user(user.id)
 
         return access_token, refresh_token_raw, user
 
     @staticmethod
-    def refresh_tokens(db: Session, *, refresh_token_raw: str, ip: Optional[str], user_agent: Optional[str]) -> tuple:
+    async def refresh_tokens(db: AsyncSession, *, refresh_token_raw: str, ip: Optional[str], user_agent: Optional[str]) -> tuple:
         token_hash = hash_refresh_token(refresh_token_raw)
-        token_record = db.scalar(
-            select(RefreshToken).where(RefreshToken.token_hash == token_hash).with_for_update()
-        )
-
-        if not token_record:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
         now = now_utc()
+        new_refresh_token_raw = generate_refresh_token()
 
-        if token_record.revoked_at is not None:
-            AuthService.revoke_session(db, session_id=token_record.session_id)
-            db.commit()
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token reuse detected. Please login again")
-
-        if token_record.expires_at <= now:
-            db.execute(
-                update(RefreshToken)
-                .where(cast(RefreshToken.id, String) == str(token_record.id))
-                .values(revoked_at=now)
-            )
-            db.commit()
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
-
-        user_session = AuthService._get_session_by_id(db, token_record.session_id)
-        if not user_session or user_session.revoked_at is not None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session is not active")
-
-        user = AuthService._get_user_by_id(db, token_record.user_id)
-        if not user or user.status != "ACTIVE":
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not active")
-
-        db.execute(
+        # Revoke the presented token only if it, its session and its user are all still
+        # valid; the row lock taken by the UPDATE serialises concurrent rotations.
+        rotated = (
             update(RefreshToken)
-            .where(cast(RefreshToken.id, String) == str(token_record.id))
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+                UserSession.id == RefreshToken.session_id,
+                UserSession.revoked_at.is_(None),
+                User.id == RefreshToken.user_id,
+                User.status == "ACTIVE",
+            )
             .values(revoked_at=now)
+            .returning(
+                RefreshToken.id,
+                RefreshToken.session_id,
+                RefreshToken.user_id,
+                User.email,
+                User.department,
+                User.status,
+                User.role,
+            )
+            .cte("rotated")
         )
+        issued = insert(RefreshToken).from_select(
+            ["id", "session_id", "user_id", "token_hash", "expires_at", "rotated_from"],
+            select(
+                literal(uuid4(), RefreshToken.id.type),
+                rotated.c.session_id,
+                rotated.c.user_id,
+                literal(hash_refresh_token(new_refresh_token_raw), RefreshToken.token_hash.type),
+                literal(now + timedelta(days=settings.refresh_token_ttl_days), RefreshToken.expires_at.type),
+                rotated.c.id,
+            ),
+        ).cte("issued")
+
+        rotation = (
+            await db.execute(
+                select(
+                    rotated.c.session_id,
+                    rotated.c.user_id,
+                    rotated.c.email,
+                    rotated.c.department,
+                    rotated.c.status,
+                    rotated.c.role,
+                ).add_cte(issued)
+            )
+        ).first()
+        if rotation is None:
+            await AuthService._reject_refresh(db, token_hash=token_hash, now=now)
 
-        new_refresh_token_raw = generate_refresh_token()
-        new_refresh_token = RefreshToken(
-            session_id=token_record.session_id,
-            user_id=token_record.user_id,
-            token_hash=hash_refresh_token(new_refresh_token_raw),
-            expires_at=now + timedelta(days=settings.refresh_token_ttl_days),
-            rotated_from=token_record.id,
+        access_token = create_access_token(
+            user_id=str(rotation.user_id),
+            session_id=str(rotation.session_id),
+            claims=AuthService.access_claims(rotation),
         )
-        db.add(new_refresh_token)
 
-        session_updates: dict[str, object] = {"last_seen_at": now}
-        if ip:
-            session_updates["ip"] = ip
-        if user_agent:
-            session_updates["user_agent"] = user_agent
+        await record_refresh_activity(db, rotation.session_id, seen_at=now, ip=ip, user_agent=user_agent)
+        await db.commit()
+        return access_token, new_refresh_token_raw
 
-        db.execute(
-            update(UserSession)
-            .where(cast(UserSession.id, String) == str(token_record.session_id))
-            .values(**session_updates)
-        )
+    @staticmethod
+    async def _reject_refresh(db: AsyncSession, *, token_hash: str, now: datetime) -> NoReturn:
+        """Explain why a rotation matched nothing, applying reuse and expiry side effects."""
+        token = (
+            await db.execute(
+                select(
+                    RefreshToken.id,
+                    RefreshToken.session_id,
+                    RefreshToken.revoked_at,
+                    RefreshToken.expires_at,
+                    UserSession.revoked_at.label("session_revoked_at"),
+                    User.status.label("user_status"),
+                )
+                .join(UserSession, UserSession.id == RefreshToken.session_id)
+                .join(User, User.id == RefreshToken.user_id)
+                .where(RefreshToken.token_hash == token_hash)
+            )
+        ).first()
 
-        access_token = create_access_token(
-            user_id=str(token_record.user_id),
-            session_id=str(token_record.session_id),
-        )
+        if not token:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
-        db.commit()
-        return access_token, new_refresh_token_raw
+        if token.revoked_at is not None:
+            await AuthService.revoke_session(db, session_id=token.session_id)
+            await db.commit()
+            AuthService.forget_sessions([token.session_id])
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token reuse detected. Please login again")
+
+        if token.expires_at <= now:
+            await db.execute(update(RefreshToken).where(RefreshToken.id == token.id).values(revoked_at=now))
+            await db.commit()
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
+
+        if token.session_revoked_at is not None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session is not active")
+
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not active")
 
     @staticmethod
-    def revoke_session(db: Session, *, session_id: UUID) -> None:
+    async def revoke_session(db: AsyncSession, *, session_id: UUID) -> None:
+        """Revoke a session and its refresh tokens in ``db``'s transaction.
+
+        The caller commits, then calls ``forget_sessions``: evicting first would
+        let a concurrent request re-cache the session before the revocation lands.
+        """
         now = now_utc()
-        db.execute(
+        await db.execute(
             update(UserSession)
-            .where(cast(UserSession.id, String) == str(session_id), UserSession.revoked_at.is_(None))
+            .where(UserSession.id == session_id, UserSession.revoked_at.is_(None))
             .values(revoked_at=now)
         )
-        db.execute(
+        await db.execute(
             update(RefreshToken)
-            .where(cast(RefreshToken.session_id, String) == str(session_id), RefreshToken.revoked_at.is_(None))
+            .where(RefreshToken.session_id == session_id, RefreshToken.revoked_at.is_(None))
             .values(revoked_at=now)
         )
 
     @staticmethod
-    def logout(db: Session, *, user_id: UUID, session_id: UUID, all_devices: bool) -> None:
+    async def logout(db: AsyncSession, *, user_id: UUID, session_id: UUID, all_devices: bool) -> None:
         now = now_utc()
 
         if all_devices:
-            db.execute(
-                update(UserSession)
-                .where(cast(UserSession.user_id, String) == str(user_id), UserSession.revoked_at.is_(None))
-                .values(revoked_at=now)
-            )
-
-            db.execute(
+            revoked_session_ids = (
+                await db.scalars(
+                    update(UserSession)
+                    .where(UserSession.user_id == user_id, UserSession.revoked_at.is_(None))
+                    .values(revoked_at=now)
+                    .returning(UserSession.id)
+                )
+            ).all()
+
+            await db.execute(
                 update(RefreshToken)
-                .where(cast(RefreshToken.user_id, String) == str(user_id), RefreshToken.revoked_at.is_(None))
+                .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
                 .values(revoked_at=now)
             )
 
-            db.commit()
+            await db.commit()
+            AuthService.forget_sessions(revoked_session_ids, user_id=user_id)
             return
 
-        AuthService.revoke_session(db, session_id=session_id)
-        db.commit()
+        await AuthService.revoke_session(db, session_id=session_id)
+        await db.commit()
+        AuthService.forget_sessions([session_id])
 
     @staticmethod
-    def request_password_reset(db: Session, *, email: str) -> None:
+    async def delete_user(db: AsyncSession, *, user: User) -> None:
+        """Delete a user, whose sessions and refresh tokens go with it by cascade.
+
+        The cascade also removes the ``sessions.revoked_at`` that other workers'
+        denylists sync from, so the live sessions are recorded in
+        ``session_revocations`` in the same transaction.
+        """
+        now = now_utc()
+        revoked_session_ids = (
+            await db.scalars(
+                insert(SessionRevocation)
+                .from_select(
+                    ["id", "revoked_at"],
+                    select(UserSession.id, literal(now)).where(
+                        UserSession.user_id == user.id, UserSession.revoked_at.is_(None)
+                    ),
+                )
+                .returning(SessionRevocation.id)
+            )
+        ).all()
+        await db.delete(user)
+        await db.commit()
+        AuthService.forget_sessions(revoked_session_ids, user_id=user.id)
+
+    @staticmethod
+    async def request_password_reset(db: AsyncSession, *, email: str) -> None:
         normalized_email = normalize_email(email)
-        user = db.scalar(select(User).where(User.email == normalized_email))
+        user = await db.scalar(select(User).where(User.email == normalized_email))
         
         # We always return success to prevent email enumeration
         if not user or user.status != "ACTIVE":
@@ -213,15 +339,15 @@ class AuthService:
             expires_at=expires_at,
         )
         db.add(reset_token)
-        db.commit()
+        await db.commit()
         
-        send_password_reset_email(to_email=user.email, reset_token=token_raw)
+        await run_in_threadpool(send_password_reset_email, to_email=user.email, reset_token=token_raw)
 
     @staticmethod
-    def reset_password(db: Session, *, token: str, new_password: str) -> None:
+    async def reset_password(db: AsyncSession, *, token: str, new_password: str) -> None:
         token_hash = hash_refresh_token(token)
         
-        reset_record = db.scalar(
+        reset_record = await db.scalar(
             select(PasswordResetToken)
             .where(PasswordResetToken.token_hash == token_hash)
             .with_for_update()
@@ -234,16 +360,13 @@ class AuthService:
         if reset_record.expires_at <= now:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Reset token has expired")
             
-        user = AuthService._get_user_by_id(db, reset_record.user_id)
+        user = await AuthService._get_user_by_id(db, reset_record.user_id)
         if not user or user.status != "ACTIVE":
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User account is not active")
             
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await password_hash_pool.hash_password(new_password)
         reset_record.used = True
         
-        # Revoke all existing sessions to force user to re-login with new password
-        AuthService.logout(db, user_id=user.id, session_id=None, all_devices=True)
-        # Note: the above commits to db internally using the condition that we passed all_devices=True
-        # Wait, our `logout` method commits but doing it like this is safe.
-        
-        db.commit()
+        # Revoke all existing sessions to force user to re-login with new password;
+        # logout commits the new hash and the used token along with the revocation.
+        await AuthService.logout(db, user_id=user.id, session_id=None, all_devices=True)
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import delete, or_, select
+
+from app.core.config import get_settings
+from app.core.security import now_utc
+from app.db.session import AsyncSessionLocal
+from app.models.password_reset import PasswordResetToken
+from app.models.refresh_token import RefreshToken
+from app.models.session import Session as UserSession
+from app.models.session_revocation import SessionRevocation
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_sweeper_task: Optional[asyncio.Task] = None
+
+
+async def _delete_in_batches(model: Any, condition: Any, *, batch_size: int, pause_seconds: float) -> int:
+    """Delete rows matching ``condition`` ``batch_size`` at a time, committing each batch.
+
+    Short transactions keep row locks and WAL bursts small, and SKIP LOCKED
+    lets the sweep step around rows a live request is touching.
+    """
+    deleted = 0
+    while True:
+        victims = select(model.id).where(condition).limit(batch_size).with_for_update(skip_locked=True)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(delete(model).where(model.id.in_(victims)))
+            await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+        await asyncio.sleep(pause_seconds)
+
+
+async def sweep_expired(
+    *,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+) -> dict[str, Any]:
+    """Delete expired or revoked auth rows past their retention window; returns rows reclaimed."""
+    now = now or now_utc()
+    batch_size = batch_size or settings.sweeper_batch_size
+    pause_seconds = settings.sweeper_batch_pause_seconds if pause_seconds is None else pause_seconds
+    started = time.perf_counter()
+
+    token_cutoff = now - timedelta(days=settings.refresh_token_retention_days)
+    session_cutoff = now - timedelta(days=settings.session_retention_days)
+    # A session nobody has refreshed for longer than a refresh token lives is dead as of
+    # last_seen_at + TTL; like a revoked one it is then kept for the session retention
+    # window (login history), so it goes once last_seen_at is older than TTL + retention.
+    dead_cutoff = now - timedelta(days=settings.refresh_token_ttl_days)
+    idle_cutoff = dead_cutoff - timedelta(days=settings.session_retention_days)
+    reset_cutoff = now - timedelta(days=settings.password_reset_retention_days)
+    # Once every access token issued for a deleted session has expired, the denylist no longer needs it.
+    revocation_cutoff = now - timedelta(minutes=settings.access_token_ttl_minutes)
+
+    report: dict[str, Any] = {
+        "refresh_tokens": await _delete_in_batches(
+            RefreshToken,
+            or_(RefreshToken.expires_at < token_cutoff, RefreshToken.revoked_at < token_cutoff),
+            batch_size=batch_size,
+            pause_seconds=pause_seconds,
+        ),
+        "sessions": await _delete_in_batches(
+            UserSession,
+            or_(UserSession.revoked_at < session_cutoff, UserSession.last_seen_at < idle_cutoff),
+            batch_size=batch_size,
+            pause_seconds=pause_seconds,
+        ),
+        "password_reset_tokens": await _delete_in_batches(
+            PasswordResetToken,
+            PasswordResetToken.expires_at < reset_cutoff,
+            batch_size=batch_size,
+            pause_seconds=pause_seconds,
+        ),
+        "session_revocations": await _delete_in_batches(
+            SessionRevocation,
+            SessionRevocation.revoked_at < revocation_cutoff,
+            batch_size=batch_size,
+            pause_seconds=pause_seconds,
+        ),
+    }
+    report["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("Expiry sweep finished", extra={"reclaimed": report})
+    return report
+
+
+async def _run_forever() -> None:
+    while True:
+        try:
+            await sweep_expired()
+        except Exception:
+            logger.exception("Expiry sweep failed")
+        await asyncio.sleep(settings.sweeper_interval_seconds)
+
+
+def start_sweeper() -> None:
+    global _sweeper_task
+    if settings.sweeper_enabled and _sweeper_task is None:
+        _sweeper_task = asyncio.create_task(_run_forever())
+
+
+async def stop_sweeper() -> None:
+    global _sweeper_task
+    if _sweeper_task is None:
+        return
+    _sweeper_task.cancel()
+    try:
+        await _sweeper_task
+    except asyncio.CancelledError:
+        pass
+    _sweeper_task = None
@@ -0,0 +1,40 @@
+import asyncio
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.enums import DashboardWidget
+from app.modules.auth.dependencies import AuthContext, get_auth_context
+from app.modules.dashboard.schemas import DashboardOverviewResponse
+from app.modules.insights.cache import cached_insight
+from app.modules.insights.service import InsightsService
+
+dashboard_router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@dashboard_router.get("/overview", response_model=DashboardOverviewResponse, response_model_exclude_none=True)
+async def dashboard_overview(
+    widgets: list[DashboardWidget] = Query(default=list(DashboardWidget)),
+    top_limit: int = Query(5, ge=1, le=500),
+    auth: AuthContext = Depends(get_auth_context),
+) -> DashboardOverviewResponse:
+    """Every dashboard widget in one round trip; ``widgets`` selects a subset.
+
+    Authentication happens once, and the selected widgets are computed
+    concurrently, each on its own session and through the insights cache, so
+    they return the same data as the per-widget endpoints.
+    """
+    computations = {
+        DashboardWidget.SUMMARY: lambda: cached_insight("dashboard_stats", auth, InsightsService.dashboard_stats),
+        DashboardWidget.TOP_PERFORMERS: lambda: cached_insight(
+            "top_performers",
+            auth,
+            partial(InsightsService.top_performers, limit=top_limit),
+            params=(top_limit, None, None),
+        ),
+        DashboardWidget.WEEKLY_TREND: lambda: cached_insight("weekly_trend", auth, InsightsService.weekly_trend),
+        DashboardWidget.DISTRIBUTION: lambda: cached_insight("distribution", auth, InsightsService.distribution),
+    }
+    selected = list(dict.fromkeys(widgets))
+    results = await asyncio.gather(*(computations[widget]() for widget in selected))
+    return DashboardOverviewResponse(**{widget.value: result for widget, result in zip(selected, results)})
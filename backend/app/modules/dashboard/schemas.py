@@ -0,0 +1,17 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.modules.insights.schemas import (
+    DashboardStatsResponse,
+    DistributionResponse,
+    TopPerformerResponse,
+    WeeklyTrendResponse,
+)
+
+
+class DashboardOverviewResponse(BaseModel):
+    summary: Optional[DashboardStatsResponse] = None
+    topPerformers: Optional[list[TopPerformerResponse]] = None
+    weeklyTrend: Optional[list[WeeklyTrendResponse]] = None
+    distribution: Optional[DistributionResponse] = None
@@ -1,10 +1,14 @@
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import Projection
+from app.db.search import text_search
 from app.db.session import get_db
 from app.models.event import Event
 from app.modules.auth.dependencies import AuthContext, get_auth_context
@@ -43,26 +47,44 @@ def _to_out(e: Event) -> dict:
     }
 
 
+# The fields of _to_out, for sparse ``fields=`` lists.
+EVENT_FIELDS = Projection(
+    {
+        "id": Event.id,
+        "eventName": Event.event_name,
+        "roomNumber": Event.room_number,
+        "date": Event.date,
+        "timeSlot": Event.time_slot,
+        "bookedBy": Event.booked_by,
+        "status": Event.status,
+    }
+)
+
+
 @events_router.get("")
-def list_events(
+async def list_events(
     search: str = Query(default=""),
+    fields: Optional[str] = Query(default=None),
     auth: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    query = db.query(Event).order_by(Event.created_at.desc())
-    if search:
-        term = f"%{search}%"
-        query = query.filter(
-            Event.event_name.ilike(term) | Event.room_number.ilike(term)
-        )
-    return [_to_out(e) for e in query.all()]
+    try:
+        names = EVENT_FIELDS.parse(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    query = EVENT_FIELDS.select(names)
+    matches = text_search(search, Event.event_name, Event.room_number)
+    if matches is not None:
+        query = query.where(matches.condition).order_by(matches.rank)
+    query = query.order_by(Event.created_at.desc())
+    return EVENT_FIELDS.rows((await db.execute(query)).all(), names)
 
 
 @events_router.post("", status_code=201)
-def create_event(
+async def create_event(
     body: EventCreate,
     auth: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     event = Event(
         event_name=body.eventName,
@@ -74,22 +96,22 @@ def create_event(
         created_at=datetime.now(timezone.utc),
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
     logger.info(f"Created event: {event.id}")
     return _to_out(event)
 
 
 @events_router.delete("/{event_id}")
-def delete_event(
+async def delete_event(
     event_id: str,
     auth: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.scalar(select(Event).where(Event.id == event_id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
     logger.info(f"Deleted event: {event_id}")
     return {"detail": "Deleted"}
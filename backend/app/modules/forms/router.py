@@ -2,10 +2,12 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import Projection, isoformat_or_blank
 from app.db.session import get_db
 from app.models.form import FormDefinition
 from app.modules.auth.dependencies import get_current_user
@@ -52,20 +54,21 @@ class FormOut(BaseModel):
         from_attributes = True
 
 
-def _to_out(form: FormDefinition) -> dict:
-    semester: Union[str, int] = form.target_semester
+def _target_semester(semester: Optional[str]) -> Union[str, int]:
     try:
-        semester = int(form.target_semester)
+        return int(semester)
     except (TypeError, ValueError):
-        semester = form.target_semester or "all"
+        return semester or "all"
+
 
+def _to_out(form: FormDefinition) -> dict:
     return {
         "id": form.id,
         "title": form.title,
         "description": form.description,
         "fields": form.fields or [],
         "targetCourse": form.target_course,
-        "targetSemester": semester,
+        "targetSemester": _target_semester(form.target_semester),
         "createdBy": form.created_by,
         "createdAt": form.created_at.isoformat() if form.created_at else "",
         "deadline": form.deadline.isoformat() if form.deadline else "",
@@ -83,16 +86,37 @@ def _parse_deadline(deadline: str) -> datetime:
     return parsed
 
 
+# The fields of _to_out, for sparse ``fields=`` lists.
+FORM_FIELDS = Projection(
+    {
+        "id": FormDefinition.id,
+        "title": FormDefinition.title,
+        "description": FormDefinition.description,
+        "fields": (FormDefinition.fields, lambda form_fields: form_fields or []),
+        "targetCourse": FormDefinition.target_course,
+        "targetSemester": (FormDefinition.target_semester, _target_semester),
+        "createdBy": FormDefinition.created_by,
+        "createdAt": (FormDefinition.created_at, isoformat_or_blank),
+        "deadline": (FormDefinition.deadline, isoformat_or_blank),
+        "isActive": FormDefinition.is_active,
+    }
+)
+
+
 @forms_router.get("")
-def list_forms(db: Session = Depends(get_db)):
-    forms = db.query(FormDefinition).order_by(FormDefinition.created_at.desc()).all()
-    return [_to_out(f) for f in forms]
+async def list_forms(fields: Optional[str] = Query(default=None), db: AsyncSession = Depends(get_db)):
+    try:
+        names = FORM_FIELDS.parse(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    rows = (await db.execute(FORM_FIELDS.select(names).order_by(FormDefinition.created_at.desc()))).all()
+    return FORM_FIELDS.rows(rows, names)
 
 
 @forms_router.post("", status_code=201)
-def create_form(
+async def create_form(
     body: FormCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     form = FormDefinition(
@@ -107,38 +131,38 @@ def create_form(
         is_active=body.isActive,
     )
     db.add(form)
-    db.commit()
-    db.refresh(form)
+    await db.commit()
+    await db.refresh(form)
     logger.info("Created form %s", form.id)
     return _to_out(form)
 
 
 @forms_router.get("/{form_id}")
-def get_form(form_id: str, db: Session = Depends(get_db)):
-    form = db.query(FormDefinition).filter(FormDefinition.id == form_id).first()
+async def get_form(form_id: str, db: AsyncSession = Depends(get_db)):
+    form = await db.scalar(select(FormDefinition).where(FormDefinition.id == form_id))
     if not form:
         raise HTTPException(status_code=404, detail="Form not found")
     return _to_out(form)
 
 
 @forms_router.put("/{form_id}/toggle")
-def toggle_form(form_id: str, db: Session = Depends(get_db)):
-    form = db.query(FormDefinition).filter(FormDefinition.id == form_id).first()
+async def toggle_form(form_id: str, db: AsyncSession = Depends(get_db)):
+    form = await db.scalar(select(FormDefinition).where(FormDefinition.id == form_id))
     if not form:
         raise HTTPException(status_code=404, detail="Form not found")
     form.is_active = not form.is_active
-    db.commit()
-    db.refresh(form)
+    await db.commit()
+    await db.refresh(form)
     logger.info("Toggled form %s to %s", form_id, form.is_active)
     return _to_out(form)
 
 
 @forms_router.delete("/{form_id}")
-def delete_form(form_id: str, db: Session = Depends(get_db)):
-    form = db.query(FormDefinition).filter(FormDefinition.id == form_id).first()
+async def delete_form(form_id: str, db: AsyncSession = Depends(get_db)):
+    form = await db.scalar(select(FormDefinition).where(FormDefinition.id == form_id))
     if not form:
         raise HTTPException(status_code=404, detail="Form not found")
-    db.delete(form)
-    db.commit()
+    await db.delete(form)
+    await db.commit()
     logger.info("Deleted form %s", form_id)
     return {"detail": "Deleted"}
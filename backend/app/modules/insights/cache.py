@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.modules.insights.service import CACHE_TTL_SECONDS
+
+if TYPE_CHECKING:
+    from app.modules.auth.dependencies import AuthContext
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class InsightsResponseCache:
+    """Bounded LRU of computed insights responses with stale-while-revalidate.
+
+    A fresh entry is returned as is. An entry past its TTL but inside the
+    stale window is still returned, and one background task recomputes it.
+    Concurrent misses for a key share a single computation. Values whose JSON
+    form exceeds ``max_entry_bytes`` are returned but not cached.
+    """
+
+    def __init__(self, *, enabled: bool, stale_seconds: float, max_entries: int, max_entry_bytes: int) -> None:
+        self.enabled = enabled and max_entries > 0
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.oversized = 0
+        self.total_refresh_seconds = 0.0
+        self.max_refresh_seconds = 0.0
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[T]], *, ttl: float) -> T:
+        if not self.enabled:
+            return await compute()
+
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self._start(key, compute, ttl).add_done_callback(self._log_background_failure)
+            return entry.value
+
+        self.misses += 1
+        task = self._inflight.get(key) or self._start(key, compute, ttl)
+        return await asyncio.shield(task)
+
+    def _start(self, key: Hashable, compute: Callable[[], Awaitable[T]], ttl: float) -> asyncio.Task:
+        task = asyncio.create_task(self._refresh(key, compute, ttl))
+        self._inflight[key] = task
+        return task
+
+    async def _refresh(self, key: Hashable, compute: Callable[[], Awaitable[T]], ttl: float) -> T:
+        started = time.perf_counter()
+        try:
+            value = await compute()
+        except Exception:
+            self.refresh_failures += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        elapsed = time.perf_counter() - started
+        self.refreshes += 1
+        self.total_refresh_seconds += elapsed
+        self.max_refresh_seconds = max(self.max_refresh_seconds, elapsed)
+        self._store(key, value, ttl)
+        return value
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        if len(to_json(value)) > self.max_entry_bytes:
+            self.oversized += 1
+            self._entries.pop(key, None)
+            return
+        now = time.monotonic()
+        self._entries[key] = _Entry(value=value, fresh_until=now + ttl, stale_until=now + ttl + self.stale_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Insights cache refresh failed", exc_info=task.exception())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "oversized": self.oversized,
+            "refreshing": len(self._inflight),
+            "avg_refresh_ms": round(self.total_refresh_seconds / (self.refreshes or 1) * 1000, 3),
+            "max_refresh_ms": round(self.max_refresh_seconds * 1000, 3),
+        }
+
+
+insights_cache = InsightsResponseCache(
+    enabled=settings.insights_cache_enabled,
+    stale_seconds=settings.insights_cache_stale_seconds,
+    max_entries=settings.insights_cache_max_entries,
+    max_entry_bytes=settings.insights_cache_max_entry_bytes,
+)
+
+
+async def cached_insight(
+    name: str,
+    auth: "AuthContext",
+    compute: Callable[[AsyncSession], Awaitable[T]],
+    *,
+    params: tuple = (),
+) -> T:
+    """Serve ``compute`` through ``insights_cache`` under ``name``'s TTL.
+
+    The key covers the query parameters and the caller's department scope.
+    ``compute`` gets its own database session, because a background refresh
+    can outlive the request that triggered it.
+    """
+    async def run() -> T:
+        async with AsyncSessionLocal() as db:
+            return await compute(db)
+
+    key = (name, auth.user.department, *params)
+    return await insights_cache.get_or_compute(key, run, ttl=CACHE_TTL_SECONDS[name])
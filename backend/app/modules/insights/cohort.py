@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attendance import AttendanceRecord
+from app.models.student import Student
+
+# Upper edges of the percentage bands reported per course; the last band is open-ended.
+DISTRIBUTION_BAND_EDGES = np.array([50.0, 65.0, 75.0, 90.0])
+DISTRIBUTION_BAND_LABELS = ("<50", "50-65", "65-75", "75-90", "90+")
+
+
+@dataclass(frozen=True)
+class CohortMatrix:
+    """A term's registers as one students x lectures array.
+
+    ``marks[i, j]`` is 1 when student ``i`` attended lecture ``j + 1``. Rows are
+    zero-padded past ``lectures[i]``, so ``recorded`` tells absences from
+    lectures the student's register does not cover.
+    """
+
+    term: Optional[str]
+    student_ids: list[str]
+    names: list[str]
+    roll_numbers: list[str]
+    courses: np.ndarray
+    marks: np.ndarray
+    lectures: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    @property
+    def recorded(self) -> np.ndarray:
+        return np.arange(self.marks.shape[1]) < self.lectures[:, None]
+
+
+async def load_cohort(
+    db: AsyncSession,
+    *,
+    term: Optional[str] = None,
+    department: Optional[str] = None,
+    course: Optional[str] = None,
+) -> CohortMatrix:
+    """Load every register in ``term`` (the latest when omitted) in one query and unpack the bitmaps."""
+    term_filter = term or select(func.max(AttendanceRecord.term)).scalar_subquery()
+    query = (
+        select(
+            AttendanceRecord.term,
+            # Ids only travel back to the client, so skip building a UUID object per row.
+            cast(Student.id, Text),
+            Student.name,
+            Student.roll_no,
+            Student.course,
+            cast(AttendanceRecord.presence, Text),
+            AttendanceRecord.lectures,
+        )
+        .join(Student, Student.id == AttendanceRecord.student_id)
+        .where(AttendanceRecord.term == term_filter)
+    )
+    if department:
+        query = query.where(Student.department == department)
+    if course:
+        query = query.where(Student.course == course)
+
+    rows = (await db.execute(query)).all()
+    if not rows:
+        return CohortMatrix(
+            term=term,
+            student_ids=[],
+            names=[],
+            roll_numbers=[],
+            courses=np.array([], dtype=object),
+            marks=np.zeros((0, 0), dtype=np.uint8),
+            lectures=np.zeros(0, dtype=np.int64),
+        )
+
+    terms, student_ids, names, roll_numbers, courses, presence, lectures = zip(*rows)
+    width = max(lectures)
+    # One contiguous ASCII buffer of '0'/'1' characters becomes the matrix without a per-mark loop.
+    packed = "".join(bits.ljust(width, "0") for bits in presence).encode("ascii")
+    marks = (np.frombuffer(packed, dtype=np.uint8) - ord("0")).reshape(len(rows), width)
+    return CohortMatrix(
+        term=terms[0],
+        student_ids=list(student_ids),
+        names=list(names),
+        roll_numbers=list(roll_numbers),
+        courses=np.array(courses, dtype=object),
+        marks=marks,
+        lectures=np.array(lectures, dtype=np.int64),
+    )
+
+
+def _share(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator * 100.0, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def attendance_percentages(cohort: CohortMatrix) -> np.ndarray:
+    """Each student's percentage over the lectures on their register."""
+    return _share(cohort.marks.sum(axis=1, dtype=np.int64), cohort.lectures)
+
+
+def recent_percentages(cohort: CohortMatrix, window: int) -> np.ndarray:
+    """Each student's percentage over their ``window`` most recent lectures."""
+    cumulative = np.zeros((len(cohort), cohort.marks.shape[1] + 1), dtype=np.int64)
+    np.cumsum(cohort.marks, axis=1, out=cumulative[:, 1:])
+    end = cohort.lectures
+    start = np.maximum(end - window, 0)
+    attended = (
+        np.take_along_axis(cumulative, end[:, None], axis=1)[:, 0]
+        - np.take_along_axis(cumulative, start[:, None], axis=1)[:, 0]
+    )
+    return _share(attended, end - start)
+
+
+def lecture_series(cohort: CohortMatrix, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """(cohort attendance per lecture, trailing ``window``-lecture rolling average of it)."""
+    rates = _share(cohort.marks.sum(axis=0, dtype=np.int64), cohort.recorded.sum(axis=0))
+    cumulative = np.concatenate(([0.0], np.cumsum(rates)))
+    index = np.arange(len(rates))
+    first = np.maximum(index - window + 1, 0)
+    rolling = (cumulative[index + 1] - cumulative[first]) / (index + 1 - first)
+    return rates, rolling
+
+
+@dataclass(frozen=True)
+class CourseDistribution:
+    courses: np.ndarray
+    students: np.ndarray
+    mean: np.ndarray
+    median: np.ndarray
+    below_threshold: np.ndarray
+    bands: np.ndarray
+
+
+def course_distributions(courses: np.ndarray, percentages: np.ndarray, *, threshold: float) -> CourseDistribution:
+    """Per-course counts, mean, median, below-threshold count and band histogram, without a per-course loop."""
+    names, group = np.unique(courses.astype(str), return_inverse=True)
+    groups = len(names)
+    students = np.bincount(group, minlength=groups)
+    mean = np.bincount(group, weights=percentages, minlength=groups) / np.maximum(students, 1)
+    below = np.bincount(group, weights=percentages < threshold, minlength=groups).astype(np.int64)
+
+    band = np.digitize(percentages, DISTRIBUTION_BAND_EDGES)
+    bands = np.bincount(
+        group * len(DISTRIBUTION_BAND_LABELS) + band, minlength=groups * len(DISTRIBUTION_BAND_LABELS)
+    ).reshape(groups, len(DISTRIBUTION_BAND_LABELS))
+
+    # Sorting by (course, percentage) puts each course's values in one ascending run.
+    ordered = percentages[np.lexsort((percentages, group))]
+    starts = np.concatenate(([0], np.cumsum(students)[:-1]))
+    median = (ordered[starts + (students - 1) // 2] + ordered[starts + students // 2]) / 2
+
+    return CourseDistribution(
+        courses=names,
+        students=students,
+        mean=mean,
+        median=median,
+        below_threshold=below,
+        bands=bands,
+    )
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import time
+from datetime import date, datetime, time as day_start, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import Date, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.security import now_utc
+from app.db.session import AsyncSessionLocal
+from app.models.rollup import DailySessionRollup, InsightsSnapshot
+from app.models.session import Session as UserSession
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Arbitrary key for pg_try_advisory_xact_lock so only one worker refreshes per tick.
+_ROLLUP_LOCK_KEY = 0x1A51_0013
+
+_BACKFILL_FROM = date(1970, 1, 1)
+
+# Rollups older than this many job intervals are ignored in favour of the live
+# tables; one missed tick is tolerated, a stopped job is not.
+STALE_AFTER_INTERVALS = 2
+
+_rollup_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_daily(db: AsyncSession, *, since: date) -> int:
+    """Recompute rollup rows for ``since`` onwards from the sessions started in that range."""
+    day = cast(func.timezone("UTC", UserSession.started_at), Date)
+    department = func.coalesce(User.department, "")
+    aggregate = (
+        select(
+            day.label("day"),
+            department.label("department"),
+            func.count(UserSession.id).label("sessions_started"),
+            func.count(func.distinct(UserSession.user_id)).label("active_users"),
+            func.now().label("updated_at"),
+        )
+        .join(User, User.id == UserSession.user_id)
+        .where(UserSession.started_at >= datetime.combine(since, day_start.min, tzinfo=timezone.utc))
+        .group_by(day, department)
+    )
+    # Replace rather than upsert, so a department that lost all its sessions
+    # for a day (e.g. a user changed department) does not leave a stale row.
+    await db.execute(delete(DailySessionRollup).where(DailySessionRollup.day >= since))
+    written = await db.scalars(
+        insert(DailySessionRollup)
+        .from_select(["day", "department", "sessions_started", "active_users", "updated_at"], aggregate)
+        .returning(DailySessionRollup.day)
+    )
+    return len(written.all())
+
+
+async def _refresh_snapshot(db: AsyncSession, *, now: datetime) -> None:
+    counts = select(
+        literal(1).label("id"),
+        select(func.count()).select_from(User).scalar_subquery().label("total_users"),
+        select(func.count(func.distinct(UserSession.user_id)))
+        .where(UserSession.revoked_at.is_(None))
+        .scalar_subquery()
+        .label("active_users"),
+        select(func.count())
+        .select_from(User)
+        .where(User.locked_until > now)
+        .scalar_subquery()
+        .label("locked_users"),
+        literal(now, InsightsSnapshot.refreshed_at.type).label("refreshed_at"),
+    )
+    statement = insert(InsightsSnapshot).from_select(
+        ["id", "total_users", "active_users", "locked_users", "refreshed_at"], counts
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[InsightsSnapshot.id],
+        set_={
+            "total_users": statement.excluded.total_users,
+            "active_users": statement.excluded.active_users,
+            "locked_users": statement.excluded.locked_users,
+            "refreshed_at": statement.excluded.refreshed_at,
+        },
+    )
+    await db.execute(statement)
+
+
+async def refresh_rollups(*, now: Optional[datetime] = None, rebuild: bool = False) -> dict[str, Any]:
+    """Bring the rollups up to date; returns what was refreshed, or ``skipped`` if another worker holds the lock.
+
+    Daily rows are maintained incrementally: only days from the newest rollup
+    row onwards are re-aggregated, so a run touches today's sessions (plus any
+    backlog after downtime) rather than the whole table. The first run, or
+    ``rebuild=True``, backfills from every session still on record.
+    """
+    now = now or now_utc()
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        if not await db.scalar(select(func.pg_try_advisory_xact_lock(_ROLLUP_LOCK_KEY))):
+            return {"skipped": True}
+
+        since = _BACKFILL_FROM if rebuild else await db.scalar(select(func.max(DailySessionRollup.day)))
+        since = since or _BACKFILL_FROM
+        days = await _refresh_daily(db, since=since)
+        await _refresh_snapshot(db, now=now)
+        await db.commit()
+
+    report = {"daily_rows": days, "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+    logger.info("Insights rollups refreshed", extra={"rollups": report})
+    return report
+
+
+async def load_snapshot(db: AsyncSession, *, now: Optional[datetime] = None) -> Optional[InsightsSnapshot]:
+    """The rollup snapshot when it is fresh enough to serve, else None and callers query live tables.
+
+    The snapshot and the daily rows are refreshed in one transaction, so its
+    ``refreshed_at`` vouches for both. None as well when rollups are disabled
+    or the job has not completed a run yet, e.g. right after a fresh deploy.
+    """
+    if not settings.insights_rollups_enabled:
+        return None
+    now = now or now_utc()
+    snapshot = await db.scalar(
+        select(InsightsSnapshot).where(
+            InsightsSnapshot.id == 1,
+            InsightsSnapshot.refreshed_at
+            >= now - timedelta(seconds=settings.insights_rollup_interval_seconds * STALE_AFTER_INTERVALS),
+        )
+    )
+    return snapshot
+
+
+async def _run_forever() -> None:
+    while True:
+        try:
+            await refresh_rollups()
+        except Exception:
+            logger.exception("Insights rollup refresh failed")
+        await asyncio.sleep(settings.insights_rollup_interval_seconds)
+
+
+def start_rollup_job() -> None:
+    global _rollup_task
+    if settings.insights_rollups_enabled and _rollup_task is None:
+        _rollup_task = asyncio.create_task(_run_forever())
+
+
+async def stop_rollup_job() -> None:
+    global _rollup_task
+    if _rollup_task is None:
+        return
+    _rollup_task.cancel()
+    try:
+        await _rollup_task
+    except asyncio.CancelledError:
+        pass
+    _rollup_task = None
@@ -1,3 +1,6 @@
+from datetime import date
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -21,12 +24,56 @@ class WeeklyTrendResponse(BaseModel):
     attendance: float
 
 
+class AttendanceTrendPoint(BaseModel):
+    periodStart: date
+    label: str
+    sessions: int
+    attendance: float
+
+
 class DistributionResponse(BaseModel):
     present: int
     absent: int
     leave: int
 
 
+class LectureAttendancePoint(BaseModel):
+    lecture: int
+    attendance: float
+    rolling: float
+
+
+class CourseDistributionResponse(BaseModel):
+    course: str
+    students: int
+    averagePercent: float
+    medianPercent: float
+    belowThreshold: int
+    bands: dict[str, int]
+
+
+class CohortSummaryResponse(BaseModel):
+    term: Optional[str]
+    students: int
+    lectures: int
+    averagePercent: float
+    belowThreshold: int
+    threshold: float
+    window: int
+    lectureSeries: list[LectureAttendancePoint]
+    courses: list[CourseDistributionResponse]
+
+
+class CohortStudentResponse(BaseModel):
+    id: str
+    name: str
+    rollNo: str
+    course: str
+    attendancePercent: float
+    recentPercent: float
+    belowThreshold: bool
+
+
 class StudentResponse(BaseModel):
     id: str
     name: str
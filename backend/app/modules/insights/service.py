@@ -0,0 +1,285 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.enums import TrendGranularity
+from app.models.session import Session as UserSession
+from app.models.student import Student
+from app.models.user import User
+from app.modules.attendance.service import AttendanceService
+from app.modules.insights.cohort import (
+    DISTRIBUTION_BAND_LABELS,
+    attendance_percentages,
+    course_distributions,
+    lecture_series,
+    load_cohort,
+    recent_percentages,
+)
+from app.modules.insights.rollups import load_snapshot
+from app.modules.insights.schemas import (
+    AttendanceTrendPoint,
+    CohortStudentResponse,
+    CohortSummaryResponse,
+    CourseDistributionResponse,
+    DashboardStatsResponse,
+    DistributionResponse,
+    LectureAttendancePoint,
+    TopPerformerResponse,
+    WeeklyTrendResponse,
+)
+from app.modules.insights.trends import TrendBucket, session_trend
+
+settings = get_settings()
+
+# Freshness per insight; stale entries keep being served while a background refresh runs.
+CACHE_TTL_SECONDS = {
+    "dashboard_stats": 30.0,
+    "top_performers": 60.0,
+    "weekly_trend": 60.0,
+    "attendance_trend": 300.0,
+    "distribution": 30.0,
+    "cohort_summary": 60.0,
+    "cohort_students": 60.0,
+}
+
+_TREND_LABELS = {
+    TrendGranularity.DAY: "%a %d %b",
+    TrendGranularity.WEEK: "%d %b",
+    TrendGranularity.MONTH: "%b %Y",
+}
+
+
+def _name_from_email(email: str) -> str:
+    local_part = email.split("@")[0].replace(".", " ").replace("_", " ").replace("-", " ")
+    parts = [part for part in local_part.split() if part]
+    return " ".join(part.capitalize() for part in parts) or "User"
+
+
+def _attendance_from_daily_sessions(bucket: TrendBucket) -> float:
+    # Scaled per day so day, week and month series share one axis.
+    return round(min(100.0, 70.0 + (bucket.sessions / bucket.days) * 5.0), 1)
+
+
+def _attendance_from_sessions(session_count: int, max_sessions: int) -> float:
+    if max_sessions <= 0:
+        return 75.0
+    normalized = session_count / max_sessions
+    return round(70 + (normalized * 29), 1)
+
+
+class InsightsService:
+    @staticmethod
+    async def headline_counts(db: AsyncSession) -> tuple[int, int, int]:
+        """(total users, users with a live session, locked users), from the rollup snapshot while it is fresh."""
+        snapshot = await load_snapshot(db)
+        if snapshot is not None:
+            return snapshot.total_users, snapshot.active_users, snapshot.locked_users
+
+        total_users = await db.scalar(select(func.count()).select_from(User)) or 0
+        active_users = await db.scalar(
+            select(func.count(func.distinct(UserSession.user_id))).where(UserSession.revoked_at.is_(None))
+        ) or 0
+        locked_users = await db.scalar(
+            select(func.count()).select_from(User).where(User.locked_until.is_not(None), User.locked_until > datetime.now(timezone.utc))
+        ) or 0
+        return total_users, active_users, locked_users
+
+    @staticmethod
+    async def dashboard_stats(db: AsyncSession) -> DashboardStatsResponse:
+        """Headline figures; attendance comes from the latest term's registers once any are uploaded."""
+        total_users, active_users, _locked_users = await InsightsService.headline_counts(db)
+
+        recorded, avg_attendance, low_attendance = await AttendanceService.term_summary(
+            db, threshold=settings.attendance_low_threshold_percent
+        )
+        if not recorded:
+            avg_attendance = round((active_users / total_users) * 100, 1) if total_users else 0.0
+            low_attendance = max(total_users - active_users, 0)
+
+        return DashboardStatsResponse(
+            totalStudents=total_users,
+            totalStudentsTrend=0.0,
+            cvsUploaded=active_users,
+            cvsUploadedLabel="Live from backend",
+            avgAttendance=avg_attendance,
+            avgAttendanceTrend=0.0,
+            lowAttendance=low_attendance,
+        )
+
+    @staticmethod
+    async def top_performers(
+        db: AsyncSession,
+        *,
+        limit: int = 5,
+        course: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> list[TopPerformerResponse]:
+        """Users ranked by session count, in one grouped query whatever the population size.
+
+        ``course`` matches users whose student record (linked by email) is on that
+        course; ``department`` matches the user's own department.
+        """
+        session_count = func.count(UserSession.id)
+        query = (
+            select(
+                User.email,
+                session_count.label("sessions"),
+                func.max(session_count).over().label("max_sessions"),
+            )
+            .select_from(User)
+            .outerjoin(UserSession, UserSession.user_id == User.id)
+            .group_by(User.id)
+            .order_by(session_count.desc(), User.created_at.desc())
+            .limit(limit)
+        )
+        if department:
+            query = query.where(User.department == department)
+        if course:
+            query = query.where(
+                select(Student.id).where(func.lower(Student.email) == User.email, Student.course == course).exists()
+            )
+
+        return [
+            TopPerformerResponse(
+                name=_name_from_email(row.email),
+                attendance=_attendance_from_sessions(row.sessions, row.max_sessions),
+            )
+            for row in (await db.execute(query)).all()
+        ]
+
+    @staticmethod
+    async def weekly_trend(db: AsyncSession) -> list[WeeklyTrendResponse]:
+        buckets = await session_trend(db, days=7, granularity=TrendGranularity.DAY)
+        return [
+            WeeklyTrendResponse(week=bucket.start.strftime("%a"), attendance=_attendance_from_daily_sessions(bucket))
+            for bucket in buckets
+        ]
+
+    @staticmethod
+    async def attendance_trend(
+        db: AsyncSession,
+        *,
+        days: int,
+        granularity: TrendGranularity,
+        department: Optional[str] = None,
+    ) -> list[AttendanceTrendPoint]:
+        buckets = await session_trend(db, days=days, granularity=granularity, department=department)
+        return [
+            AttendanceTrendPoint(
+                periodStart=bucket.start,
+                label=bucket.start.strftime(_TREND_LABELS[granularity]),
+                sessions=bucket.sessions,
+                attendance=_attendance_from_daily_sessions(bucket),
+            )
+            for bucket in buckets
+        ]
+
+    @staticmethod
+    async def distribution(db: AsyncSession) -> DistributionResponse:
+        total_users, present, leave = await InsightsService.headline_counts(db)
+        absent = max(total_users - present - leave, 0)
+
+        return DistributionResponse(present=present, absent=absent, leave=leave)
+
+    @staticmethod
+    async def cohort_summary(
+        db: AsyncSession,
+        *,
+        term: Optional[str] = None,
+        department: Optional[str] = None,
+        course: Optional[str] = None,
+        window: int = 5,
+    ) -> CohortSummaryResponse:
+        """Whole-cohort attendance for a term: per-lecture series with a rolling average, and per-course spreads.
+
+        The cohort is loaded once as a students x lectures matrix and every
+        figure is an array operation over it.
+        """
+        threshold = settings.attendance_low_threshold_percent
+        cohort = await load_cohort(db, term=term, department=department, course=course)
+        if not len(cohort):
+            return CohortSummaryResponse(
+                term=cohort.term,
+                students=0,
+                lectures=0,
+                averagePercent=0.0,
+                belowThreshold=0,
+                threshold=threshold,
+                window=window,
+                lectureSeries=[],
+                courses=[],
+            )
+
+        percentages = attendance_percentages(cohort)
+        rates, rolling = lecture_series(cohort, window)
+        spread = course_distributions(cohort.courses, percentages, threshold=threshold)
+        return CohortSummaryResponse(
+            term=cohort.term,
+            students=len(cohort),
+            lectures=int(cohort.lectures.max()),
+            averagePercent=round(float(percentages.mean()), 1),
+            belowThreshold=int((percentages < threshold).sum()),
+            threshold=threshold,
+            window=window,
+            lectureSeries=[
+                LectureAttendancePoint(lecture=lecture, attendance=round(rate, 1), rolling=round(average, 1))
+                for lecture, rate, average in zip(range(1, len(rates) + 1), rates.tolist(), rolling.tolist())
+            ],
+            courses=[
+                CourseDistributionResponse(
+                    course=name,
+                    students=students,
+                    averagePercent=round(mean, 1),
+                    medianPercent=round(median, 1),
+                    belowThreshold=below,
+                    bands=dict(zip(DISTRIBUTION_BAND_LABELS, bands)),
+                )
+                for name, students, mean, median, below, bands in zip(
+                    spread.courses.tolist(),
+                    spread.students.tolist(),
+                    spread.mean.tolist(),
+                    spread.median.tolist(),
+                    spread.below_threshold.tolist(),
+                    spread.bands.tolist(),
+                )
+            ],
+        )
+
+    @staticmethod
+    async def cohort_students(
+        db: AsyncSession,
+        *,
+        term: Optional[str] = None,
+        department: Optional[str] = None,
+        course: Optional[str] = None,
+        window: int = 5,
+        below_only: bool = False,
+        limit: int = 100,
+    ) -> list[CohortStudentResponse]:
+        """Students ordered by attendance (lowest first), with their recent-window percentage and threshold flag."""
+        threshold = settings.attendance_low_threshold_percent
+        cohort = await load_cohort(db, term=term, department=department, course=course)
+        if not len(cohort):
+            return []
+
+        percentages = attendance_percentages(cohort)
+        recent = recent_percentages(cohort, window)
+        flagged = percentages < threshold
+        candidates = np.flatnonzero(flagged) if below_only else np.arange(len(cohort))
+        order = candidates[np.lexsort((recent[candidates], percentages[candidates]))][:limit]
+        return [
+            CohortStudentResponse(
+                id=cohort.student_ids[i],
+                name=cohort.names[i],
+                rollNo=cohort.roll_numbers[i],
+                course=cohort.courses[i],
+                attendancePercent=round(float(percentages[i]), 1),
+                recentPercent=round(float(recent[i]), 1),
+                belowThreshold=bool(flagged[i]),
+            )
+            for i in order.tolist()
+        ]
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, cast, func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import TrendGranularity
+from app.models.rollup import DailySessionRollup
+from app.models.session import Session as UserSession
+from app.models.user import User
+from app.modules.insights.rollups import load_snapshot
+
+# Fixed SQL literals keyed by enum, never built from request input.
+_STEPS = {
+    TrendGranularity.DAY: literal_column("interval '1 day'"),
+    TrendGranularity.WEEK: literal_column("interval '1 week'"),
+    TrendGranularity.MONTH: literal_column("interval '1 month'"),
+}
+
+
+@dataclass(frozen=True)
+class TrendBucket:
+    start: date
+    # Days of the bucket inside the requested range: fewer than its length for a
+    # first bucket that starts before the range and for the bucket holding today.
+    days: int
+    sessions: int
+
+
+def bucket_start(day: date, granularity: TrendGranularity) -> date:
+    """First day of the bucket containing ``day`` (weeks start on Monday, as in date_trunc)."""
+    if granularity == TrendGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == TrendGranularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: date, granularity: TrendGranularity) -> date:
+    if granularity == TrendGranularity.WEEK:
+        return start + timedelta(days=7)
+    if granularity == TrendGranularity.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+async def session_trend(
+    db: AsyncSession,
+    *,
+    days: int,
+    granularity: TrendGranularity,
+    department: Optional[str] = None,
+    today: Optional[date] = None,
+) -> list[TrendBucket]:
+    """Sessions started per UTC bucket over the last ``days`` days, gaps filled with zero.
+
+    The series and the counts come from one statement: a ``generate_series``
+    of bucket starts left-joined to a ``date_trunc`` aggregate. With rollups
+    enabled the aggregate sums ``daily_session_rollups`` rows; otherwise it
+    counts the ``started_at`` range, which is served by ``ix_sessions_started_at``.
+    Rollups are only used while fresh and refreshed today, so they cover the
+    whole range; otherwise the live sessions are counted. Only sessions inside
+    the range are counted, so a partial first or last bucket holds just its
+    in-range days.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    range_start = today - timedelta(days=days - 1)
+    first = bucket_start(range_start, granularity)
+    last = bucket_start(today, granularity)
+
+    snapshot = await load_snapshot(db)
+    if snapshot is not None and snapshot.refreshed_at.astimezone(timezone.utc).date() >= today:
+        bucket = func.date_trunc(granularity.value, cast(DailySessionRollup.day, DateTime()))
+        counts = (
+            select(bucket.label("bucket"), cast(func.sum(DailySessionRollup.sessions_started), Integer).label("sessions"))
+            .where(DailySessionRollup.day >= range_start)
+            .group_by(bucket)
+        )
+        if department is not None:
+            counts = counts.where(DailySessionRollup.department == department)
+    else:
+        bucket = func.date_trunc(granularity.value, func.timezone("UTC", UserSession.started_at))
+        counts = (
+            select(bucket.label("bucket"), func.count().label("sessions"))
+            .where(UserSession.started_at >= datetime.combine(range_start, time.min, tzinfo=timezone.utc))
+            .group_by(bucket)
+        )
+        if department is not None:
+            counts = counts.join(User, User.id == UserSession.user_id).where(User.department == department)
+    counts = counts.subquery("counts")
+
+    series = (
+        func.generate_series(
+            literal(datetime.combine(first, time.min), DateTime()),
+            literal(datetime.combine(last, time.min), DateTime()),
+            _STEPS[granularity],
+        )
+        .table_valued("bucket")
+        .render_derived(name="series")
+    )
+    query = (
+        select(series.c.bucket, func.coalesce(counts.c.sessions, 0))
+        .select_from(series.outerjoin(counts, counts.c.bucket == series.c.bucket))
+        .order_by(series.c.bucket)
+    )
+
+    tomorrow = today + timedelta(days=1)
+    return [
+        TrendBucket(
+            start=start.date(),
+            days=(min(_next_bucket(start.date(), granularity), tomorrow) - max(start.date(), range_start)).days,
+            sessions=sessions,
+        )
+        for start, sessions in (await db.execute(query)).all()
+    ]
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.models.anonymous_message import AnonymousMessage
-from app.modules.auth.dependencies import AuthContext, RequireRole, get_auth_context
+from app.modules.auth.dependencies import AuthContext, RequireRole, get_auth_context_untracked
 from app.modules.messages.schemas import (
     AnonymousMessageCreate,
     AnonymousMessageResponse,
@@ -24,32 +24,35 @@ def _to_response(m: AnonymousMessage) -> AnonymousMessageResponse:
 
 
 @messages_router.post("/anonymous", response_model=AnonymousMessageResponse, status_code=201)
-def create_anonymous_message(
+async def create_anonymous_message(
     payload: AnonymousMessageCreate,
-    _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    _: AuthContext = Depends(get_auth_context_untracked),
+    db: AsyncSession = Depends(get_db),
 ) -> AnonymousMessageResponse:
     # Notice we purposely DO NOT save any reference to the authenticated user.
-    # The `auth_context` dependency ensures they are logged in, but their identity is discarded.
+    # The auth dependency ensures they are logged in, but their identity is discarded,
+    # and it leaves no session activity that could be matched to the message's timestamp.
     message = AnonymousMessage(message=payload.message)
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    await db.refresh(message)
     return _to_response(message)
 
 
 @messages_router.get("/anonymous", response_model=PaginatedAnonymousMessagesResponse)
-def list_anonymous_messages(
+async def list_anonymous_messages(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
     auth: AuthContext = Depends(RequireRole(["admin", "dean", "hod"])),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> PaginatedAnonymousMessagesResponse:
     query = select(AnonymousMessage)
 
-    total = db.scalar(select(func.count()).select_from(query.subquery())) or 0
-    messages = db.scalars(
-        query.order_by(AnonymousMessage.created_at.desc()).offset((page - 1) * limit).limit(limit)
+    total = await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+    messages = (
+        await db.scalars(
+            query.order_by(AnonymousMessage.created_at.desc()).offset((page - 1) * limit).limit(limit)
+        )
     ).all()
 
     return PaginatedAnonymousMessagesResponse(
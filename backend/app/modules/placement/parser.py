@@ -0,0 +1,134 @@
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Optional
+
+from app.core.uploads import iter_tabular_upload
+from app.models.placement_record import PlacementRecord
+
+HEADER_SEARCH_ROWS = 20
+PLACEMENT_BATCH_SIZE = 500
+
+# Column name mapping: CSV header -> model field
+COLUMN_MAP = {
+    "Sl. No.": "sl_no",
+    "Roll No.": "roll_no",
+    "STUDENT'S NAME": "student_name",
+    "Photo Id": "photo_id",
+    "Gender": "gender",
+    "Type": "type",
+    "Contact No.": "contact_no",
+    "E-mail": "email",
+    "X Result": "x_result",
+    "XII Result": "xii_result",
+    "Course": "course",
+    "Branch": "branch",
+    "Designation": "designation",
+    "Name of the company": "company_name",
+    "Industry": "industry",
+    "Date of Drive": "date_of_drive",
+    "Company Offers 1": "company_offers",
+    "Probation/Training duration": "probation_duration",
+    "Stipend during training per month": "stipend_per_month",
+    "Package": "package",
+    "Offer letter": "offer_letter",
+    "Email/Contact Details of HR": "hr_contact",
+}
+ROLL_NO_HEADER = "Roll No."
+# Widths of the placement_records columns, so an overlong cell fails its row rather than the upload.
+MAX_LENGTHS = {
+    name: PlacementRecord.__table__.c[name].type.length
+    for name in COLUMN_MAP.values()
+    if getattr(PlacementRecord.__table__.c[name].type, "length", None)
+}
+
+# One placement_records row, keyed by column; every row has every COLUMN_MAP field.
+PlacementRow = dict[str, Any]
+
+
+@dataclass
+class PlacementRowError:
+    row: int
+    message: str
+
+
+@dataclass
+class PlacementBatch:
+    rows: list[PlacementRow] = field(default_factory=list)
+    # Rows with content but neither a roll number nor a name.
+    skipped: int = 0
+    errors: list[PlacementRowError] = field(default_factory=list)
+
+
+def _sl_no(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    # Spreadsheets often hand integers back as "3.0".
+    if value.endswith(".0"):
+        value = value[:-2]
+    return int(value) if value.isdigit() else None
+
+
+def _record(values: dict[str, str]) -> tuple[Optional[PlacementRow], Optional[str]]:
+    for name, limit in MAX_LENGTHS.items():
+        if len(values.get(name) or "") > limit:
+            return None, f"{name.replace('_', ' ')} longer than {limit} characters"
+    # Columns missing from the sheet are stored as NULL, blank cells as "".
+    record: PlacementRow = {name: values.get(name) for name in COLUMN_MAP.values()}
+    record["sl_no"] = _sl_no(values.get("sl_no"))
+    record["roll_no"] = values.get("roll_no", "")
+    record["student_name"] = values.get("student_name", "")
+    return record, None
+
+
+def parse_placement_rows(
+    rows: Iterable[list[str]], batch_size: int = PLACEMENT_BATCH_SIZE
+) -> Generator[PlacementBatch, None, None]:
+    """Yield validated placement rows in batches of ``batch_size``, one pass over ``rows``.
+
+    The header row, found by its 'Roll No.' column, may sit below a title
+    block. Errors carry the row's line number in the file. Only one batch is
+    held at a time, so memory does not grow with the size of the upload.
+    """
+    rows = iter(rows)
+    positions: dict[int, str] = {}
+    for line_number, row in enumerate(rows, start=1):
+        headers = [str(cell).strip() for cell in row]
+        if ROLL_NO_HEADER in headers:
+            positions = {index: COLUMN_MAP[header] for index, header in enumerate(headers) if header in COLUMN_MAP}
+            break
+        if line_number >= HEADER_SEARCH_ROWS:
+            break
+    if not positions:
+        raise ValueError("Could not find header row with 'Roll No.' column")
+
+    batch = PlacementBatch()
+    for line_number, row in enumerate(rows, start=line_number + 1):
+        cells = [str(cell).strip() if cell is not None else "" for cell in row]
+        if not any(cells):
+            continue
+        values = {name: cells[index] for index, name in positions.items() if index < len(cells)}
+        if not values.get("roll_no") and not values.get("student_name"):
+            batch.skipped += 1
+            continue
+
+        record, error = _record(values)
+        if error is not None:
+            batch.errors.append(PlacementRowError(row=line_number, message=error))
+        else:
+            batch.rows.append(record)
+        if len(batch.rows) + len(batch.errors) >= batch_size:
+            yield batch
+            batch = PlacementBatch()
+    if batch.rows or batch.skipped or batch.errors:
+        yield batch
+
+
+def iter_placement_upload(
+    stream: BinaryIO, *, xlsx: bool, encoding: str = "utf-8-sig"
+) -> Generator[PlacementBatch, None, None]:
+    """Stream-parse an uploaded placement sheet in batches.
+
+    ``ImportError`` for .xlsx without openpyxl and ``ValueError`` for a missing
+    header surface from the first batch.
+    """
+    return iter_tabular_upload(stream, parse_placement_rows, xlsx=xlsx, encoding=encoding)
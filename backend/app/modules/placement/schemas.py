@@ -10,6 +10,8 @@ class PlacementUploadError(BaseModel):
 class PlacementUploadResponse(BaseModel):
     processed: int
     skipped: int
+    failed: int = 0
+    # At most MAX_REPORTED_ERRORS entries; ``failed`` is the full count.
     errors: list[PlacementUploadError]
 
 
@@ -37,3 +39,11 @@ class PlacementRecordResponse(BaseModel):
     package: Optional[str] = None
     offer_letter: Optional[str] = None
     hr_contact: Optional[str] = None
+
+
+class PlacementRecordFields(PlacementRecordResponse):
+    """A record listed with ``fields=``: any subset of PlacementRecordResponse."""
+
+    id: Optional[str] = None
+    roll_no: Optional[str] = None
+    student_name: Optional[str] = None
@@ -0,0 +1,57 @@
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool
+
+from app.models.placement_record import PlacementRecord
+from app.modules.placement.parser import PlacementRowError, iter_placement_upload
+
+
+@dataclass
+class PlacementImport:
+    processed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # The first ``max_errors`` failures; ``failed`` is the full count.
+    errors: list[PlacementRowError] = field(default_factory=list)
+
+
+async def _import(
+    db: AsyncSession, stream: BinaryIO, *, xlsx: bool, encoding: str, max_errors: int
+) -> PlacementImport:
+    summary = PlacementImport()
+    batches = iter_placement_upload(stream, xlsx=xlsx, encoding=encoding)
+    with closing(batches):
+        # Each batch is parsed off the event loop and inserted before the next is read.
+        async for batch in iterate_in_threadpool(batches):
+            if batch.rows:
+                await db.execute(insert(PlacementRecord), batch.rows)
+            summary.processed += len(batch.rows)
+            summary.skipped += batch.skipped
+            summary.failed += len(batch.errors)
+            summary.errors.extend(batch.errors[: max_errors - len(summary.errors)])
+    return summary
+
+
+class PlacementService:
+    @staticmethod
+    async def import_upload(db: AsyncSession, stream: BinaryIO, *, xlsx: bool, max_errors: int) -> PlacementImport:
+        """Insert every valid row of an uploaded placement sheet, reading it in batches.
+
+        Each batch is one multi-row INSERT, and the whole upload is committed
+        once at the end. A CSV that turns out not to be UTF-8 is rolled back
+        and read again as Latin-1, which covers spreadsheets exported on
+        Windows. ``ImportError`` and ``ValueError`` from the parser propagate.
+        """
+        try:
+            summary = await _import(db, stream, xlsx=xlsx, encoding="utf-8-sig", max_errors=max_errors)
+        except UnicodeDecodeError:
+            await db.rollback()
+            stream.seek(0)
+            summary = await _import(db, stream, xlsx=xlsx, encoding="latin-1", max_errors=max_errors)
+        if summary.processed:
+            await db.commit()
+        return summary
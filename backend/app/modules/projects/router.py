@@ -3,10 +3,13 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import Projection, isoformat_or_blank
+from app.db.search import text_search
 from app.db.session import get_db
 from app.models.project import Project
 from app.models.user import User
@@ -107,44 +110,72 @@ def _to_out(p: Project) -> dict:
     }
 
 
+# The fields of _to_out, for sparse ``fields=`` lists.
+PROJECT_FIELDS = Projection(
+    {
+        "id": Project.id,
+        "title": Project.title,
+        "type": Project.type,
+        "description": Project.description,
+        "startDate": Project.start_date,
+        "endDate": Project.end_date,
+        "status": Project.status,
+        "flow": Project.flow,
+        "pptFile": Project.ppt_file,
+        "createdBy": Project.created_by,
+        "createdAt": (Project.created_at, isoformat_or_blank),
+        "updatedAt": (Project.updated_at, isoformat_or_blank),
+        "facultyCoordinator": Project.faculty_coordinator,
+        "externalFaculty": Project.external_faculty,
+        "approvalSubmittedBy": Project.approval_submitted_by,
+        "assignedStudents": (Project.assigned_students, lambda students: students or []),
+        "rejectionReason": Project.rejection_reason,
+        "notes": Project.notes,
+    }
+)
+
+
 @projects_router.get("")
-def list_projects(
+async def list_projects(
     status: Optional[str] = None,
     type_filter: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(default=None),
+    db: AsyncSession = Depends(get_db),
 ):
-    """List all projects with optional filtering."""
-    query = db.query(Project).order_by(Project.created_at.desc())
+    """List all projects with optional filtering; ``fields`` limits each project to those keys."""
+    try:
+        names = PROJECT_FIELDS.parse(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    query = PROJECT_FIELDS.select(names)
+    matches = text_search(search, Project.title, Project.description)
+    if matches is not None:
+        query = query.where(matches.condition).order_by(matches.rank)
+    query = query.order_by(Project.created_at.desc())
     
     if status:
-        query = query.filter(Project.status == status)
+        query = query.where(Project.status == status)
     
     if type_filter:
-        query = query.filter(Project.type == type_filter)
-    
-    if search:
-        query = query.filter(
-            (Project.title.ilike(f"%{search}%")) | 
-            (Project.description.ilike(f"%{search}%"))
-        )
+        query = query.where(Project.type == type_filter)
     
-    return [_to_out(p) for p in query.all()]
+    return PROJECT_FIELDS.rows((await db.execute(query)).all(), names)
 
 
 @projects_router.get("/{project_id}")
-def get_project(project_id: str, db: Session = Depends(get_db)):
+async def get_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Get a single project by ID."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return _to_out(project)
 
 
 @projects_router.post("", status_code=201)
-def create_project(
+async def create_project(
     body: ProjectCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new project."""
@@ -171,16 +202,16 @@ def create_project(
         assigned_students=[],
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Created project: {project.id} by coordinator {current_user.id}")
     return _to_out(project)
 
 
 @projects_router.put("/{project_id}")
-def update_project(project_id: str, body: ProjectUpdate, db: Session = Depends(get_db)):
+async def update_project(project_id: str, body: ProjectUpdate, db: AsyncSession = Depends(get_db)):
     """Update a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -202,29 +233,29 @@ def update_project(project_id: str, body: ProjectUpdate, db: Session = Depends(g
         project.notes = body.notes
     
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Updated project: {project.id}")
     return _to_out(project)
 
 
 @projects_router.delete("/{project_id}")
-def delete_project(project_id: str, db: Session = Depends(get_db)):
+async def delete_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
     logger.info(f"Deleted project: {project.id}")
     return {"message": "Project deleted successfully"}
 
 
 @projects_router.post("/{project_id}/approve")
-def approve_project(project_id: str, db: Session = Depends(get_db)):
+async def approve_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Approve a pending project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -233,16 +264,16 @@ def approve_project(project_id: str, db: Session = Depends(get_db)):
     
     project.status = "Active"
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Approved project: {project.id}")
     return _to_out(project)
 
 
 @projects_router.post("/{project_id}/reject")
-def reject_project(project_id: str, reason: str, db: Session = Depends(get_db)):
+async def reject_project(project_id: str, reason: str, db: AsyncSession = Depends(get_db)):
     """Reject a pending project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -252,20 +283,20 @@ def reject_project(project_id: str, reason: str, db: Session = Depends(get_db)):
     project.status = "Rejected"
     project.rejection_reason = reason
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Rejected project: {project.id}")
     return _to_out(project)
 
 
 @projects_router.post("/{project_id}/students")
-def add_student_to_project(
+async def add_student_to_project(
     project_id: str, 
     student: AssignedStudent, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Add a student to a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -278,20 +309,20 @@ def add_student_to_project(
     students.append(student.dict())
     project.assigned_students = students
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Added student {student.id} to project {project.id}")
     return _to_out(project)
 
 
 @projects_router.delete("/{project_id}/students/{student_id}")
-def remove_student_from_project(
+async def remove_student_from_project(
     project_id: str,
     student_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Remove a student from a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -303,22 +334,22 @@ def remove_student_from_project(
     
     project.assigned_students = updated_students
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Removed student {student_id} from project {project.id}")
     return _to_out(project)
 
 
 @projects_router.post("/{project_id}/complete")
-def complete_project(project_id: str, db: Session = Depends(get_db)):
+async def complete_project(project_id: str, db: AsyncSession = Depends(get_db)):
     """Mark a project as completed."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.scalar(select(Project).where(Project.id == project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     project.status = "Completed"
     project.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     logger.info(f"Completed project: {project.id}")
     return _to_out(project)
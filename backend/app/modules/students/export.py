@@ -0,0 +1,87 @@
+import csv
+import io
+import tempfile
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Select
+from starlette.concurrency import run_in_threadpool
+
+from app.db.session import AsyncSessionLocal
+from app.models.student import Student
+
+# Rows fetched from the server-side cursor per round trip, and written per response chunk.
+EXPORT_BATCH_SIZE = 1000
+XLSX_READ_CHUNK_BYTES = 64 * 1024
+# Spreadsheet workbooks stay in memory up to this size before spilling to disk.
+XLSX_SPOOL_BYTES = 4 * 1024 * 1024
+
+# Leading columns match the roster import, so an export can be edited and re-imported.
+EXPORT_COLUMNS = (
+    ("Roll No.", Student.roll_no),
+    ("Name", Student.name),
+    ("Course", Student.course),
+    ("Department", Student.department),
+    ("Semester", Student.semester),
+    ("Email", Student.email),
+    ("Phone", Student.phone),
+    ("CV Status", Student.cv_status),
+    ("Attendance %", Student.attendance_percent),
+    ("Status", Student.status),
+)
+
+
+def export_query(query: Select) -> Select:
+    """``query``'s filters and ordering, selecting only the exported columns."""
+    return query.with_only_columns(*(column for _, column in EXPORT_COLUMNS))
+
+
+async def _batches(query: Select) -> AsyncIterator[Sequence[Any]]:
+    # A session of its own: the response body is produced after the endpoint returns.
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for batch in result.partitions():
+            yield batch
+
+
+async def stream_csv(query: Select) -> AsyncIterator[bytes]:
+    """CSV bytes for ``query``, one chunk per fetched batch, so memory stays flat at any row count."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the file as UTF-8.
+    buffer.write("\ufeff")
+    writer.writerow(header for header, _ in EXPORT_COLUMNS)
+    async for batch in _batches(query):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def stream_xlsx(query: Select) -> AsyncIterator[bytes]:
+    """XLSX bytes for ``query``, built in an openpyxl write-only workbook.
+
+    The zip container can only be finalised once every row is in, so rows are
+    appended batch by batch (off the event loop), the workbook is saved to a
+    spooled temporary file, and that file is streamed out in chunks. Memory
+    stays bounded either way; raises ``ImportError`` without openpyxl.
+    """
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Students")
+    worksheet.append([header for header, _ in EXPORT_COLUMNS])
+
+    def append_rows(batch: Sequence[Any]) -> None:
+        for row in batch:
+            worksheet.append(list(row))
+
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_BYTES) as output:
+        async for batch in _batches(query):
+            await run_in_threadpool(append_rows, batch)
+        await run_in_threadpool(workbook.save, output)
+        output.seek(0)
+        while chunk := await run_in_threadpool(output.read, XLSX_READ_CHUNK_BYTES):
+            yield chunk
@@ -0,0 +1,126 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import BinaryIO, Optional
+
+from app.core.uploads import parse_tabular_upload
+
+HEADER_SEARCH_ROWS = 20
+MAX_SEMESTER = 12
+
+# Accepted spellings for each roster column, compared lower-cased and stripped.
+COLUMN_ALIASES = {
+    "name": ("name", "student name", "student's name", "full name"),
+    "roll_no": ("roll no.", "roll no", "roll number", "roll_no", "rollno"),
+    "course": ("course", "program", "programme"),
+    "department": ("department", "branch", "dept"),
+    "semester": ("semester", "sem"),
+    "email": ("email", "e-mail", "email id"),
+    "phone": ("phone", "contact no.", "contact no", "mobile", "phone number"),
+}
+REQUIRED_COLUMNS = ("name", "roll_no", "course", "semester")
+# Widths of the matching students columns.
+MAX_LENGTHS = {"name": 200, "roll_no": 50, "course": 100, "department": 100, "email": 320, "phone": 30}
+
+# Column order of RosterRow and of the COPY into the staging table.
+ROSTER_COLUMNS = ("roll_no", "name", "course", "department", "semester", "email", "phone")
+RosterRow = tuple[str, str, str, str, int, Optional[str], Optional[str]]
+
+
+@dataclass
+class RosterRowError:
+    row: int
+    roll_no: Optional[str]
+    message: str
+
+
+@dataclass
+class ParsedRoster:
+    rows: list[RosterRow] = field(default_factory=list)
+    errors: list[RosterRowError] = field(default_factory=list)
+
+
+def _header_positions(headers: list[str]) -> dict[str, int]:
+    lowered = [header.strip().lower() for header in headers]
+    positions = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for index, header in enumerate(lowered):
+            if header in aliases:
+                positions[column] = index
+                break
+    return positions
+
+
+def _validate(values: dict[str, str]) -> tuple[Optional[RosterRow], Optional[str]]:
+    for column in REQUIRED_COLUMNS:
+        if not values.get(column):
+            return None, f"missing {column.replace('_', ' ')}"
+    for column, limit in MAX_LENGTHS.items():
+        if len(values.get(column) or "") > limit:
+            return None, f"{column.replace('_', ' ')} longer than {limit} characters"
+
+    semester_text = values["semester"]
+    # Spreadsheets often hand integers back as "3.0".
+    if semester_text.endswith(".0"):
+        semester_text = semester_text[:-2]
+    if not semester_text.isdigit() or not 1 <= int(semester_text) <= MAX_SEMESTER:
+        return None, f"semester must be a whole number from 1 to {MAX_SEMESTER}"
+
+    email = values.get("email") or None
+    if email and ("@" not in email or email.startswith("@") or email.endswith("@")):
+        return None, f"invalid email {email!r}"
+
+    return (
+        values["roll_no"],
+        values["name"],
+        values["course"],
+        values.get("department") or values["course"],
+        int(semester_text),
+        email.lower() if email else None,
+        values.get("phone") or None,
+    ), None
+
+
+def parse_roster_rows(rows: Iterable[list[str]]) -> ParsedRoster:
+    """Validate a roster one row at a time, collecting a per-row error report.
+
+    The header row may sit below a title block. Department defaults to the
+    course, as for students created one at a time. A roll number repeated in
+    the file keeps its first row; later ones are reported as errors.
+    """
+    rows = iter(rows)
+    positions: dict[str, int] = {}
+    for line_number, row in enumerate(rows, start=1):
+        positions = _header_positions([str(cell) for cell in row])
+        if "roll_no" in positions:
+            break
+        if line_number >= HEADER_SEARCH_ROWS:
+            break
+    if "roll_no" not in positions:
+        raise ValueError("Could not find header row with 'Roll No.' column")
+    missing = [column for column in REQUIRED_COLUMNS if column not in positions]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(column.replace('_', ' ') for column in missing)}")
+
+    roster = ParsedRoster()
+    first_seen: dict[str, int] = {}
+    for line_number, row in enumerate(rows, start=line_number + 1):
+        cells = [str(cell).strip() if cell is not None else "" for cell in row]
+        if not any(cells):
+            continue
+        values = {column: cells[index] if index < len(cells) else "" for column, index in positions.items()}
+        roll_no = values.get("roll_no") or None
+
+        parsed, error = _validate(values)
+        if error is None and roll_no in first_seen:
+            error = f"duplicate roll number, first seen on row {first_seen[roll_no]}"
+        if error is not None:
+            roster.errors.append(RosterRowError(row=line_number, roll_no=roll_no, message=error))
+            continue
+        first_seen[roll_no] = line_number
+        roster.rows.append(parsed)
+    return roster
+
+
+def parse_roster_upload(stream: BinaryIO, *, xlsx: bool) -> ParsedRoster:
+    """Stream-parse an uploaded roster; ``ImportError`` for .xlsx without openpyxl, ``ValueError`` for bad headers."""
+    return parse_tabular_upload(stream, parse_roster_rows, xlsx=xlsx)
@@ -1,19 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional
 
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import any_, bindparam, select, func, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.enums import ExportFormat, PaginationTotal
+from app.db.ids import get_by_uuid, parse_uuid
+from app.db.pagination import decode_cursor, encode_cursor, estimated_count
+from app.db.projection import Projection
+from app.db.search import TextSearch, text_search
 from app.db.session import get_db
 from app.models.student import Student
-from app.modules.auth.dependencies import AuthContext, get_auth_context
+from app.modules.auth.dependencies import AuthContext, RequireRole, get_auth_context
+from app.modules.students.export import export_query, stream_csv, stream_xlsx
+from app.modules.students.roster import MAX_SEMESTER, parse_roster_upload
 from app.modules.students.schemas import (
     PaginatedStudentsResponse,
+    RosterImportResponse,
+    RosterRowErrorResponse,
+    StudentBulkDelete,
+    StudentBulkResult,
+    StudentBulkUpdate,
     StudentCreate,
+    StudentFilter,
     StudentResponse,
     StudentUpdate,
 )
+from app.modules.students.service import StudentService
 
 students_router = APIRouter(prefix="/students", tags=["students"])
 
+MAX_REPORTED_ERRORS = 1000
+
+_FILTER_COLUMNS = {
+    "course": Student.course,
+    "department": Student.department,
+    "semester": Student.semester,
+    "status": Student.status,
+    "cvStatus": Student.cv_status,
+}
+
+
+# StudentResponse's fields, for sparse ``fields=`` lists.
+STUDENT_FIELDS = Projection(
+    {
+        "id": (Student.id, str),
+        "name": Student.name,
+        "rollNo": Student.roll_no,
+        "course": Student.course,
+        "department": Student.department,
+        "cvStatus": Student.cv_status,
+        "attendancePercent": Student.attendance_percent,
+        "semester": Student.semester,
+        "email": Student.email,
+        "phone": Student.phone,
+        "status": Student.status,
+    }
+)
+
 
 def _to_response(s: Student) -> StudentResponse:
     return StudentResponse(
@@ -31,47 +79,130 @@ def _to_response(s: Student) -> StudentResponse:
     )
 
 
+def _list_filters(course: str, semester: int, search: str) -> tuple[list, Optional[TextSearch]]:
+    filters = []
+    if course != "all":
+        filters.append(Student.course.ilike(f"%{course.replace('-', ' ')}%"))
+    if semester > 0:
+        filters.append(Student.semester == semester)
+    matches = text_search(search, Student.name, Student.roll_no)
+    if matches is not None:
+        filters.append(matches.condition)
+    return filters, matches
+
+
+def _ordered(query, matches: Optional[TextSearch]):
+    """Newest first, or most relevant first when searching."""
+    order = [Student.created_at.desc(), Student.id.desc()]
+    if matches is not None:
+        order.insert(0, matches.rank)
+    return query.order_by(*order)
+
+
 @students_router.get("", response_model=PaginatedStudentsResponse)
-def list_students(
+async def list_students(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
     course: str = Query(default="all"),
     semester: int = Query(default=0),
     search: str = Query(default=""),
+    cursor: Optional[str] = Query(default=None),
+    total: PaginationTotal = Query(default=PaginationTotal.EXACT),
+    fields: Optional[str] = Query(default=None),
     _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> PaginatedStudentsResponse:
-    query = select(Student)
+    """Newest students first.
 
-    if course != "all":
-        query = query.where(Student.course.ilike(f"%{course.replace('-', ' ')}%"))
-    if semester > 0:
-        query = query.where(Student.semester == semester)
-    if search:
-        query = query.where(
-            Student.name.ilike(f"%{search}%") | Student.roll_no.ilike(f"%{search}%")
-        )
+    Pass the previous response's ``nextCursor`` as ``cursor`` to page by keyset
+    on (created_at, id), which costs the same at any depth; ``page`` is then
+    ignored. ``search`` matches name or roll number and orders by relevance, so
+    its results page by ``page`` only. ``total`` picks an exact count, the
+    planner's estimate, or none. ``fields`` is a comma-separated subset of the
+    student fields to return; only those columns are read.
+    """
+    try:
+        names = STUDENT_FIELDS.parse(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    filters, matches = _list_filters(course, semester, search)
+    # created_at and id trail the requested fields to build the next cursor.
+    query = STUDENT_FIELDS.select(names, Student.created_at, Student.id).where(*filters)
+    query = _ordered(query, matches).limit(limit + 1)
+    if cursor:
+        if matches is not None:
+            raise HTTPException(status_code=400, detail="Search results are paged with page, not cursor")
+        position = decode_cursor(cursor)
+        if position is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(tuple_(Student.created_at, Student.id) < tuple_(*position))
+    else:
+        query = query.offset((page - 1) * limit)
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if matches is None:
+            next_cursor = encode_cursor(*rows[-1][-2:])
 
-    total = db.scalar(select(func.count()).select_from(query.subquery())) or 0
-    students = db.scalars(
-        query.order_by(Student.created_at.desc()).offset((page - 1) * limit).limit(limit)
-    ).all()
+    if total == PaginationTotal.EXACT:
+        total_count = await db.scalar(select(func.count()).select_from(Student).where(*filters)) or 0
+    elif total == PaginationTotal.ESTIMATED:
+        total_count = await estimated_count(db, select(Student.id).where(*filters))
+    else:
+        total_count = None
 
     return PaginatedStudentsResponse(
-        data=[_to_response(s) for s in students],
-        total=total,
+        data=STUDENT_FIELDS.rows(rows, names),
+        total=total_count,
         page=page,
         limit=limit,
+        nextCursor=next_cursor,
     )
 
 
+@students_router.get("/export")
+async def export_students(
+    course: str = Query(default="all"),
+    semester: int = Query(default=0),
+    search: str = Query(default=""),
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    _: AuthContext = Depends(get_auth_context),
+) -> StreamingResponse:
+    """Download every student matching the list filters as CSV or Excel.
+
+    Rows are streamed from a server-side cursor in batches, so memory use does
+    not grow with the size of the export.
+    """
+    filters, matches = _list_filters(course, semester, search)
+    query = export_query(_ordered(select(Student).where(*filters), matches))
+    filename = f"student-report-{date.today().isoformat()}.{export_format.value}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    if export_format == ExportFormat.XLSX:
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=400,
+                detail="Excel export requires openpyxl. Please export as CSV instead.",
+            )
+        return StreamingResponse(
+            stream_xlsx(query),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers=headers,
+        )
+    return StreamingResponse(stream_csv(query), media_type="text/csv; charset=utf-8", headers=headers)
+
+
 @students_router.post("", response_model=StudentResponse, status_code=201)
-def create_student(
+async def create_student(
     payload: StudentCreate,
     _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> StudentResponse:
-    existing = db.scalar(select(Student).where(Student.roll_no == payload.rollNo))
+    existing = await db.scalar(select(Student).where(Student.roll_no == payload.rollNo))
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Roll number already exists")
 
@@ -85,31 +216,136 @@ def create_student(
         phone=payload.phone,
     )
     db.add(student)
-    db.commit()
-    db.refresh(student)
+    await db.commit()
+    await db.refresh(student)
     return _to_response(student)
 
 
+@students_router.post("/import", response_model=RosterImportResponse)
+async def import_students(
+    file: UploadFile = File(...),
+    _: AuthContext = Depends(RequireRole(["admin", "dean", "hod"])),
+    db: AsyncSession = Depends(get_db),
+) -> RosterImportResponse:
+    """Create or update students in bulk from a CSV or Excel roster, matched on roll number.
+
+    Columns: Name, Roll No., Course, Semester, and optionally Department,
+    Email and Phone. Valid rows are imported even when others fail; every
+    rejected row is listed with its line number and reason. Restricted to
+    Admin, Dean and HOD.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    filename_lower = file.filename.lower()
+    if not (filename_lower.endswith(".csv") or filename_lower.endswith(".xlsx")):
+        raise HTTPException(status_code=400, detail="Only .csv and .xlsx files are supported")
+
+    try:
+        roster = await run_in_threadpool(parse_roster_upload, file.file, xlsx=filename_lower.endswith(".xlsx"))
+    except ImportError:
+        raise HTTPException(
+            status_code=400,
+            detail="Excel support requires openpyxl. Please upload a .csv file instead.",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    inserted, updated = await StudentService.import_roster(db, roster.rows)
+
+    return RosterImportResponse(
+        inserted=inserted,
+        updated=updated,
+        failed=len(roster.errors),
+        errors=[
+            RosterRowErrorResponse(row=error.row, rollNo=error.roll_no, message=error.message)
+            for error in roster.errors[:MAX_REPORTED_ERRORS]
+        ],
+    )
+
+
+def _selection(ids: Optional[list[str]], student_filter: Optional[StudentFilter], *, allow_everyone: bool) -> list:
+    """WHERE conditions for a bulk operation addressed by ``ids`` or by ``student_filter``."""
+    if (ids is None) == (student_filter is None):
+        raise HTTPException(status_code=400, detail="Select students with either ids or filter")
+    if ids is not None:
+        identifiers = [parse_uuid(value) for value in ids]
+        if not identifiers or None in identifiers:
+            raise HTTPException(status_code=400, detail="ids must be a non-empty list of student ids")
+        return [Student.id == any_(bindparam("ids", identifiers, type_=ARRAY(UUID(as_uuid=True))))]
+
+    conditions = [
+        _FILTER_COLUMNS[name] == value for name, value in student_filter.model_dump(exclude_none=True).items()
+    ]
+    if not conditions and not allow_everyone:
+        raise HTTPException(status_code=400, detail="An empty filter would select every student")
+    return conditions
+
+
+@students_router.post("/bulk-update", response_model=StudentBulkResult)
+async def bulk_update_students(
+    payload: StudentBulkUpdate,
+    _: AuthContext = Depends(RequireRole(["admin", "dean", "hod"])),
+    db: AsyncSession = Depends(get_db),
+) -> StudentBulkResult:
+    """Patch many students in one UPDATE, e.g. promote every semester 4 B.Tech CS student.
+
+    An empty ``filter`` addresses the whole student body, so end-of-semester
+    promotion is ``{"filter": {}, "patch": {"promoteBy": 1}}``.
+    """
+    patch = payload.patch.model_dump(exclude_none=True)
+    if not patch:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+    if "semester" in patch and "promoteBy" in patch:
+        raise HTTPException(status_code=400, detail="Use either semester or promoteBy, not both")
+
+    values = {}
+    if "cvStatus" in patch:
+        values["cv_status"] = patch["cvStatus"]
+    if "status" in patch:
+        values["status"] = patch["status"]
+    if "semester" in patch:
+        values["semester"] = patch["semester"]
+    if "promoteBy" in patch:
+        values["semester"] = func.least(Student.semester + patch["promoteBy"], MAX_SEMESTER)
+
+    conditions = _selection(payload.ids, payload.filter, allow_everyone=True)
+    affected, by_semester = await StudentService.bulk_update(db, conditions=conditions, values=values)
+    return StudentBulkResult(affected=affected, bySemester=by_semester)
+
+
+@students_router.post("/bulk-delete", response_model=StudentBulkResult)
+async def bulk_delete_students(
+    payload: StudentBulkDelete,
+    _: AuthContext = Depends(RequireRole(["admin", "dean", "hod"])),
+    db: AsyncSession = Depends(get_db),
+) -> StudentBulkResult:
+    """Delete many students in one DELETE; a filter must name at least one field."""
+    conditions = _selection(payload.ids, payload.filter, allow_everyone=False)
+    affected, by_semester = await StudentService.bulk_delete(db, conditions=conditions)
+    return StudentBulkResult(affected=affected, bySemester=by_semester)
+
+
 @students_router.get("/{student_id}", response_model=StudentResponse)
-def get_student(
+async def get_student(
     student_id: str,
     _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> StudentResponse:
-    student = db.scalar(select(Student).where(Student.id == student_id))
+    student = await get_by_uuid(db, Student, student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     return _to_response(student)
 
 
 @students_router.patch("/{student_id}", response_model=StudentResponse)
-def update_student(
+async def update_student(
     student_id: str,
     payload: StudentUpdate,
     _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> StudentResponse:
-    student = db.scalar(select(Student).where(Student.id == student_id))
+    student = await get_by_uuid(db, Student, student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
@@ -119,19 +355,19 @@ def update_student(
     if "course" in update_data:
         student.department = update_data["course"]
 
-    db.commit()
-    db.refresh(student)
+    await db.commit()
+    await db.refresh(student)
     return _to_response(student)
 
 
 @students_router.delete("/{student_id}", status_code=204)
-def delete_student(
+async def delete_student(
     student_id: str,
     _: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
-    student = db.scalar(select(Student).where(Student.id == student_id))
+    student = await get_by_uuid(db, Student, student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
-    db.delete(student)
-    db.commit()
+    await db.delete(student)
+    await db.commit()
@@ -1,5 +1,7 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Optional
+from pydantic import BaseModel, Field
+
+from app.modules.students.roster import MAX_SEMESTER
 
 
 class StudentCreate(BaseModel):
@@ -37,7 +39,59 @@ class StudentResponse(BaseModel):
 
 
 class PaginatedStudentsResponse(BaseModel):
-    data: list[StudentResponse]
-    total: int
+    # StudentResponse fields, only the requested ones when the list was asked for ``fields``.
+    data: list[dict[str, Any]]
+    # None when the caller asked for total=none.
+    total: Optional[int]
     page: int
     limit: int
+    nextCursor: Optional[str] = None
+
+
+class RosterRowErrorResponse(BaseModel):
+    row: int
+    rollNo: Optional[str] = None
+    message: str
+
+
+class RosterImportResponse(BaseModel):
+    inserted: int
+    updated: int
+    failed: int
+    # At most MAX_REPORTED_ERRORS entries; ``failed`` is the full count.
+    errors: list[RosterRowErrorResponse]
+
+
+class StudentFilter(BaseModel):
+    """Exact-match selection; an empty filter selects every student."""
+
+    course: Optional[str] = None
+    department: Optional[str] = None
+    semester: Optional[int] = None
+    status: Optional[str] = None
+    cvStatus: Optional[str] = None
+
+
+class StudentBulkPatch(BaseModel):
+    cvStatus: Optional[str] = Field(default=None, max_length=20)
+    status: Optional[str] = Field(default=None, max_length=20)
+    semester: Optional[int] = Field(default=None, ge=1, le=MAX_SEMESTER)
+    # Moves each selected student up this many semesters, stopping at the last one.
+    promoteBy: Optional[int] = Field(default=None, ge=1, le=MAX_SEMESTER)
+
+
+class StudentBulkUpdate(BaseModel):
+    ids: Optional[list[str]] = Field(default=None, max_length=10000)
+    filter: Optional[StudentFilter] = None
+    patch: StudentBulkPatch
+
+
+class StudentBulkDelete(BaseModel):
+    ids: Optional[list[str]] = Field(default=None, max_length=10000)
+    filter: Optional[StudentFilter] = None
+
+
+class StudentBulkResult(BaseModel):
+    affected: int
+    # Affected students per semester (after the change, for updates).
+    bySemester: dict[int, int]
@@ -0,0 +1,94 @@
+from typing import Any
+
+from sqlalchemy import Integer, String, column, delete, func, literal_column, select, table, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.student import Student
+from app.modules.students.roster import ROSTER_COLUMNS, RosterRow
+
+_STAGING_TABLE = "student_roster_staging"
+
+_staging = table(
+    _STAGING_TABLE,
+    column("roll_no", String),
+    column("name", String),
+    column("course", String),
+    column("department", String),
+    column("semester", Integer),
+    column("email", String),
+    column("phone", String),
+)
+
+
+async def _summarise(db: AsyncSession, statement: Any) -> tuple[int, dict[int, int]]:
+    """Run a data-modifying statement inside a CTE and count its RETURNING rows per semester."""
+    changed = statement.returning(Student.semester).cte("changed")
+    rows = (await db.execute(select(changed.c.semester, func.count()).group_by(changed.c.semester))).all()
+    await db.commit()
+    by_semester = {semester: count for semester, count in sorted(rows)}
+    return sum(by_semester.values()), by_semester
+
+
+class StudentService:
+    @staticmethod
+    async def import_roster(db: AsyncSession, rows: list[RosterRow]) -> tuple[int, int]:
+        """Insert or update students by roll number; returns (inserted, updated).
+
+        Rows are streamed with COPY into a temporary staging table and merged
+        with a single ``INSERT ... SELECT ... ON CONFLICT (roll_no) DO UPDATE``,
+        so the whole roster costs a handful of round trips and one transaction.
+        Rows must have unique roll numbers. Attendance and CV status are left
+        untouched on existing students.
+        """
+        if not rows:
+            return 0, 0
+
+        conn = await db.connection()
+        await conn.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE {_STAGING_TABLE} ("
+            "roll_no varchar(50) NOT NULL, name varchar(200) NOT NULL, course varchar(100) NOT NULL, "
+            "department varchar(100) NOT NULL, semester integer NOT NULL, email varchar(320), phone varchar(30)"
+            ") ON COMMIT DROP"
+        )
+        driver_connection = (await conn.get_raw_connection()).driver_connection
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(f"COPY {_STAGING_TABLE} ({', '.join(ROSTER_COLUMNS)}) FROM STDIN") as copy:
+                for row in rows:
+                    await copy.write_row(row)
+
+        merge = insert(Student).from_select(
+            ["id", *ROSTER_COLUMNS],
+            select(func.gen_random_uuid(), *(_staging.c[name] for name in ROSTER_COLUMNS)),
+        )
+        merge = merge.on_conflict_do_update(
+            index_elements=[Student.roll_no],
+            set_={
+                "name": merge.excluded.name,
+                "course": merge.excluded.course,
+                "department": merge.excluded.department,
+                "semester": merge.excluded.semester,
+                "email": func.coalesce(merge.excluded.email, Student.email),
+                "phone": func.coalesce(merge.excluded.phone, Student.phone),
+                "updated_at": func.now(),
+            },
+        )
+        # xmax is 0 only on a freshly inserted row version, which tells inserts from updates.
+        inserted_flags = (await db.execute(merge.returning(literal_column("xmax = 0")))).scalars().all()
+        await db.commit()
+
+        inserted = sum(1 for flag in inserted_flags if flag)
+        return inserted, len(inserted_flags) - inserted
+
+    @staticmethod
+    async def bulk_update(
+        db: AsyncSession, *, conditions: list[ColumnElement[bool]], values: dict[str, Any]
+    ) -> tuple[int, dict[int, int]]:
+        """Apply ``values`` to every student matching ``conditions`` in one UPDATE; returns (affected, per semester)."""
+        return await _summarise(db, update(Student).where(*conditions).values(**values, updated_at=func.now()))
+
+    @staticmethod
+    async def bulk_delete(db: AsyncSession, *, conditions: list[ColumnElement[bool]]) -> tuple[int, dict[int, int]]:
+        """Delete every student matching ``conditions`` in one DELETE; returns (deleted, per semester)."""
+        return await _summarise(db, delete(Student).where(*conditions))
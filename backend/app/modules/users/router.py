@@ -1,37 +1,72 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.enums import UserRole
+from app.db.ids import get_by_uuid
 from app.db.session import get_db
 from app.models.user import User
+from app.modules.auth.cache import auth_context_cache
 from app.modules.auth.dependencies import AuthContext, RequireRole
-from app.modules.users.schemas import UserResponse
+from app.modules.auth.service import AuthService
+from app.modules.users.schemas import UserResponse, UserRoleUpdate
 
 users_router = APIRouter(prefix="/users", tags=["users"])
 
 
 @users_router.get("", response_model=list[UserResponse])
-def list_users(
+async def list_users(
+    role: Optional[UserRole] = None,
     auth: AuthContext = Depends(RequireRole(["admin"])),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> list[User]:
-    """Retrieve all users. Restricted to Admin."""
-    return list(db.scalars(select(User).order_by(User.created_at.desc())).all())
+    """Retrieve all users, optionally only those with ``role``. Restricted to Admin."""
+    query = select(User).order_by(User.created_at.desc())
+    if role is not None:
+        query = query.where(User.role == role.value)
+    return list((await db.scalars(query)).all())
+
+
+@users_router.patch("/{user_id}/role", response_model=UserResponse)
+async def update_user_role(
+    user_id: str,
+    body: UserRoleUpdate,
+    auth: AuthContext = Depends(RequireRole(["admin"])),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Change a user's role. Restricted to Admin.
+
+    Cached auth contexts are dropped so the change applies on the user's next
+    request; stateless access tokens pick it up at their next refresh.
+    """
+    user = await get_by_uuid(db, User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    if user.id == auth.user.id and body.role != UserRole.ADMIN:
+        raise HTTPException(status_code=400, detail="Cannot remove your own admin role")
+
+    user.role = body.role.value
+    await db.commit()
+    await db.refresh(user)
+    auth_context_cache.invalidate_user(user.id)
+    return user
 
 
 @users_router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     user_id: str,
     auth: AuthContext = Depends(RequireRole(["admin"])),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a user. Restricted to Admin."""
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = await get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
         
-    if str(user.id) == str(auth.user.id):
+    if user.id == auth.user.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
-        
-    db.delete(user)
-    db.commit()
+
+    await AuthService.delete_user(db, user=user)
@@ -3,6 +3,8 @@ from pydantic import BaseModel, ConfigDict, EmailStr
 from datetime import datetime
 from uuid import UUID
 
+from app.core.enums import UserRole
+
 class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
@@ -10,4 +12,9 @@ class UserResponse(BaseModel):
     email: EmailStr
     status: str
     department: Optional[str] = None
+    role: UserRole
     created_at: datetime
+
+
+class UserRoleUpdate(BaseModel):
+    role: UserRole
@@ -0,0 +1,99 @@
+"""
+Compare attendance storage: one row per student per lecture versus one packed
+bitmap per student per term (the attendance_records layout).
+
+Both layouts are built as temporary tables from the same random register, then
+their on-disk size and the time to compute every student's percentage are
+reported. Nothing is written to the real tables.
+
+Run: python scripts/bench_attendance_storage.py --students 20000 --lectures 60
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.db.session import async_engine
+
+SETUP = [
+    """
+    CREATE TEMP TABLE bench_lecture_marks (
+        student_id uuid NOT NULL,
+        term varchar(20) NOT NULL,
+        lecture integer NOT NULL,
+        present boolean NOT NULL,
+        PRIMARY KEY (student_id, term, lecture)
+    )
+    """,
+    """
+    CREATE TEMP TABLE bench_attendance_bitmaps (
+        student_id uuid NOT NULL,
+        term varchar(20) NOT NULL,
+        presence bit varying NOT NULL,
+        lectures integer NOT NULL,
+        PRIMARY KEY (student_id, term)
+    )
+    """,
+    """
+    INSERT INTO bench_lecture_marks
+    SELECT s.id, '2026-ODD', l, random() < 0.8
+    FROM (SELECT gen_random_uuid() AS id FROM generate_series(1, :students)) s
+    CROSS JOIN generate_series(1, :lectures) l
+    """,
+    """
+    INSERT INTO bench_attendance_bitmaps
+    SELECT student_id, term, string_agg(CASE WHEN present THEN '1' ELSE '0' END, '' ORDER BY lecture)::varbit, count(*)
+    FROM bench_lecture_marks
+    GROUP BY student_id, term
+    """,
+    "ANALYZE bench_lecture_marks",
+    "ANALYZE bench_attendance_bitmaps",
+]
+
+PERCENT_QUERIES = {
+    "row-per-lecture": """
+        SELECT student_id, round(100.0 * count(*) FILTER (WHERE present) / count(*), 1)
+        FROM bench_lecture_marks WHERE term = '2026-ODD' GROUP BY student_id
+    """,
+    "bitmap": """
+        SELECT student_id, round(100.0 * bit_count(presence) / nullif(lectures, 0), 1)
+        FROM bench_attendance_bitmaps WHERE term = '2026-ODD'
+    """,
+}
+
+TABLES = {"row-per-lecture": "bench_lecture_marks", "bitmap": "bench_attendance_bitmaps"}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--lectures", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs of each percentage query")
+    args = parser.parse_args()
+
+    try:
+        async with async_engine.connect() as conn:
+            for statement in SETUP:
+                await conn.execute(text(statement), {"students": args.students, "lectures": args.lectures})
+
+            print(f"{args.students} students x {args.lectures} lectures")
+            for name, table in TABLES.items():
+                size = await conn.scalar(text(f"SELECT pg_total_relation_size('{table}')"))
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    (await conn.execute(text(PERCENT_QUERIES[name]))).all()
+                    timings.append((time.perf_counter() - started) * 1000)
+                print(f"{name:<16} size={size / 1024 / 1024:8.1f} MiB  percentages best={min(timings):8.1f} ms")
+            await conn.rollback()
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+"""
+Benchmark refresh-token rotation: database round trips and latency.
+
+Compares the original rotation flow (SELECT FOR UPDATE, session SELECT, user
+SELECT, revoke UPDATE, INSERT, session UPDATE, COMMIT) with
+AuthService.refresh_tokens, which rotates in one CTE statement plus COMMIT.
+A throwaway user is created for the run and deleted afterwards.
+
+Run: python scripts/bench_refresh_rotation.py --iterations 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, event, select, update
+
+from app.core.config import get_settings
+from app.core.security import generate_refresh_token, hash_refresh_token, now_utc
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.refresh_token import RefreshToken
+from app.models.session import Session as UserSession
+from app.models.user import User
+from app.modules.auth.service import AuthService
+
+settings = get_settings()
+
+
+class RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def on_execute(self, *_args) -> None:
+        self.count += 1
+
+    def on_commit(self, *_args) -> None:
+        self.count += 1
+
+
+async def legacy_refresh(db, *, refresh_token_raw: str) -> str:
+    """The pre-CTE rotation flow, kept here only as the benchmark baseline."""
+    token_record = await db.scalar(
+        select(RefreshToken).where(RefreshToken.token_hash == hash_refresh_token(refresh_token_raw)).with_for_update()
+    )
+    now = now_utc()
+    user_session = await db.scalar(select(UserSession).where(UserSession.id == token_record.session_id))
+    user = await db.scalar(select(User).where(User.id == token_record.user_id))
+    assert user_session.revoked_at is None and user.status == "ACTIVE"
+    await db.execute(update(RefreshToken).where(RefreshToken.id == token_record.id).values(revoked_at=now))
+    new_refresh_token_raw = generate_refresh_token()
+    db.add(
+        RefreshToken(
+            session_id=token_record.session_id,
+            user_id=token_record.user_id,
+            token_hash=hash_refresh_token(new_refresh_token_raw),
+            expires_at=now + timedelta(days=settings.refresh_token_ttl_days),
+            rotated_from=token_record.id,
+        )
+    )
+    await db.flush()
+    await db.execute(update(UserSession).where(UserSession.id == token_record.session_id).values(last_seen_at=now))
+    await db.commit()
+    return new_refresh_token_raw
+
+
+async def optimized_refresh(db, *, refresh_token_raw: str) -> str:
+    _, new_refresh_token_raw = await AuthService.refresh_tokens(
+        db, refresh_token_raw=refresh_token_raw, ip=None, user_agent=None
+    )
+    return new_refresh_token_raw
+
+
+async def _create_session(user_id: uuid.UUID) -> str:
+    raw = generate_refresh_token()
+    async with AsyncSessionLocal() as db:
+        user_session = UserSession(user_id=user_id)
+        db.add(user_session)
+        await db.flush()
+        db.add(
+            RefreshToken(
+                session_id=user_session.id,
+                user_id=user_id,
+                token_hash=hash_refresh_token(raw),
+                expires_at=now_utc() + timedelta(days=1),
+            )
+        )
+        await db.commit()
+    return raw
+
+
+async def run(name: str, rotate, user_id: uuid.UUID, iterations: int, counter: RoundTripCounter) -> None:
+    token = await _create_session(user_id)
+    timings = []
+    counter.count = 0
+    for _ in range(iterations):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            token = await rotate(db, refresh_token_raw=token)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(
+        f"{name:<10} round trips/refresh={counter.count / iterations:.1f}  "
+        f"p50={statistics.median(timings):.2f} ms  p99={p99:.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter.on_execute)
+    event.listen(async_engine.sync_engine, "commit", counter.on_commit)
+
+    async with AsyncSessionLocal() as db:
+        user = User(email=f"bench-{uuid.uuid4().hex[:12]}@example.invalid", password_hash="!")
+        db.add(user)
+        await db.commit()
+
+    try:
+        await run("before", legacy_refresh, user.id, args.iterations, counter)
+        await run("after", optimized_refresh, user.id, args.iterations, counter)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user.id))
+            await db.commit()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
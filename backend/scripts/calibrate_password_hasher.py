@@ -0,0 +1,63 @@
+"""
+Calibrate Argon2id cost parameters for this host.
+
+Keeps memory cost and parallelism fixed and raises time cost until a single
+hash takes at least the target latency; if even time_cost=1 is too slow,
+memory cost is halved until it fits. Prints the settings to put in .env.
+Existing hashes are upgraded transparently on the user's next login.
+
+Run: python scripts/calibrate_password_hasher.py --target-ms 250
+"""
+import argparse
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+MIN_MEMORY_COST_KIB = 8 * 1024
+MAX_TIME_COST = 32
+
+
+def _median_hash_ms(hasher: PasswordHasher, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, memory_cost_kib: int, parallelism: int, samples: int) -> tuple[int, int, float]:
+    while memory_cost_kib > MIN_MEMORY_COST_KIB:
+        elapsed = _median_hash_ms(PasswordHasher(time_cost=1, memory_cost=memory_cost_kib, parallelism=parallelism), samples)
+        if elapsed <= target_ms:
+            break
+        memory_cost_kib //= 2
+
+    time_cost = 1
+    elapsed = _median_hash_ms(PasswordHasher(time_cost=1, memory_cost=memory_cost_kib, parallelism=parallelism), samples)
+    while elapsed < target_ms and time_cost < MAX_TIME_COST:
+        time_cost += 1
+        elapsed = _median_hash_ms(
+            PasswordHasher(time_cost=time_cost, memory_cost=memory_cost_kib, parallelism=parallelism), samples
+        )
+    return time_cost, memory_cost_kib, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="desired latency of one hash")
+    parser.add_argument("--memory-kib", type=int, default=65536, help="starting memory cost in KiB")
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=5, help="hashes timed per candidate")
+    args = parser.parse_args()
+
+    time_cost, memory_cost_kib, elapsed = calibrate(args.target_ms, args.memory_kib, args.parallelism, args.samples)
+    print(f"# median {elapsed:.1f} ms per hash (target {args.target_ms:.0f} ms)")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST_KIB={memory_cost_kib}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,13 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import SessionLocal
+from app.db.session import get_sync_session
 from app.models.user import User
 
 def main():
     with open(os.path.join(os.path.dirname(__file__), "admin_check.txt"), "w") as f:
         try:
-            db = SessionLocal()
+            db = get_sync_session()
             u = db.query(User).filter_by(email='admin@sgtuniversity.org').first()
             if u:
                 f.write(f"USER EXISTS: id={u.id}, email={u.email}, status={u.status}, dept={u.department}\n")
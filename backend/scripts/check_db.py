@@ -5,11 +5,11 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import text
-from app.db.session import engine
+from app.db.session import get_sync_engine
 
 def main():
     try:
-        with engine.connect() as conn:
+        with get_sync_engine().connect() as conn:
             result = conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name='users' AND column_name='department'"))
             if result.fetchone():
                 print("SUCCESS: 'department' column exists in 'users' table.")
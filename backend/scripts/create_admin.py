@@ -1,18 +1,19 @@
+import asyncio
 import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.modules.auth.service import AuthService
 from fastapi import HTTPException
 
-def main():
+async def main():
     with open(os.path.join(os.path.dirname(__file__), "admin_create_log.txt"), "w") as f:
-        session = SessionLocal()
+        session = AsyncSessionLocal()
         try:
             f.write("Attempting to create admin user...\n")
-            user = AuthService.register_user(
+            user = await AuthService.register_user(
                 session, 
                 email="admin@sgtuniversity.org", 
                 password="DemoPass123!",
@@ -27,7 +28,7 @@ def main():
         except Exception as e:
             f.write(f"Error: {e}\n")
         finally:
-            session.close()
+            await session.close()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,7 +1,9 @@
+import asyncio
+
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.modules.auth.service import AuthService
 
 DEMO_USERS = [
@@ -14,12 +16,12 @@ DEMO_USERS = [
 ]
 
 
-def main() -> None:
-    session: Session = SessionLocal()
+async def main() -> None:
+    session: AsyncSession = AsyncSessionLocal()
     try:
         for user_data in DEMO_USERS:
             try:
-                user = AuthService.register_user(
+                user = await AuthService.register_user(
                     session, 
                     email=user_data["email"], 
                     password=user_data["password"],
@@ -32,8 +34,8 @@ def main() -> None:
                 raise
             print(f"Created demo account: {user_data['email']} (id={user.id}, dept={user.department})")
     finally:
-        session.close()
+        await session.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,9 +3,9 @@ import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import text
-from app.db.session import SessionLocal
+from app.db.session import get_sync_session
 
-db = SessionLocal()
+db = get_sync_session()
 try:
     db.execute(text("""
         CREATE TABLE IF NOT EXISTS anonymous_messages (
@@ -3,14 +3,14 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import SessionLocal
+from app.db.session import get_sync_session
 from app.models.user import User
 from app.core.security import hash_password, normalize_email
 
 def main():
     log_path = os.path.join(os.path.dirname(__file__), "admin_force_log.txt")
     with open(log_path, "w") as f:
-        session = SessionLocal()
+        session = get_sync_session()
         try:
             email = "admin@sgtuniversity.org"
             normalized = normalize_email(email)
@@ -25,6 +25,7 @@ def main():
                 user.status = "ACTIVE"
                 user.locked_until = None
                 user.failed_login_count = 0
+                user.role = "admin"
                 session.commit()
                 f.write(f"SUCCESS: Updated existing admin user (id={user.id})\n")
             else:
@@ -32,7 +33,8 @@ def main():
                 new_user = User(
                     email=normalized,
                     password_hash=hash_password(password),
-                    department="Administration"
+                    department="Administration",
+                    role="admin",
                 )
                 session.add(new_user)
                 session.commit()
@@ -5,12 +5,12 @@ from sqlalchemy import text
 # Add backend directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import engine
+from app.db.session import get_sync_engine
 
 def main():
     with open(os.path.join(os.path.dirname(__file__), "db_log.txt"), "w") as f:
         try:
-            with engine.connect() as conn:
+            with get_sync_engine().connect() as conn:
                 f.write("Connected to database. Checking columns...\n")
                 result = conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name='users' AND column_name='department'"))
                 if not result.fetchone():
@@ -4,12 +4,12 @@ from sqlalchemy import text
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import engine
+from app.db.session import get_sync_engine
 
 def main():
     with open(os.path.join(os.path.dirname(__file__), "db_log.txt"), "w") as f:
         try:
-            with engine.connect() as conn:
+            with get_sync_engine().connect() as conn:
                 f.write("Connected to database. Checking columns...\n")
                 result = conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name='users'"))
                 cols = [row[0] for row in result.fetchall()]
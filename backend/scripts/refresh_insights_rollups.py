@@ -0,0 +1,37 @@
+"""
+Refresh the insights rollup tables (daily_session_rollups, insights_snapshots).
+
+The API does this every INSIGHTS_ROLLUP_INTERVAL_SECONDS when
+INSIGHTS_ROLLUPS_ENABLED is set; run this after a bulk import, or with
+--rebuild to re-aggregate every day from the sessions still on record.
+Note that a rebuild drops days whose sessions the expiry sweeper has deleted.
+
+Run: python scripts/refresh_insights_rollups.py [--rebuild]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import async_engine
+from app.modules.insights.rollups import refresh_rollups
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rebuild", action="store_true", help="re-aggregate all days, not just the newest")
+    args = parser.parse_args()
+
+    try:
+        report = await refresh_rollups(rebuild=args.rebuild)
+    finally:
+        await async_engine.dispose()
+
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""
+Delete expired/revoked refresh tokens, sessions and password reset tokens.
+
+Uses the same retention settings as the in-process sweeper (SWEEPER_ENABLED);
+suitable for cron when the API runs somewhere background tasks cannot.
+
+Run: python scripts/sweep_expired.py [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import async_engine
+from app.modules.auth.sweeper import sweep_expired
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--pause-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    try:
+        report = await sweep_expired(batch_size=args.batch_size, pause_seconds=args.pause_seconds)
+    finally:
+        await async_engine.dispose()
+
+    for table, reclaimed in report.items():
+        print(f"{table}: {reclaimed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+import os
+
+# Settings are read when app modules are imported: give the suite throwaway secrets,
+# a cheap password hasher, and no connection pool (every TestClient runs its own
+# event loop, and async connections cannot move between loops).
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg://postgres@localhost:5432/dashboard_test")
+os.environ.setdefault("JWT_ACCESS_SECRET", "test-access-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET", "test-refresh-secret")
+os.environ.setdefault("PASSWORD_PEPPER", "test-pepper")
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST_KIB", "8192")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+os.environ.setdefault("DB_POOL_MODE", "null")
+os.environ.setdefault("INSIGHTS_ROLLUPS_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import uuid
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.config import get_settings
+from app.db.base import Base
+from app.main import app
+
+API = get_settings().api_v1_prefix
+PASSWORD = "DemoPass123!"
+
+
+@pytest.fixture(scope="session")
+def sync_engine() -> Engine:
+    """Engine on DATABASE_URL with the schema in place; skips the test when no database is reachable."""
+    engine = create_engine(get_settings().database_url, poolclass=NullPool)
+    try:
+        with engine.connect():
+            pass
+    except DBAPIError as exc:
+        engine.dispose()
+        pytest.skip(f"database not available: {exc.orig}")
+    Base.metadata.create_all(engine, checkfirst=True)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def app_client(sync_engine: Engine) -> TestClient:
+    # One lifespan for the whole run: shutdown stops the password hash pool for good.
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(app_client: TestClient) -> TestClient:
+    app_client.cookies.clear()
+    return app_client
+
+
+@pytest.fixture
+def login(client: TestClient) -> Callable[[str], dict[str, str]]:
+    """Register a fresh user whose email starts with ``role`` and return its bearer header.
+
+    The role comes from the email (see ``role_from_email``), so "admin" and
+    "hod" give those roles and anything else gives faculty. The client keeps
+    the user's auth cookies.
+    """
+
+    def register_and_login(role: str = "faculty") -> dict[str, str]:
+        email = f"{role}.{uuid.uuid4().hex[:8]}@sgtuniversity.org"
+        response = client.post(f"{API}/auth/register", json={"email": email, "password": PASSWORD})
+        assert response.status_code == 201, response.text
+        response = client.post(f"{API}/auth/login", json={"email": email, "password": PASSWORD})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return register_and_login
@@ -0,0 +1,118 @@
+"""Refresh-token rotation and session revocation, through the API."""
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.core.config import get_settings
+from app.core.security import now_utc
+from app.models.session import Session as UserSession
+from app.modules.auth.denylist import RevocationDenylist, revocation_denylist
+from app.modules.auth.router import REFRESH_COOKIE_NAME, REFRESH_COOKIE_PATH
+
+API = get_settings().api_v1_prefix
+
+
+def _replay_refresh(client, refresh_token: str):
+    client.cookies.set(REFRESH_COOKIE_NAME, refresh_token, path=REFRESH_COOKIE_PATH)
+    return client.post(f"{API}/auth/refresh")
+
+
+def test_refresh_rotates_the_token(client, login):
+    login()
+    old_token = client.cookies.get(REFRESH_COOKIE_NAME)
+
+    response = client.post(f"{API}/auth/refresh")
+
+    assert response.status_code == 200, response.text
+    assert client.cookies.get(REFRESH_COOKIE_NAME) != old_token
+    me = client.get(f"{API}/auth/me", headers={"Authorization": f"Bearer {response.json()['access_token']}"})
+    assert me.status_code == 200
+
+
+def test_replayed_refresh_token_revokes_the_session(client, login):
+    headers = login()
+    old_token = client.cookies.get(REFRESH_COOKIE_NAME)
+    rotated = client.post(f"{API}/auth/refresh")
+    assert rotated.status_code == 200, rotated.text
+    new_token = client.cookies.get(REFRESH_COOKIE_NAME)
+
+    replayed = _replay_refresh(client, old_token)
+
+    assert replayed.status_code == 401
+    assert replayed.json()["detail"] == "Token reuse detected. Please login again"
+    # The whole session is gone: its access tokens and the current refresh token too.
+    assert client.get(f"{API}/auth/me", headers=headers).status_code == 401
+    rotated_headers = {"Authorization": f"Bearer {rotated.json()['access_token']}"}
+    assert client.get(f"{API}/auth/me", headers=rotated_headers).status_code == 401
+    assert _replay_refresh(client, new_token).status_code == 401
+
+
+def test_unknown_refresh_token_is_rejected(client, login):
+    login()
+    response = _replay_refresh(client, "not-a-real-token")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid refresh token"
+
+
+def test_denylist_entries_expire_after_retention():
+    denylist = RevocationDenylist(retention=timedelta(minutes=15))
+    live, stale = uuid.uuid4(), uuid.uuid4()
+
+    denylist.add([live])
+    denylist.add([stale], revoked_at=now_utc() - timedelta(minutes=16))
+
+    assert denylist.contains(live)
+    assert denylist.contains(str(live))
+    assert not denylist.contains(stale)
+    assert not denylist.contains(uuid.uuid4())
+    denylist.prune()
+    assert len(denylist) == 1
+
+
+@pytest.mark.anyio
+async def test_denylist_sync_picks_up_revocations_from_the_database(sync_engine, client, login):
+    me = client.get(f"{API}/auth/me", headers=login()).json()
+    revoked_at = now_utc()
+    with sync_engine.begin() as conn:
+        session_ids = conn.execute(
+            update(UserSession)
+            .where(UserSession.user_id == uuid.UUID(me["id"]), UserSession.revoked_at.is_(None))
+            .values(revoked_at=revoked_at)
+            .returning(UserSession.id)
+        ).scalars().all()
+    denylist = RevocationDenylist(retention=timedelta(minutes=15))
+
+    assert await denylist.sync() >= len(session_ids) > 0
+
+    assert all(denylist.contains(session_id) for session_id in session_ids)
+
+
+def test_stateless_logout_is_enforced_by_the_denylist(client, login, monkeypatch):
+    monkeypatch.setattr(get_settings(), "auth_stateless", True)
+    headers = login()
+    assert client.get(f"{API}/auth/me", headers=headers).status_code == 200
+
+    assert client.post(f"{API}/auth/logout", headers=headers).status_code == 200
+
+    assert client.get(f"{API}/auth/me", headers=headers).status_code == 401
+    assert len(revocation_denylist) > 0
+
+
+@pytest.mark.anyio
+async def test_deleted_users_tokens_are_rejected_by_other_workers(client, login, monkeypatch):
+    monkeypatch.setattr(get_settings(), "auth_stateless", True)
+    admin_headers, victim_headers = login("admin"), login()
+    victim_id = client.get(f"{API}/auth/me", headers=victim_headers).json()["id"]
+    # Another worker: its denylist has not seen the delete this process handled.
+    other_worker = RevocationDenylist(retention=timedelta(minutes=15))
+    await other_worker.sync()
+    monkeypatch.setattr("app.modules.auth.dependencies.revocation_denylist", other_worker)
+
+    assert client.delete(f"{API}/users/{victim_id}", headers=admin_headers).status_code == 204
+    assert client.get(f"{API}/auth/me", headers=victim_headers).status_code == 200
+
+    await other_worker.sync()
+
+    assert client.get(f"{API}/auth/me", headers=victim_headers).status_code == 401
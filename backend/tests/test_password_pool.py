@@ -0,0 +1,40 @@
+"""Admission control of the Argon2 worker pool."""
+import asyncio
+import threading
+
+import pytest
+
+from app.core.password_pool import PasswordHashPool
+from app.utils.exceptions import AppException
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_keeps_its_slot_until_the_job_finishes():
+    pool = PasswordHashPool(workers=1, max_queue=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash() -> str:
+        started.set()
+        release.wait(5)
+        return "hash"
+
+    try:
+        waiter = asyncio.create_task(pool.run(slow_hash))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # The hash is still running, so the pool is still full.
+        with pytest.raises(AppException):
+            await pool.run(str)
+        assert pool.snapshot()["rejected"] == 1
+
+        release.set()
+        while pool.snapshot()["completed"] < 1 or pool.snapshot()["queued"]:
+            await asyncio.sleep(0.01)
+        assert await pool.run(str, "next") == "next"
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,159 @@
+"""Each list endpoint's Projection must produce exactly what its single-row serializer does."""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+
+from app.db.projection import Projection
+from app.models.announcement import Announcement
+from app.models.event import Event
+from app.models.form import FormDefinition
+from app.models.placement_record import PlacementRecord
+from app.models.project import Project
+from app.models.student import Student
+from app.modules.announcements.router import ANNOUNCEMENT_FIELDS
+from app.modules.announcements.router import _to_out as announcement_out
+from app.modules.events.router import EVENT_FIELDS
+from app.modules.events.router import _to_out as event_out
+from app.modules.forms.router import FORM_FIELDS
+from app.modules.forms.router import _to_out as form_out
+from app.modules.placement.router import PLACEMENT_RECORD_FIELDS
+from app.modules.placement.schemas import PlacementRecordResponse
+from app.modules.projects.router import PROJECT_FIELDS
+from app.modules.projects.router import _to_out as project_out
+from app.modules.students.router import STUDENT_FIELDS, _to_response
+
+API = get_settings().api_v1_prefix
+
+
+def _placement_out(record: PlacementRecord) -> dict:
+    values = {name: getattr(record, name) for name in PlacementRecordResponse.model_fields}
+    return PlacementRecordResponse(**{**values, "id": str(record.id)}).model_dump()
+
+
+def _rows():
+    """One row per model, the nullable and JSON columns filled both ways."""
+    tag = uuid.uuid4().hex[:8]
+    coordinator = {"id": "f1", "name": "Dr. A", "email": "a@sgtuniversity.org", "department": "CS", "role": "faculty"}
+    deadline = datetime.now(timezone.utc) + timedelta(days=7)
+    return [
+        (
+            PROJECT_FIELDS,
+            project_out,
+            [
+                Project(
+                    title="Full", type="Research", description="d", start_date="2026-01-01", end_date="2026-02-01",
+                    created_by="f1", faculty_coordinator=coordinator, approval_submitted_by="f1",
+                    external_faculty=coordinator, ppt_file={"name": "p.pptx", "url": "/p.pptx"},
+                    assigned_students=[{"id": "s1", "name": "S"}], rejection_reason="r", notes="n",
+                ),
+                Project(
+                    title="Sparse", type="Dev", description="d", start_date="2026-01-01", end_date="2026-02-01",
+                    created_by="f1", faculty_coordinator=coordinator, approval_submitted_by="f1",
+                    assigned_students=None,
+                ),
+            ],
+        ),
+        (
+            EVENT_FIELDS,
+            event_out,
+            [Event(event_name="Seminar", room_number="B-101", date="2026-01-01", time_slot="10-11", booked_by="f1")],
+        ),
+        (
+            ANNOUNCEMENT_FIELDS,
+            announcement_out,
+            [
+                Announcement(title="All", message="m", author="x", author_role="admin"),
+                Announcement(title="Sem 4", message="m", author="x", author_role="hod", target_semester="4"),
+            ],
+        ),
+        (
+            FORM_FIELDS,
+            form_out,
+            [
+                FormDefinition(title="F", created_by="f1", deadline=deadline, fields=[{"label": "Q"}]),
+                FormDefinition(title="G", created_by="f1", deadline=deadline, target_semester="2"),
+            ],
+        ),
+        (
+            STUDENT_FIELDS,
+            lambda student: _to_response(student).model_dump(),
+            [
+                Student(
+                    name="Alice", roll_no=f"P-{tag}-1", course="B.Tech CS", department="CS", semester=3,
+                    email="alice@example.org", phone="99999",
+                ),
+                Student(name="Bob", roll_no=f"P-{tag}-2", course="B.Tech IT", department="IT", semester=1),
+            ],
+        ),
+        (
+            PLACEMENT_RECORD_FIELDS,
+            _placement_out,
+            [
+                PlacementRecord(roll_no=f"P-{tag}", student_name="Alice", sl_no=1, company_name="Acme", package="4"),
+                PlacementRecord(roll_no="", student_name="Bob"),
+            ],
+        ),
+    ]
+
+
+@pytest.fixture
+def db(sync_engine) -> Session:
+    with Session(sync_engine) as session:
+        yield session
+
+
+@pytest.mark.parametrize(
+    "fields, serialize, rows", _rows(), ids=["projects", "events", "announcements", "forms", "students", "placement"]
+)
+def test_projection_matches_serializer(db: Session, fields: Projection, serialize, rows):
+    db.add_all(rows)
+    db.commit()
+    model = type(rows[0])
+    try:
+        names = fields.parse(None)
+        result = db.execute(fields.select(names).where(model.id.in_([row.id for row in rows]))).all()
+        projected = {str(row["id"]): row for row in fields.rows(result, names)}
+
+        for row in rows:
+            expected = serialize(row)
+            assert names == list(expected)
+            assert projected[str(row.id)] == expected
+    finally:
+        for row in rows:
+            db.delete(row)
+        db.commit()
+
+
+def test_projection_reads_only_the_requested_fields():
+    names = STUDENT_FIELDS.parse(" rollNo, name ,rollNo")
+
+    assert names == ["rollNo", "name"]
+    assert [column.name for column in STUDENT_FIELDS.select(names).selected_columns] == ["roll_no", "name"]
+    with pytest.raises(ValueError, match="Unknown fields: nope"):
+        STUDENT_FIELDS.parse("name,nope")
+
+
+def test_placement_records_keep_their_schema_with_sparse_fields(client, login, db: Session):
+    record = PlacementRecord(roll_no=f"P-{uuid.uuid4().hex[:8]}", student_name="Alice", company_name="Acme")
+    db.add(record)
+    db.commit()
+    try:
+        headers = login()
+        full = client.get(f"{API}/placement/records", headers=headers).json()
+        sparse = client.get(f"{API}/placement/records?fields=roll_no,company_name", headers=headers).json()
+
+        assert next(row for row in full if row["id"] == str(record.id)) == _placement_out(record)
+        assert {"roll_no": record.roll_no, "company_name": "Acme"} in sparse
+        assert all(list(row) == ["roll_no", "company_name"] for row in sparse)
+    finally:
+        db.delete(record)
+        db.commit()
+
+    schema = client.get("/openapi.json").json()["paths"][f"{API}/placement/records"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/PlacementRecordFields"
+    }
@@ -0,0 +1,102 @@
+"""EXPLAIN-based regression checks: each hot query must be served by its index.
+
+Sequential and bitmap scans are disabled for the EXPLAIN, so even on a small
+database the planner shows whether the expected index *can* serve the query.
+A failure usually means a cast on an indexed column or a dropped index.
+"""
+import json
+import uuid
+
+import pytest
+from sqlalchemy import func, select, tuple_, update
+
+from app.core.security import now_utc
+from app.models.attendance import AttendanceRecord
+from app.models.refresh_token import RefreshToken
+from app.models.session import Session as UserSession
+from app.models.student import Student
+from app.models.user import User
+
+SAMPLE_ID = uuid.uuid4()
+INDEX_SCANS = ("Index Scan", "Index Only Scan")
+# Alembic names the unique constraint; create_all leaves Postgres to name it.
+TOKEN_HASH_INDEXES = ("uq_refresh_tokens_token_hash", "refresh_tokens_token_hash_key")
+LATEST_TERM = select(func.max(AttendanceRecord.term)).scalar_subquery()
+
+HOT_QUERIES = {
+    "user by id": (select(User).where(User.id == SAMPLE_ID), "users_pkey"),
+    "user by email": (select(User).where(User.email == "someone@sgtuniversity.org"), "ix_users_email"),
+    "users by role": (select(User).where(User.role == "hod"), "ix_users_role"),
+    "session by id": (select(UserSession).where(UserSession.id == SAMPLE_ID), "sessions_pkey"),
+    "sessions by user": (select(UserSession).where(UserSession.user_id == SAMPLE_ID), "ix_sessions_user_id"),
+    "sessions started since": (
+        select(UserSession.id).where(UserSession.started_at >= now_utc()),
+        "ix_sessions_started_at",
+    ),
+    "refresh token by hash": (select(RefreshToken).where(RefreshToken.token_hash == "0" * 64), TOKEN_HASH_INDEXES),
+    "revoke refresh tokens by session": (
+        update(RefreshToken)
+        .where(RefreshToken.session_id == SAMPLE_ID, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now_utc()),
+        "ix_refresh_tokens_session_id",
+    ),
+    "revoke refresh tokens by user": (
+        update(RefreshToken)
+        .where(RefreshToken.user_id == SAMPLE_ID, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now_utc()),
+        "ix_refresh_tokens_user_id",
+    ),
+    "student by id": (select(Student).where(Student.id == SAMPLE_ID), "students_pkey"),
+    "student by roll no": (select(Student).where(Student.roll_no == "CS-2024-001"), "ix_students_roll_no"),
+    "students keyset page": (
+        select(Student)
+        .where(tuple_(Student.created_at, Student.id) < tuple_(now_utc(), SAMPLE_ID))
+        .order_by(Student.created_at.desc(), Student.id.desc())
+        .limit(11),
+        "ix_students_created_at_id",
+    ),
+    "attendance bitmaps by student": (
+        select(AttendanceRecord).where(AttendanceRecord.student_id == SAMPLE_ID),
+        "attendance_records_pkey",
+    ),
+    "attendance bitmaps by term": (
+        select(AttendanceRecord.student_id).where(AttendanceRecord.term == "2026-ODD"),
+        "ix_attendance_records_term",
+    ),
+    "attendance bitmaps for latest term": (
+        select(AttendanceRecord.presence).where(AttendanceRecord.term == LATEST_TERM),
+        "ix_attendance_records_term",
+    ),
+}
+
+
+def _index_scans(plan: dict) -> list[tuple[str, str]]:
+    found = []
+    if plan.get("Node Type") in INDEX_SCANS:
+        found.append((plan["Node Type"], plan.get("Index Name", "")))
+    for child in plan.get("Plans", []):
+        found.extend(_index_scans(child))
+    return found
+
+
+@pytest.fixture(scope="module")
+def explain(sync_engine):
+    with sync_engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        conn.exec_driver_sql("SET enable_bitmapscan = off")
+
+        def run(statement) -> dict:
+            compiled = statement.compile(dialect=sync_engine.dialect)
+            row = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params).scalar_one()
+            return (json.loads(row) if isinstance(row, str) else row)[0]["Plan"]
+
+        yield run
+        conn.rollback()
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_index(explain, name):
+    statement, expected = HOT_QUERIES[name]
+    expected = (expected,) if isinstance(expected, str) else expected
+    scans = _index_scans(explain(statement))
+    assert any(index in expected for _, index in scans), f"{name}: expected index scan on {expected}, got {scans}"
@@ -0,0 +1,67 @@
+"""Where session activity (last seen, IP, user agent) gets written."""
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.models.session import Session as UserSession
+from app.modules.auth.activity import session_activity
+
+API = get_settings().api_v1_prefix
+
+
+def _last_seen(sync_engine, user_id: str):
+    with sync_engine.connect() as conn:
+        return conn.scalar(select(UserSession.last_seen_at).where(UserSession.user_id == uuid.UUID(user_id)))
+
+
+@pytest.fixture
+def write_through(monkeypatch):
+    monkeypatch.setattr(get_settings(), "session_activity_write_behind", False)
+
+
+def test_requests_are_buffered_with_write_behind(client, login):
+    headers = login()
+    recorded = session_activity.snapshot()["recorded"]
+
+    assert client.get(f"{API}/auth/me", headers=headers).status_code == 200
+
+    assert session_activity.snapshot()["recorded"] == recorded + 1
+
+
+def test_requests_write_nothing_without_write_behind(client, login, sync_engine, write_through):
+    headers = login()
+    recorded = session_activity.snapshot()["recorded"]
+    user_id = client.get(f"{API}/auth/me", headers=headers).json()["id"]
+    before = _last_seen(sync_engine, user_id)
+
+    assert client.get(f"{API}/auth/me", headers=headers).status_code == 200
+
+    assert _last_seen(sync_engine, user_id) == before
+    assert session_activity.snapshot()["recorded"] == recorded
+
+
+def test_refresh_writes_activity_without_write_behind(client, login, sync_engine, write_through):
+    user_id = client.get(f"{API}/auth/me", headers=login()).json()["id"]
+    before = _last_seen(sync_engine, user_id)
+
+    assert client.post(f"{API}/auth/refresh", headers={"User-Agent": "refresh-test"}).status_code == 200
+
+    with sync_engine.connect() as conn:
+        last_seen, user_agent = conn.execute(
+            select(UserSession.last_seen_at, UserSession.user_agent).where(UserSession.user_id == uuid.UUID(user_id))
+        ).one()
+    assert last_seen > before
+    assert user_agent == "refresh-test"
+
+
+def test_anonymous_messages_leave_no_session_activity(client, login):
+    headers = login()
+    recorded = session_activity.snapshot()["recorded"]
+
+    response = client.post(f"{API}/messages/anonymous", json={"message": "anonymous"}, headers=headers)
+
+    assert response.status_code == 201, response.text
+    assert session_activity.snapshot()["recorded"] == recorded
+    assert client.post(f"{API}/messages/anonymous", json={"message": "anonymous"}).status_code == 401
@@ -0,0 +1,172 @@
+"""Roster import and bulk update/delete of students, through the API."""
+import io
+import uuid
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.core.config import get_settings
+from app.models.student import Student
+from app.modules.students.roster import parse_roster_upload
+
+API = get_settings().api_v1_prefix
+
+
+@pytest.fixture
+def course(sync_engine) -> str:
+    """A course name no other test uses; its students are deleted afterwards."""
+    name = f"Test Course {uuid.uuid4().hex[:8]}"
+    yield name
+    with sync_engine.begin() as conn:
+        conn.execute(delete(Student).where(Student.course == name))
+
+
+def _roster(course: str, rows: list[tuple[str, str, int]]) -> str:
+    lines = ["Name,Roll No.,Course,Semester,Email"]
+    lines += [f"{name},{roll_no},{course},{semester},{roll_no.lower()}@example.org" for name, roll_no, semester in rows]
+    return "\n".join(lines) + "\n"
+
+
+def _import(client, headers, body: str):
+    return client.post(f"{API}/students/import", files={"file": ("roster.csv", body, "text/csv")}, headers=headers)
+
+
+def _semesters(sync_engine, course: str) -> dict[str, int]:
+    with sync_engine.connect() as conn:
+        return dict(conn.execute(select(Student.roll_no, Student.semester).where(Student.course == course)).all())
+
+
+def _seed(client, headers, course: str, semesters: list[int]) -> list[str]:
+    tag = uuid.uuid4().hex[:6]
+    roll_nos = [f"T-{tag}-{index}" for index in range(len(semesters))]
+    rows = [(f"Student {index}", roll_no, semester) for index, (roll_no, semester) in enumerate(zip(roll_nos, semesters))]
+    response = _import(client, headers, _roster(course, rows))
+    assert response.status_code == 200, response.text
+    return roll_nos
+
+
+def test_import_counts_inserts_then_updates(client, login, sync_engine, course):
+    headers = login("admin")
+    tag = uuid.uuid4().hex[:6]
+    rows = [(f"Student {index}", f"R-{tag}-{index}", 2) for index in range(3)]
+
+    first = _import(client, headers, _roster(course, rows))
+    assert first.status_code == 200, first.text
+    assert (first.json()["inserted"], first.json()["updated"], first.json()["failed"]) == (3, 0, 0)
+
+    # Two students move up a semester and one is new.
+    rows = [(name, roll_no, 3) for name, roll_no, _ in rows[:2]] + [("Student 3", f"R-{tag}-3", 1)]
+    second = _import(client, headers, _roster(course, rows))
+    assert second.status_code == 200, second.text
+    assert (second.json()["inserted"], second.json()["updated"]) == (1, 2)
+
+    assert _semesters(sync_engine, course) == {
+        f"R-{tag}-0": 3,
+        f"R-{tag}-1": 3,
+        f"R-{tag}-2": 2,
+        f"R-{tag}-3": 1,
+    }
+
+
+def test_import_reports_bad_rows_and_keeps_the_rest(client, login, sync_engine, course):
+    headers = login("admin")
+    tag = uuid.uuid4().hex[:6]
+    body = _roster(course, [("Good", f"G-{tag}", 1)]) + f"No Semester,B-{tag},{course},,\n"
+
+    response = _import(client, headers, body)
+
+    assert response.status_code == 200, response.text
+    assert (response.json()["inserted"], response.json()["failed"]) == (1, 1)
+    assert response.json()["errors"][0]["row"] == 3
+    assert list(_semesters(sync_engine, course)) == [f"G-{tag}"]
+
+
+def test_import_requires_admin_dean_or_hod(client, login, course):
+    response = _import(client, login("faculty"), _roster(course, [("A", f"F-{uuid.uuid4().hex[:6]}", 1)]))
+    assert response.status_code == 403
+
+
+def test_roster_upload_falls_back_to_latin1():
+    body = "Name,Roll No.,Course,Semester\nRenée Müller,R-1,B.Tech CS,3\n"
+
+    roster = parse_roster_upload(io.BytesIO(body.encode("latin-1")), xlsx=False)
+
+    assert roster.errors == []
+    assert [(row[0], row[1]) for row in roster.rows] == [("R-1", "Renée Müller")]
+
+
+def test_bulk_update_touches_only_the_filtered_students(client, login, sync_engine, course):
+    headers = login("hod")
+    roll_nos = _seed(client, headers, course, [4, 4, 2])
+
+    response = client.post(
+        f"{API}/students/bulk-update",
+        json={"filter": {"course": course, "semester": 4}, "patch": {"promoteBy": 1}},
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": 2, "bySemester": {"5": 2}}
+    assert _semesters(sync_engine, course) == {roll_nos[0]: 5, roll_nos[1]: 5, roll_nos[2]: 2}
+
+
+def test_bulk_update_promotion_stops_at_the_last_semester(client, login, sync_engine, course):
+    headers = login("admin")
+    roll_nos = _seed(client, headers, course, [11, 12])
+
+    response = client.post(
+        f"{API}/students/bulk-update",
+        json={"filter": {"course": course}, "patch": {"promoteBy": 2}},
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert _semesters(sync_engine, course) == {roll_nos[0]: 12, roll_nos[1]: 12}
+
+
+def test_bulk_update_by_ids(client, login, sync_engine, course):
+    headers = login("admin")
+    roll_nos = _seed(client, headers, course, [1, 1])
+    with sync_engine.connect() as conn:
+        first_id = conn.scalar(select(Student.id).where(Student.roll_no == roll_nos[0]))
+
+    response = client.post(
+        f"{API}/students/bulk-update",
+        json={"ids": [str(first_id)], "patch": {"cvStatus": "UPLOADED"}},
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == 1
+    with sync_engine.connect() as conn:
+        statuses = dict(conn.execute(select(Student.roll_no, Student.cv_status).where(Student.course == course)).all())
+    assert statuses[roll_nos[0]] == "UPLOADED"
+    assert statuses[roll_nos[1]] != "UPLOADED"
+
+
+def test_bulk_delete_removes_only_the_filtered_students(client, login, sync_engine, course):
+    headers = login("admin")
+    roll_nos = _seed(client, headers, course, [3, 3, 5])
+
+    response = client.post(
+        f"{API}/students/bulk-delete", json={"filter": {"course": course, "semester": 3}}, headers=headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": 2, "bySemester": {"3": 2}}
+    assert _semesters(sync_engine, course) == {roll_nos[2]: 5}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"filter": {}},
+        {"ids": []},
+        {"ids": ["not-a-uuid"]},
+        {"ids": [str(uuid.uuid4())], "filter": {"semester": 1}},
+        {},
+    ],
+)
+def test_bulk_delete_rejects_unsafe_selections(client, login, payload):
+    response = client.post(f"{API}/students/bulk-delete", json=payload, headers=login("admin"))
+    assert response.status_code == 400, response.text
@@ -0,0 +1,64 @@
+"""Gap-filled session trends over ranges that cut buckets short."""
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, insert
+
+from app.core.enums import TrendGranularity
+from app.db.session import AsyncSessionLocal
+from app.models.session import Session as UserSession
+from app.models.user import User
+from app.modules.insights.trends import session_trend
+
+# A Wednesday, so a 12-day range starts on a Saturday and weeks are cut at both ends.
+TODAY = date(2026, 3, 11)
+
+
+@pytest.fixture
+def department(sync_engine) -> str:
+    """A department with one session at noon on each of the 14 days up to TODAY."""
+    name = f"Trend {uuid.uuid4().hex[:8]}"
+    user_id = uuid.uuid4()
+    with sync_engine.begin() as conn:
+        conn.execute(
+            insert(User).values(
+                id=user_id, email=f"trend.{user_id.hex[:8]}@sgtuniversity.org", password_hash="x", department=name
+            )
+        )
+        conn.execute(
+            insert(UserSession),
+            [
+                {"user_id": user_id, "started_at": datetime.combine(TODAY - timedelta(days=offset), time(12), timezone.utc)}
+                for offset in range(14)
+            ],
+        )
+    yield name
+    with sync_engine.begin() as conn:
+        conn.execute(delete(User).where(User.id == user_id))
+
+
+@pytest.mark.anyio
+async def test_partial_buckets_count_only_days_in_range(department):
+    async with AsyncSessionLocal() as db:
+        buckets = await session_trend(
+            db, days=12, granularity=TrendGranularity.WEEK, department=department, today=TODAY
+        )
+
+    assert [(bucket.start, bucket.days, bucket.sessions) for bucket in buckets] == [
+        (date(2026, 2, 23), 2, 2),  # only the weekend is in range
+        (date(2026, 3, 2), 7, 7),
+        (date(2026, 3, 9), 3, 3),  # the current week so far
+    ]
+
+
+@pytest.mark.anyio
+async def test_daily_buckets_are_whole_days(department):
+    async with AsyncSessionLocal() as db:
+        buckets = await session_trend(db, days=3, granularity=TrendGranularity.DAY, department=department, today=TODAY)
+
+    assert [(bucket.start, bucket.days, bucket.sessions) for bucket in buckets] == [
+        (TODAY - timedelta(days=2), 1, 1),
+        (TODAY - timedelta(days=1), 1, 1),
+        (TODAY, 1, 1),
+    ]
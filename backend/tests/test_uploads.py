@@ -0,0 +1,49 @@
+"""CSV uploads exported on Windows: Latin-1 instead of UTF-8."""
+import io
+import uuid
+
+from sqlalchemy import delete, func, select
+
+from app.core.config import get_settings
+from app.core.uploads import parse_tabular_upload
+from app.models.placement_record import PlacementRecord
+from app.modules.placement.parser import PLACEMENT_BATCH_SIZE
+
+API = get_settings().api_v1_prefix
+
+
+def test_tabular_upload_reads_utf8_with_bom():
+    stream = io.BytesIO("\ufeffName,City\nJosé,Zürich\n".encode("utf-8"))
+    assert parse_tabular_upload(stream, list, xlsx=False) == [["Name", "City"], ["José", "Zürich"]]
+
+
+def test_tabular_upload_falls_back_to_latin1():
+    stream = io.BytesIO("Name,City\nJosé,Zürich\n".encode("latin-1"))
+    assert parse_tabular_upload(stream, list, xlsx=False) == [["Name", "City"], ["José", "Zürich"]]
+
+
+def test_placement_upload_falls_back_to_latin1(client, login, sync_engine):
+    tag = uuid.uuid4().hex[:8]
+    # The only non-UTF-8 byte is in the last row, after a full batch has been inserted,
+    # so the UTF-8 attempt must be rolled back rather than counted twice.
+    rows = [f"{index},{tag}-{index},Student {index},Acme" for index in range(2 * PLACEMENT_BATCH_SIZE)]
+    rows.append(f"0,{tag}-last,Renée,Société Générale")
+    body = "Sl. No.,Roll No.,STUDENT'S NAME,Name of the company\n" + "\n".join(rows) + "\n"
+
+    try:
+        response = client.post(
+            f"{API}/placement/upload",
+            files={"file": ("placement.csv", body.encode("latin-1"), "text/csv")},
+            headers=login(),
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.json()["processed"] == len(rows)
+        with sync_engine.connect() as conn:
+            count = conn.scalar(select(func.count()).where(PlacementRecord.roll_no.startswith(f"{tag}-")))
+            company = conn.scalar(select(PlacementRecord.company_name).where(PlacementRecord.roll_no == f"{tag}-last"))
+        assert count == len(rows)
+        assert company == "Société Générale"
+    finally:
+        with sync_engine.begin() as conn:
+            conn.execute(delete(PlacementRecord).where(PlacementRecord.roll_no.startswith(f"{tag}-")))
@@ -5,6 +5,7 @@ import StatusBadge from "@/components/students/StatusBadge";
 import StudentDirectoryFilters from "@/components/students/StudentDirectoryFilters";
 import { Button } from "@/components/ui/button";
 import { apiGet } from "@/lib/api/client";
+import { PaginatedResponse } from "@/lib/types/api";
 import { Student } from "@/lib/types/student";
 import { getInitials } from "@/lib/utils/formatters";
 import {
@@ -20,13 +21,6 @@ import { useCallback, useEffect, useState } from "react";
 
 const ITEMS_PER_PAGE = 5;
 
-interface PaginatedResponse {
-    data: Student[];
-    total: number;
-    page: number;
-    limit: number;
-}
-
 // Avatar color palette
 const avatarColors = [
     "bg-orange-100 text-orange-600",
@@ -65,7 +59,9 @@ export default function StudentsPage() {
 
     // Data
     const [students, setStudents] = useState<Student[]>([]);
-    const [totalStudents, setTotalStudents] = useState(0);
+    // null when the API skipped the count; paging then relies on nextCursor.
+    const [totalStudents, setTotalStudents] = useState<number | null>(0);
+    const [hasNextPage, setHasNextPage] = useState(false);
     const [loading, setLoading] = useState(true);
 
     const fetchStudents = useCallback(async () => {
@@ -79,9 +75,10 @@ export default function StudentsPage() {
             if (semesterFilter > 0) params.set("semester", String(semesterFilter));
             if (searchQuery) params.set("search", searchQuery);
 
-            const res = await apiGet<PaginatedResponse>(`/students?${params.toString()}`);
+            const res = await apiGet<PaginatedResponse<Student>>(`/students?${params.toString()}`);
             setStudents(res.data);
             setTotalStudents(res.total);
+            setHasNextPage(Boolean(res.nextCursor));
         } catch {
             // Fallback: keep whatever we have
         } finally {
@@ -93,9 +90,15 @@ export default function StudentsPage() {
         void fetchStudents();
     }, [fetchStudents]);
 
-    const totalPages = Math.max(1, Math.ceil(totalStudents / ITEMS_PER_PAGE));
+    const totalPages =
+        totalStudents === null
+            ? currentPage + (hasNextPage ? 1 : 0)
+            : Math.max(1, Math.ceil(totalStudents / ITEMS_PER_PAGE));
     const startItem = (currentPage - 1) * ITEMS_PER_PAGE + 1;
-    const endItem = Math.min(currentPage * ITEMS_PER_PAGE, totalStudents);
+    const endItem =
+        totalStudents === null
+            ? startItem + students.length - 1
+            : Math.min(currentPage * ITEMS_PER_PAGE, totalStudents);
 
     const clearFilters = () => {
         setCourseFilter("all");
@@ -299,12 +302,18 @@ export default function StudentsPage() {
                     <p className="text-sm text-gray-500">
                         Showing{" "}
                         <span className="font-medium text-[#1a6fdb]">
-                            {totalStudents > 0 ? startItem : 0} to {endItem}
+                            {students.length > 0 ? startItem : 0} to {endItem}
                         </span>{" "}
-                        of{" "}
-                        <span className="font-medium text-gray-700">
-                            {totalStudents} students
-                        </span>
+                        {totalStudents === null ? (
+                            "students"
+                        ) : (
+                            <>
+                                of{" "}
+                                <span className="font-medium text-gray-700">
+                                    {totalStudents} students
+                                </span>
+                            </>
+                        )}
                     </p>
                     <div className="flex items-center gap-1">
                         <button
@@ -24,9 +24,16 @@ export default function StudentDirectoryTable({
 }: StudentDirectoryTableProps) {
     const [data] = useState(initialData);
     const [currentPage, setCurrentPage] = useState(data.page);
-    const totalPages = Math.ceil(data.total / data.limit);
+    // total is null when the API skipped the count; paging then relies on nextCursor.
+    const totalPages =
+        data.total === null
+            ? currentPage + (data.nextCursor ? 1 : 0)
+            : Math.ceil(data.total / data.limit);
     const startItem = (currentPage - 1) * data.limit + 1;
-    const endItem = Math.min(currentPage * data.limit, data.total);
+    const endItem =
+        data.total === null
+            ? startItem + data.data.length - 1
+            : Math.min(currentPage * data.limit, data.total);
 
     // Avatar colors based on name hash
     const avatarColors = [
@@ -196,10 +203,15 @@ export default function StudentDirectoryTable({
             {/* Pagination */}
             <div className="flex items-center justify-between px-5 py-3">
                 <p className="text-sm text-gray-500">
-                    Showing {startItem} to {endItem} of{" "}
-                    <span className="font-medium text-gray-700">
-                        {data.total.toLocaleString()}
-                    </span>{" "}
+                    Showing {startItem} to {endItem}{" "}
+                    {data.total !== null && (
+                        <>
+                            of{" "}
+                            <span className="font-medium text-gray-700">
+                                {data.total.toLocaleString()}
+                            </span>{" "}
+                        </>
+                    )}
                     students
                 </p>
                 <div className="flex items-center gap-1">
@@ -1,7 +1,10 @@
+import { API_BASE_URL } from "@/lib/api/client";
 import { BulkUploadResponse } from "@/lib/types/attendance-upload";
 
-const BASE_URL =
-    process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_BASE_URL || "/api";
+function getAccessToken(): string | null {
+    if (typeof window === "undefined") return null;
+    return localStorage.getItem("edupulse_auth_token");
+}
 
 /**
  * Upload attendance CSV file for bulk processing.
@@ -9,11 +12,16 @@ const BASE_URL =
 export async function uploadAttendanceCSV(
     file: File
 ): Promise<BulkUploadResponse> {
+    const token = getAccessToken();
     const form = new FormData();
     form.append("file", file);
     try {
-        const res = await fetch(`${BASE_URL}/attendance/bulk-upload`, {
+        const res = await fetch(`${API_BASE_URL}/attendance/bulk-upload`, {
             method: "POST",
+            credentials: "include",
+            headers: {
+                ...(token ? { Authorization: `Bearer ${token}` } : {}),
+            },
             body: form,
         });
         if (!res.ok) throw new Error("Upload failed");
@@ -96,6 +96,7 @@ export async function exportStudentReport(
     const params = new URLSearchParams();
     if (filters.course) params.set("course", filters.course);
     if (filters.semester) params.set("semester", String(filters.semester));
+    if (filters.search) params.set("search", filters.search);
     if (filters.format) params.set("format", filters.format);
 
     try {
@@ -1,8 +1,10 @@
 export interface PaginatedResponse<T> {
     data: T[];
-    total: number;
+    // null when requested with total=none.
+    total: number | null;
     page: number;
     limit: number;
+    nextCursor?: string | null;
 }
 
 export interface ApiResponse<T> {
@@ -10,4 +10,6 @@ export interface BulkUploadResponse {
     processed: number;
     duplicates: number;
     errors: string[];
+    term?: string;
+    lectures?: number;
 }
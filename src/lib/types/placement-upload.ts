@@ -32,5 +32,6 @@ export interface PlacementUploadError {
 export interface PlacementUploadResponse {
     processed: number;
     skipped: number;
+    failed: number;
     errors: PlacementUploadError[];
 }
@@ -30,5 +30,6 @@ export interface StudentQueryParams {
 export interface ReportFilters {
   course?: string;
   semester?: number;
-  format?: "csv" | "pdf";
+  search?: string;
+  format?: "csv" | "xlsx";
 }